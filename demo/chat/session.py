@@ -4,8 +4,10 @@ Manages conversation sessions for a single group, providing memory retrieval and
 """
 
 import json
+import os
 import httpx
-from typing import List, Dict, Any, Optional, Tuple
+from collections import deque
+from typing import Deque, List, Dict, Any, Optional, Tuple
 from datetime import timedelta
 from pathlib import Path
 
@@ -53,7 +55,10 @@ class ChatSession:
         self.texts = texts
 
         # Session State
-        self.conversation_history: List[Tuple[str, str]] = []
+        # Bounded window: appending beyond the limit drops the oldest turn
+        self.conversation_history: Deque[Tuple[str, str]] = deque(
+            maxlen=config.conversation_history_size
+        )
         self.memcell_count: int = 0
 
         # Services
@@ -164,23 +169,35 @@ class ChatSession:
                 if self.group_id == "AI产品群"  # skip-i18n-check
                 else self.group_id
             )
-            history_files = sorted(
-                self.config.chat_history_dir.glob(f"{display_name}_*.json"),
-                reverse=True,
-            )
+            history_dir = self.config.chat_history_dir
+            if not history_dir.is_dir():
+                return 0
 
-            if not history_files:
+            # Single directory pass with plain prefix/suffix checks (no glob matching)
+            prefix = f"{display_name}_"
+            with os.scandir(history_dir) as entries:
+                history_names = [
+                    entry.name
+                    for entry in entries
+                    if entry.name.startswith(prefix)
+                    and entry.name.endswith(".json")
+                    and entry.is_file()
+                ]
+
+            if not history_names:
                 return 0
 
-            latest_file = history_files[0]
+            # Timestamped names sort chronologically, so the max is the latest
+            latest_file = history_dir / max(history_names)
             with latest_file.open("r", encoding="utf-8") as fp:
                 data = json.load(fp)
 
             history = data.get("conversation_history", [])
-            self.conversation_history = [
+            self.conversation_history.clear()
+            self.conversation_history.extend(
                 (item["user_input"], item["assistant_response"])
                 for item in history[-self.config.conversation_history_size :]
-            ]
+            )
 
             return len(self.conversation_history)
 
@@ -434,9 +451,7 @@ class ChatSession:
         if memory_sections:
             messages.append({"role": "system", "content": "\n\n".join(memory_sections)})
         # Conversation History
-        for user_q, assistant_a in self.conversation_history[
-            -self.config.conversation_history_size :
-        ]:
+        for user_q, assistant_a in self.conversation_history:
             messages.append({"role": "user", "content": user_q})
             messages.append({"role": "assistant", "content": assistant_a})
 
@@ -516,11 +531,6 @@ class ChatSession:
         # Update Conversation History
         self.conversation_history.append((user_input, assistant_response))
 
-        if len(self.conversation_history) > self.config.conversation_history_size:
-            self.conversation_history = self.conversation_history[
-                -self.config.conversation_history_size :
-            ]
-
         return assistant_response
 
     def clear_history(self) -> None:
@@ -528,7 +538,7 @@ class ChatSession:
         from .ui import ChatUI
 
         count = len(self.conversation_history)
-        self.conversation_history = []
+        self.conversation_history.clear()
         ChatUI.print_info(self.texts.get("cmd_clear_done", count=count), self.texts)
 
     async def reload_data(self) -> None:
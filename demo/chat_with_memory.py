@@ -14,8 +14,6 @@ from pathlib import Path
 from dotenv import load_dotenv
 from demo.chat import ChatOrchestrator
 
-load_dotenv()
-
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
 
@@ -26,4 +24,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Load .env only when run as a script; importing this module has no side effects
+    load_dotenv()
     asyncio.run(main())
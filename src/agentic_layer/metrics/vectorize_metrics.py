@@ -42,7 +42,7 @@ Vectorize fallback counter
 Labels:
 - primary_provider: Primary provider that failed (vllm, deepinfra)
 - fallback_provider: Fallback provider used (vllm, deepinfra)
-- reason: error, timeout, max_failures_exceeded
+- reason: error, timeout, max_failures_exceeded, circuit_open
 """
 
 
@@ -189,7 +189,7 @@ def record_vectorize_fallback(
     Args:
         primary_provider: Primary provider that failed
         fallback_provider: Fallback provider used
-        reason: Fallback reason (error, timeout, max_failures_exceeded)
+        reason: Fallback reason (error, timeout, max_failures_exceeded, circuit_open)
     
     Example:
         record_vectorize_fallback(
@@ -11,11 +11,17 @@ Usage:
     embedding = await service.get_embedding("Hello world")  # Auto-fallback
 """
 
+import asyncio
+import hashlib
 import logging
 import os
+import random
+import re
+import threading
 import time
-from typing import Optional, List, Tuple
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from typing import Dict, Optional, List, Tuple
+from dataclasses import dataclass
 import numpy as np
 
 from core.di.decorators import service
@@ -34,6 +40,23 @@ from agentic_layer.metrics.vectorize_metrics import (
 
 logger = logging.getLogger(__name__)
 
+# Errors that count as a primary service failure and trigger retry/fallback.
+# Anything else (e.g. a programming error) propagates instead of silently
+# being routed to the fallback provider.
+_PRIMARY_FAILURE_EXCEPTIONS = (
+    VectorizeError,
+    ConnectionError,
+    asyncio.TimeoutError,
+    TimeoutError,
+    OSError,
+)
+
+# Base delay for jittered backoff between primary retries (seconds)
+_RETRY_BASE_DELAY_S = 0.05
+
+# Transient upstream failures worth retrying (connection drops, 5xx responses)
+_TRANSIENT_ERROR_RE = re.compile(r"connection|error code: 5\d\d|\b50[234]\b")
+
 
 @dataclass
 class HybridVectorizeConfig:
@@ -62,12 +85,25 @@ class HybridVectorizeConfig:
     encoding_format: str = "float"
     dimensions: int = 1024
 
+    # Per-HTTP-attempt timeout for the primary service (seconds, 0 uses timeout)
+    primary_timeout_s: float = 2.0
+    # Attempts on transient primary errors before falling back (the only
+    # retry layer for the primary; max_retries applies to the fallback)
+    primary_retries: int = 2
+
+    # Parallel fan-out for get_embeddings_batch
+    max_concurrent_batches: int = 4
+
     # Fallback behavior
     enable_fallback: bool = True
     max_primary_failures: int = 3
+    circuit_reset_seconds: float = 30.0
 
-    # Runtime state (failure tracking)
-    _primary_failure_count: int = field(default=0, init=False, repr=False)
+    # Embedding cache (0 disables)
+    embedding_cache_size: int = 4096
+    # Cache storage precision: fp32 (shared zero-copy) or fp16 (half the
+    # memory, upcast to a fresh float32 array on each hit)
+    embedding_cache_dtype: str = "fp32"
 
     def __post_init__(self):
         """Load hybrid service configuration from environment"""
@@ -95,6 +131,15 @@ class HybridVectorizeConfig:
         )
         self.encoding_format = os.getenv("VECTORIZE_ENCODING_FORMAT", self.encoding_format)
         self.dimensions = int(os.getenv("VECTORIZE_DIMENSIONS", str(self.dimensions)))
+        self.primary_timeout_s = float(
+            os.getenv("CUSTOM_EMBED_TIMEOUT_S", str(self.primary_timeout_s))
+        )
+        self.primary_retries = int(
+            os.getenv("VECTORIZE_PRIMARY_RETRIES", str(self.primary_retries))
+        )
+        self.max_concurrent_batches = int(
+            os.getenv("EMBED_MAX_CONCURRENT_BATCHES", str(self.max_concurrent_batches))
+        )
 
         # Fallback behavior
         # Enable fallback only if:
@@ -112,6 +157,13 @@ class HybridVectorizeConfig:
         self.max_primary_failures = int(
             os.getenv("VECTORIZE_MAX_PRIMARY_FAILURES", str(self.max_primary_failures))
         )
+        self.circuit_reset_seconds = float(
+            os.getenv("CB_RESET_SECONDS", str(self.circuit_reset_seconds))
+        )
+        self.embedding_cache_size = int(
+            os.getenv("EMBEDDING_CACHE_SIZE", str(self.embedding_cache_size))
+        )
+        self.embedding_cache_dtype = os.getenv("CACHE_DTYPE", self.embedding_cache_dtype)
         
 
 
@@ -120,7 +172,7 @@ def _create_service_from_config(
     api_key: str,
     base_url: str,
     model: str,
-    timeout: int,
+    timeout: float,
     max_retries: int,
     batch_size: int,
     max_concurrent: int,
@@ -175,6 +227,72 @@ def _create_service_from_config(
         raise VectorizeError(f"Unsupported provider: {provider}")
 
 
+class _CircuitBreaker:
+    """
+    Closed/Open/Half-Open circuit breaker for the primary provider
+
+    - CLOSED: calls go to the primary; consecutive failures are counted
+    - OPEN: the primary is skipped until reset_timeout_s has elapsed
+    - HALF_OPEN: up to half_open_max_probes calls probe the primary;
+      success closes the circuit, failure re-opens it
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout_s: float,
+        half_open_max_probes: int = 1,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout_s = reset_timeout_s
+        self.half_open_max_probes = half_open_max_probes
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self._probes_in_flight = 0
+
+    def allow_request(self) -> bool:
+        """Whether the primary should be tried for the next call"""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout_s:
+                return False
+            self.state = self.HALF_OPEN
+            self._probes_in_flight = 0
+        if self.state == self.HALF_OPEN:
+            if self._probes_in_flight >= self.half_open_max_probes:
+                return False
+            self._probes_in_flight += 1
+        return True
+
+    def release_probe(self):
+        """Free a half-open probe slot whose call ended without a verdict"""
+        if self.state == self.HALF_OPEN and self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+
+    def record_success(self):
+        """Close the circuit after a successful primary call"""
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self._probes_in_flight = 0
+
+    def record_failure(self):
+        """Count a primary failure, opening the circuit when warranted"""
+        self.failure_count += 1
+        if self.state == self.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(
+                    f"⚠️ Primary vectorize circuit opened after {self.failure_count} failures, "
+                    f"retrying in {self.reset_timeout_s}s"
+                )
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self._probes_in_flight = 0
+
+
 class HybridVectorizeService(VectorizeServiceInterface):
     """
     Hybrid Vectorization Service with Automatic Fallback
@@ -191,6 +309,9 @@ class HybridVectorizeService(VectorizeServiceInterface):
     - High availability: Automatic failover ensures reliability
     - Zero downtime: Continues working during vllm service maintenance
     
+    Returned embeddings are read-only float32 arrays shared with the
+    embedding cache; callers that need to mutate one must .copy() it.
+
     Usage:
         service = HybridVectorizeService()
         embedding = await service.get_embedding("Hello")  # Auto-fallback built-in
@@ -202,14 +323,18 @@ class HybridVectorizeService(VectorizeServiceInterface):
 
         self.config = config
         
-        # Create primary service based on provider type
+        # Create primary service based on provider type. primary_timeout_s is
+        # applied as the client timeout, so it bounds each HTTP attempt and
+        # not the time spent queued on the sub-service's request semaphore.
+        # Retries are owned by _call_primary (primary_retries), so the
+        # sub-service makes a single attempt per call
         self.primary_service = _create_service_from_config(
             provider=config.primary_provider,
             api_key=config.primary_api_key,
             base_url=config.primary_base_url,
             model=config.model,  # Use shared model
-            timeout=config.timeout,
-            max_retries=config.max_retries,
+            timeout=config.primary_timeout_s if config.primary_timeout_s > 0 else config.timeout,
+            max_retries=1,
             batch_size=config.batch_size,
             max_concurrent=config.max_concurrent_requests,
             encoding_format=config.encoding_format,
@@ -232,12 +357,23 @@ class HybridVectorizeService(VectorizeServiceInterface):
                 dimensions=config.dimensions,
             )
 
+        # Circuit breakers guarding the primary service, one per operation so
+        # a failure mode that only hits e.g. large batches stays isolated
+        self._breakers: Dict[str, _CircuitBreaker] = {}
+
+        # Content-addressed LRU of embeddings, keyed by _cache_key()
+        self._cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._cache_lock = asyncio.Lock()
+        self._cache_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._cache_fp16 = config.embedding_cache_dtype.lower() == "fp16"
+
         logger.info(
             f"Initialized HybridVectorizeService | "
             f"primary={config.primary_provider} | "
             f"fallback={config.fallback_provider} | "
             f"fallback_enabled={config.enable_fallback} | "
-            f"max_failures={config.max_primary_failures}"
+            f"max_failures={config.max_primary_failures} | "
+            f"cache_size={config.embedding_cache_size}"
         )
 
     def get_service(self) -> VectorizeServiceInterface:
@@ -251,58 +387,185 @@ class HybridVectorizeService(VectorizeServiceInterface):
         """
         return self.primary_service
     
+    # Embedding cache helpers
+
+    @staticmethod
+    def _cache_key(text: str, instruction: Optional[str], is_query: bool) -> bytes:
+        """Content-addressed cache key for one embedding request"""
+        raw = f"{text}\x00{instruction or ''}\x00{is_query}".encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=16).digest()
+
+    async def _cache_get_many(self, keys: List[bytes]) -> List[Optional[np.ndarray]]:
+        """Look up cached embeddings, refreshing recency of hits"""
+        if self.config.embedding_cache_size <= 0:
+            return [None] * len(keys)
+        found: List[Optional[np.ndarray]] = []
+        async with self._cache_lock:
+            for key in keys:
+                emb = self._cache.get(key)
+                if emb is None:
+                    self._cache_stats["misses"] += 1
+                else:
+                    self._cache.move_to_end(key)
+                    self._cache_stats["hits"] += 1
+                found.append(emb)
+        if self._cache_fp16:
+            # Callers always get float32 back; only storage is compressed
+            found = [None if emb is None else self._freeze(emb) for emb in found]
+        return found
+
+    @staticmethod
+    def _freeze(embedding: np.ndarray) -> np.ndarray:
+        """Canonical read-only float32 array, safe to share by reference"""
+        embedding = np.ascontiguousarray(embedding, dtype=np.float32)
+        embedding.flags.writeable = False
+        return embedding
+
+    async def _cache_put_many(self, items: List[Tuple[bytes, np.ndarray]]) -> None:
+        """Insert frozen embeddings into the cache, evicting the oldest entries"""
+        max_size = self.config.embedding_cache_size
+        if max_size <= 0:
+            return
+        async with self._cache_lock:
+            for key, emb in items:
+                if self._cache_fp16:
+                    emb = emb.astype(np.float16)
+                    emb.flags.writeable = False
+                self._cache[key] = emb
+                self._cache.move_to_end(key)
+            while len(self._cache) > max_size:
+                self._cache.popitem(last=False)
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get embedding cache hit/miss counters and current size"""
+        return {**self._cache_stats, "size": len(self._cache)}
+
     # Implement VectorizeServiceInterface methods with automatic fallback
-    
+
     async def get_embedding(
         self, text: str, instruction: Optional[str] = None, is_query: bool = False
     ) -> np.ndarray:
         """Get embedding for a single text with automatic fallback"""
-        return await self.execute_with_fallback(
+        key = self._cache_key(text, instruction, is_query)
+        cached = (await self._cache_get_many([key]))[0]
+        if cached is not None:
+            return cached
+
+        embedding = await self.execute_with_fallback(
             "get_embedding",
             lambda: self.primary_service.get_embedding(text, instruction, is_query),
             lambda: self.fallback_service.get_embedding(text, instruction, is_query) if self.fallback_service else None,
             batch_size=1,
         )
-    
+        embedding = self._freeze(embedding)
+        await self._cache_put_many([(key, embedding)])
+        return embedding
+
     async def get_embedding_with_usage(
         self, text: str, instruction: Optional[str] = None, is_query: bool = False
     ) -> Tuple[np.ndarray, Optional[UsageInfo]]:
-        """Get embedding with usage information with automatic fallback"""
-        return await self.execute_with_fallback(
+        """Get embedding with usage information with automatic fallback
+
+        Cache hits consume no tokens and are returned with usage None.
+        """
+        key = self._cache_key(text, instruction, is_query)
+        cached = (await self._cache_get_many([key]))[0]
+        if cached is not None:
+            return cached, None
+
+        embedding, usage = await self.execute_with_fallback(
             "get_embedding_with_usage",
             lambda: self.primary_service.get_embedding_with_usage(text, instruction, is_query),
             lambda: self.fallback_service.get_embedding_with_usage(text, instruction, is_query) if self.fallback_service else None,
             batch_size=1,
         )
-    
+        embedding = self._freeze(embedding)
+        await self._cache_put_many([(key, embedding)])
+        return embedding, usage
+
     async def get_embeddings(
         self,
         texts: List[str],
         instruction: Optional[str] = None,
         is_query: bool = False,
     ) -> List[np.ndarray]:
-        """Get embeddings for multiple texts with automatic fallback"""
-        return await self.execute_with_fallback(
+        """Get embeddings for multiple texts with automatic fallback
+
+        Only texts missing from the cache are sent to the backend, each
+        distinct text once and ordered by length so server-side batches
+        carry minimal padding; results are returned in input order.
+        """
+        if not texts:
+            return []
+
+        keys = [self._cache_key(text, instruction, is_query) for text in texts]
+        results = await self._cache_get_many(keys)
+
+        # Distinct uncached texts -> positions in the input that need them
+        pending: Dict[str, List[int]] = {}
+        for i, emb in enumerate(results):
+            if emb is None:
+                pending.setdefault(texts[i], []).append(i)
+        if not pending:
+            return results
+
+        uniq_texts = sorted(pending, key=len)
+        embeddings = await self.execute_with_fallback(
             "get_embeddings",
-            lambda: self.primary_service.get_embeddings(texts, instruction, is_query),
-            lambda: self.fallback_service.get_embeddings(texts, instruction, is_query) if self.fallback_service else None,
-            batch_size=len(texts),
+            lambda: self.primary_service.get_embeddings(uniq_texts, instruction, is_query),
+            lambda: self.fallback_service.get_embeddings(uniq_texts, instruction, is_query) if self.fallback_service else None,
+            batch_size=len(uniq_texts),
         )
-    
+
+        new_entries = []
+        for text, emb in zip(uniq_texts, embeddings):
+            emb = self._freeze(emb)
+            positions = pending[text]
+            for i in positions:
+                results[i] = emb
+            new_entries.append((keys[positions[0]], emb))
+        await self._cache_put_many(new_entries)
+        return results
+
     async def get_embeddings_batch(
         self,
         text_batches: List[List[str]],
         instruction: Optional[str] = None,
         is_query: bool = False,
     ) -> List[List[np.ndarray]]:
-        """Get embeddings for multiple batches with automatic fallback"""
-        total_texts = sum(len(batch) for batch in text_batches)
-        return await self.execute_with_fallback(
-            "get_embeddings_batch",
-            lambda: self.primary_service.get_embeddings_batch(text_batches, instruction, is_query),
-            lambda: self.fallback_service.get_embeddings_batch(text_batches, instruction, is_query) if self.fallback_service else None,
-            batch_size=total_texts,
+        """Get embeddings for multiple batches with automatic fallback
+
+        Batches are fanned out concurrently (bounded by
+        max_concurrent_batches), each through get_embeddings so every batch
+        gets its own cache lookup and fallback decision. A batch that still
+        fails is logged and returned as an empty list, so one bad batch does
+        not fail the whole call.
+        """
+        if not text_batches:
+            return []
+
+        semaphore = asyncio.Semaphore(max(1, self.config.max_concurrent_batches))
+        jitter = len(text_batches) > 1
+
+        async def _embed_batch(batch: List[str]) -> List[np.ndarray]:
+            if jitter:
+                # Spread launches to avoid bursting the provider's rate limit
+                await asyncio.sleep(random.uniform(0, 0.05))
+            async with semaphore:
+                return await self.get_embeddings(batch, instruction, is_query)
+
+        results = await asyncio.gather(
+            *(_embed_batch(b) for b in text_batches), return_exceptions=True
         )
+
+        embeddings_batches = []
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing batch {i}: {result}")
+                embeddings_batches.append([])
+            else:
+                embeddings_batches.append(result)
+        return embeddings_batches
     
     def get_model_name(self) -> str:
         """Get the current model name (from primary service)"""
@@ -317,26 +580,50 @@ class HybridVectorizeService(VectorizeServiceInterface):
     ):
         """
         Execute operation with automatic fallback logic
-        
+
+        Each primary HTTP attempt is bounded by primary_timeout_s (the
+        primary client's timeout) so a hung primary fails fast, and
+        transient errors are retried with jittered backoff before counting
+        as a failure; the fallback is not time-boxed.
+        The primary service is guarded by a per-operation circuit breaker:
+        once an operation has failed max_primary_failures times in a row
+        its circuit opens and,
+        while a fallback is available, calls go straight to the fallback
+        until the reset timeout elapses and a probe call succeeds.
+
         Args:
             operation_name: Name of the operation for logging
             primary_func: Function to call on primary service
             fallback_func: Function to call on fallback service (or None if no fallback)
             batch_size: Number of texts being processed (for metrics)
-            
+
         Returns:
             Result from primary or fallback service
-            
+
         Raises:
             VectorizeError: If both services fail
         """
+        has_fallback = (
+            self.config.enable_fallback
+            and fallback_func is not None
+            and self.fallback_service is not None
+        )
+
+        breaker = self._get_breaker(operation_name)
+
+        # Circuit open: skip the doomed primary round-trip entirely
+        if has_fallback and not breaker.allow_request():
+            return await self._execute_fallback(
+                operation_name, fallback_func, batch_size, 'circuit_open', None
+            )
+
         start_time = time.perf_counter()
-        
+
         # Try primary service first
         try:
-            result = await primary_func()
+            result = await self._call_primary(primary_func)
             duration = time.perf_counter() - start_time
-            
+
             # Record success metrics
             record_vectorize_request(
                 provider=self.config.primary_provider,
@@ -345,20 +632,19 @@ class HybridVectorizeService(VectorizeServiceInterface):
                 duration_seconds=duration,
                 batch_size=batch_size,
             )
-            
-            # Reset failure count on success
-            self.config._primary_failure_count = 0
+
+            # Close the circuit on success
+            breaker.record_success()
             return result
 
-        except Exception as primary_error:
+        except _PRIMARY_FAILURE_EXCEPTIONS as primary_error:
             primary_duration = time.perf_counter() - start_time
-            
-            # Increment failure count
-            self.config._primary_failure_count += 1
-            
+
+            breaker.record_failure()
+
             # Determine error type
             error_type = self._classify_error(primary_error)
-            
+
             # Record error metrics
             record_vectorize_error(
                 provider=self.config.primary_provider,
@@ -368,11 +654,11 @@ class HybridVectorizeService(VectorizeServiceInterface):
 
             logger.warning(
                 f"Primary service ({self.config.primary_provider}) {operation_name} failed "
-                f"(count: {self.config._primary_failure_count}): {primary_error}"
+                f"(count: {breaker.failure_count}): {primary_error}"
             )
 
             # Check if fallback is enabled
-            if not self.config.enable_fallback or fallback_func is None:
+            if not has_fallback:
                 # Record failed request (no fallback)
                 record_vectorize_request(
                     provider=self.config.primary_provider,
@@ -388,62 +674,101 @@ class HybridVectorizeService(VectorizeServiceInterface):
 
             # Determine fallback reason
             fallback_reason = error_type
-            if self.config._primary_failure_count >= self.config.max_primary_failures:
+            if breaker.state == _CircuitBreaker.OPEN:
                 fallback_reason = 'max_failures_exceeded'
-                logger.warning(
-                    f"⚠️ Primary service exceeded max failures ({self.config.max_primary_failures}), "
-                    f"using {self.config.fallback_provider} fallback"
-                )
 
-            # Record fallback event
-            record_vectorize_fallback(
-                primary_provider=self.config.primary_provider,
-                fallback_provider=self.config.fallback_provider,
-                reason=fallback_reason,
+            return await self._execute_fallback(
+                operation_name, fallback_func, batch_size, fallback_reason, primary_error
             )
 
-            # Try fallback service
-            fallback_start = time.perf_counter()
+        except BaseException:
+            # Not a service failure (programming error or cancellation)
+            breaker.release_probe()
+            raise
+
+    async def _call_primary(self, primary_func):
+        """Call the primary, retrying transient errors with jittered backoff"""
+        attempts = max(1, self.config.primary_retries)
+        for attempt in range(attempts):
             try:
-                logger.info(f"🔄 Falling back to {self.config.fallback_provider} for {operation_name}")
-                result = await fallback_func()
-                fallback_duration = time.perf_counter() - fallback_start
-                
-                # Record fallback success metrics
-                record_vectorize_request(
-                    provider=self.config.fallback_provider,
-                    operation=operation_name,
-                    status='fallback',
-                    duration_seconds=fallback_duration,
-                    batch_size=batch_size,
-                )
-                
-                return result
-
-            except Exception as fallback_error:
-                fallback_duration = time.perf_counter() - fallback_start
-                
-                # Record fallback error
-                record_vectorize_error(
-                    provider=self.config.fallback_provider,
-                    operation=operation_name,
-                    error_type=self._classify_error(fallback_error),
+                return await primary_func()
+            except _PRIMARY_FAILURE_EXCEPTIONS as e:
+                if attempt == attempts - 1 or not self._is_transient_error(e):
+                    raise
+                delay = _RETRY_BASE_DELAY_S * 2**attempt + random.uniform(0, _RETRY_BASE_DELAY_S)
+                logger.debug(
+                    f"Primary service transient error (attempt {attempt + 1}/{attempts}), "
+                    f"retrying in {delay:.3f}s: {e}"
                 )
-                record_vectorize_request(
-                    provider=self.config.fallback_provider,
-                    operation=operation_name,
-                    status='error',
-                    duration_seconds=fallback_duration,
-                    batch_size=batch_size,
-                )
-                
-                logger.error(f"❌ Fallback also failed: {fallback_error}")
-                raise VectorizeError(
-                    f"Both primary and fallback services failed. "
-                    f"Primary ({self.config.primary_provider}): {primary_error}, "
-                    f"Fallback ({self.config.fallback_provider}): {fallback_error}"
-                )
-    
+                await asyncio.sleep(delay)
+
+    async def _execute_fallback(
+        self,
+        operation_name: str,
+        fallback_func,
+        batch_size: int,
+        reason: str,
+        primary_error: Optional[Exception],
+    ):
+        """Run the fallback service call, recording metrics"""
+        # Record fallback event
+        record_vectorize_fallback(
+            primary_provider=self.config.primary_provider,
+            fallback_provider=self.config.fallback_provider,
+            reason=reason,
+        )
+
+        # Try fallback service
+        fallback_start = time.perf_counter()
+        try:
+            logger.info(f"🔄 Falling back to {self.config.fallback_provider} for {operation_name}")
+            result = await fallback_func()
+            fallback_duration = time.perf_counter() - fallback_start
+
+            # Record fallback success metrics
+            record_vectorize_request(
+                provider=self.config.fallback_provider,
+                operation=operation_name,
+                status='fallback',
+                duration_seconds=fallback_duration,
+                batch_size=batch_size,
+            )
+
+            return result
+
+        except Exception as fallback_error:
+            fallback_duration = time.perf_counter() - fallback_start
+
+            # Record fallback error
+            record_vectorize_error(
+                provider=self.config.fallback_provider,
+                operation=operation_name,
+                error_type=self._classify_error(fallback_error),
+            )
+            record_vectorize_request(
+                provider=self.config.fallback_provider,
+                operation=operation_name,
+                status='error',
+                duration_seconds=fallback_duration,
+                batch_size=batch_size,
+            )
+
+            logger.error(f"❌ Fallback also failed: {fallback_error}")
+            primary_detail = primary_error if primary_error is not None else "circuit open"
+            raise VectorizeError(
+                f"Both primary and fallback services failed. "
+                f"Primary ({self.config.primary_provider}): {primary_detail}, "
+                f"Fallback ({self.config.fallback_provider}): {fallback_error}"
+            )
+
+    def _is_transient_error(self, error: Exception) -> bool:
+        """Whether a primary error is transient and safe to retry"""
+        if isinstance(error, (ConnectionError, asyncio.TimeoutError)):
+            return True
+        if self._classify_error(error) == 'timeout':
+            return True
+        return bool(_TRANSIENT_ERROR_RE.search(str(error).lower()))
+
     def _classify_error(self, error: Exception) -> str:
         """Classify error type for metrics"""
         error_str = str(error).lower()
@@ -458,24 +783,67 @@ class HybridVectorizeService(VectorizeServiceInterface):
         else:
             return 'unknown'
 
-    def get_failure_count(self) -> int:
-        """Get current primary service failure count"""
-        return self.config._primary_failure_count
+    def _get_breaker(self, operation_name: str) -> _CircuitBreaker:
+        """Get (or lazily create) the circuit breaker for an operation"""
+        breaker = self._breakers.get(operation_name)
+        if breaker is None:
+            breaker = _CircuitBreaker(
+                failure_threshold=self.config.max_primary_failures,
+                reset_timeout_s=self.config.circuit_reset_seconds,
+            )
+            self._breakers[operation_name] = breaker
+        return breaker
+
+    def get_failure_count(self, operation_name: Optional[str] = None) -> int:
+        """
+        Get current primary service failure count
+
+        Args:
+            operation_name: Operation to report; defaults to the highest
+                count across all operations
+        """
+        if operation_name is not None:
+            breaker = self._breakers.get(operation_name)
+            return breaker.failure_count if breaker else 0
+        return max((b.failure_count for b in self._breakers.values()), default=0)
+
+    def get_circuit_state(self, operation_name: Optional[str] = None) -> str:
+        """
+        Get current primary service circuit state
+
+        Args:
+            operation_name: Operation to report; defaults to the most severe
+                state across all operations
+        """
+        if operation_name is not None:
+            breaker = self._breakers.get(operation_name)
+            return breaker.state if breaker else _CircuitBreaker.CLOSED
+        states = {b.state for b in self._breakers.values()}
+        for state in (_CircuitBreaker.OPEN, _CircuitBreaker.HALF_OPEN):
+            if state in states:
+                return state
+        return _CircuitBreaker.CLOSED
 
     def reset_failure_count(self):
-        """Reset failure count (useful for health check recovery)"""
-        self.config._primary_failure_count = 0
+        """Reset failure counts and close all circuits (useful for health check recovery)"""
+        for breaker in self._breakers.values():
+            breaker.record_success()
         logger.info("Reset primary service failure count to 0")
 
     async def close(self):
-        """Close all services"""
+        """Close all services and drop the global instance if it is this one"""
+        global _service_instance
+        with _service_lock:
+            if _service_instance is self:
+                _service_instance = None
         await self.primary_service.close()
         if self.fallback_service:
             await self.fallback_service.close()
 
 
-# Global service instance (lazy initialization)
+# Global service instance (lazy initialization, guarded by _service_lock)
 _service_instance: Optional[HybridVectorizeService] = None
+_service_lock = threading.Lock()
 
 
 def get_hybrid_service() -> HybridVectorizeService:
@@ -487,7 +855,9 @@ def get_hybrid_service() -> HybridVectorizeService:
     """
     global _service_instance
     if _service_instance is None:
-        _service_instance = HybridVectorizeService()
+        with _service_lock:
+            if _service_instance is None:
+                _service_instance = HybridVectorizeService()
     return _service_instance
 
 
@@ -7,7 +7,9 @@ This module contains various functions to convert external request formats to in
 from __future__ import annotations
 
 from datetime import datetime
+import functools
 import hashlib
+import os
 from typing import Any, Dict, List, Optional
 from zoneinfo import ZoneInfo
 
@@ -20,7 +22,36 @@ from core.oxm.constants import MAGIC_ALL
 
 logger = get_logger(__name__)
 
+_UTC = ZoneInfo("UTC")
 
+
+@functools.lru_cache(maxsize=2048)
+def _parse_iso_utc_strict(value: str) -> datetime:
+    """Parse an ISO-8601 string as UTC; failures raise and are not cached."""
+    return from_iso_format(value, _UTC, strict=True)
+
+
+def _parse_iso_utc(value: Any) -> datetime:
+    """
+    Parse create_time into a timezone-aware datetime, memoizing string input.
+
+    Messages in a bulk ingest often share the same create_time, so identical
+    strings are parsed once. Unparseable values keep the lenient
+    from_iso_format behaviour (current time) and are never cached.
+    """
+    if isinstance(value, str):
+        try:
+            return _parse_iso_utc_strict(value)
+        except ValueError:
+            pass
+    return from_iso_format(value, _UTC)
+
+# Hash used for auto-generated single-user group ids. Existing deployments
+# have group ids derived from MD5 persisted, so BLAKE2b is opt-in.
+_USE_BLAKE2B_GROUP_ID = os.getenv("GROUP_ID_HASH", "md5").strip().lower() == "blake2b"
+
+
+@functools.lru_cache(maxsize=4096)
 def generate_single_user_group_id(sender: str) -> str:
     """
     Generate a group_id for single-user mode based on sender (user_id) hash.
@@ -30,17 +61,31 @@ def generate_single_user_group_id(sender: str) -> str:
     representing single-user mode where each user's messages are extracted
     into separate memory spaces.
 
+    Results are memoized since the same sender arrives many times per session.
+
     Args:
         sender: The sender user ID (equivalent to user_id internally)
 
     Returns:
         str: Generated group_id in format: {hash(sender)[:16]}_group
     """
-    # Use MD5 hash for deterministic and compact result
-    hash_value = hashlib.md5(sender.encode('utf-8')).hexdigest()[:16]
+    if _USE_BLAKE2B_GROUP_ID:
+        # BLAKE2b with an 8-byte digest yields exactly 16 hex chars
+        hash_value = hashlib.blake2b(sender.encode('utf-8'), digest_size=8).hexdigest()
+    else:
+        # Use MD5 hash for deterministic and compact result
+        hash_value = hashlib.md5(sender.encode('utf-8')).hexdigest()[:16]
     return f"{hash_value}_group"
 
 
+# Value -> member lookups, so parsing skips the enum constructor's
+# lookup and exception machinery on the request hot path
+_MEMORY_TYPE_BY_VALUE: Dict[str, MemoryType] = {m.value: m for m in MemoryType}
+_RETRIEVE_METHOD_BY_VALUE: Dict[str, RetrieveMethod] = {
+    m.value: m for m in RetrieveMethod
+}
+
+
 class DataFields:
     """Data field constants"""
 
@@ -60,7 +105,12 @@ def _parse_memory_type(value: Any) -> MemoryType:
     """Parse input value into MemoryType with string normalization."""
     if isinstance(value, MemoryType):
         return value
-    return MemoryType(_strip_if_str(value))
+    normalized = _strip_if_str(value)
+    if isinstance(normalized, str):
+        member = _MEMORY_TYPE_BY_VALUE.get(normalized)
+        if member is not None:
+            return member
+    return MemoryType(normalized)
 
 
 def _parse_retrieve_method(value: Any) -> RetrieveMethod:
@@ -68,13 +118,14 @@ def _parse_retrieve_method(value: Any) -> RetrieveMethod:
     if isinstance(value, RetrieveMethod):
         return value
     normalized = _strip_if_str(value)
-    try:
-        return RetrieveMethod(normalized)
-    except ValueError as exc:
-        raise ValueError(
-            f"Invalid retrieve_method: {normalized}. "
-            f"Supported methods: {[m.value for m in RetrieveMethod]}"
-        ) from exc
+    if isinstance(normalized, str):
+        member = _RETRIEVE_METHOD_BY_VALUE.get(normalized)
+        if member is not None:
+            return member
+    raise ValueError(
+        f"Invalid retrieve_method: {normalized}. "
+        f"Supported methods: {list(_RETRIEVE_METHOD_BY_VALUE)}"
+    )
 
 
 def _parse_int(value: Any, default: int) -> int:
@@ -93,15 +144,18 @@ def _parse_float(value: Any) -> Optional[float]:
     return float(normalized)
 
 
+_TRUE_STRINGS = frozenset(("true", "1", "yes"))
+
+
 def _parse_bool(value: Any, default: bool) -> bool:
     """Parse optional bool values from query/body payloads."""
-    if value is None:
-        return default
+    # JSON bodies arrive already decoded, so bool is the common case
     if isinstance(value, bool):
         return value
+    if value is None:
+        return default
     if isinstance(value, str):
-        normalized = value.strip().lower()
-        return normalized in ("true", "1", "yes")
+        return value.strip().lower() in _TRUE_STRINGS
     return bool(value)
 
 
@@ -130,10 +184,11 @@ def _parse_memory_types(raw_memory_types: Any) -> List[MemoryType]:
         if not normalized:
             continue
 
-        try:
-            memory_types.append(MemoryType(normalized))
-        except ValueError:
+        member = _MEMORY_TYPE_BY_VALUE.get(normalized)
+        if member is None:
             logger.error(f"Invalid memory_type: {raw_item}, skipping")
+        else:
+            memory_types.append(member)
 
     if not memory_types:
         return [MemoryType.EPISODIC_MEMORY]
@@ -157,7 +212,8 @@ def convert_dict_to_fetch_mem_request(data: Dict[str, Any]) -> FetchMemRequest:
         memory_type = _parse_memory_type(
             data.get("memory_type", MemoryType.EPISODIC_MEMORY.value)
         )
-        logger.debug(f"version_range: {data.get('version_range', None)}")
+        version_range = data.get("version_range")
+        logger.debug("version_range: %s", version_range)
 
         limit = _parse_int(data.get("limit"), default=10)
         offset = _parse_int(data.get("offset"), default=0)
@@ -173,7 +229,7 @@ def convert_dict_to_fetch_mem_request(data: Dict[str, Any]) -> FetchMemRequest:
             memory_type=memory_type,
             limit=limit,
             offset=offset,
-            version_range=data.get("version_range", None),
+            version_range=version_range,
             start_time=data.get("start_time"),
             end_time=data.get("end_time"),
         )
@@ -201,7 +257,7 @@ def convert_dict_to_retrieve_mem_request(
         retrieve_method = _parse_retrieve_method(
             data.get("retrieve_method", RetrieveMethod.KEYWORD.value)
         )
-        logger.debug(f"[DEBUG] converted retrieve_method: {retrieve_method}")
+        logger.debug("converted retrieve_method: %s", retrieve_method)
 
         top_k = _parse_int(data.get("top_k"), default=10)
         include_metadata = _parse_bool(data.get("include_metadata"), default=True)
@@ -248,15 +304,12 @@ def normalize_refer_list(refer_list: List[Any]) -> List[str]:
     if not refer_list:
         return []
 
-    normalized: List[str] = []
-    for refer in refer_list:
-        if isinstance(refer, str):
-            normalized.append(refer)
-        elif isinstance(refer, dict):
-            ref_msg_id = refer.get("message_id")
-            if ref_msg_id:
-                normalized.append(str(ref_msg_id))
-    return normalized
+    return [
+        refer if isinstance(refer, str) else str(refer["message_id"])
+        for refer in refer_list
+        if isinstance(refer, str)
+        or (isinstance(refer, dict) and refer.get("message_id"))
+    ]
 
 
 def build_raw_data_from_simple_message(
@@ -320,19 +373,16 @@ def build_raw_data_from_simple_message(
         "data_id": message_id,
     }
 
-    # Build metadata
+    # Build metadata, merging extra metadata if provided
     metadata = {
         "original_id": message_id,
         "createTime": timestamp,
         "updateTime": timestamp,
         "createBy": sender,
         "orgId": None,
+        **(extra_metadata or {}),
     }
 
-    # Merge extra metadata if provided
-    if extra_metadata:
-        metadata.update(extra_metadata)
-
     return RawData(content=raw_content, data_id=message_id, metadata=metadata)
 
 
@@ -396,7 +446,7 @@ async def convert_simple_message_to_memorize_request(
     normalized_refer_list = normalize_refer_list(refer_list)
 
     # Parse timestamp
-    timestamp = from_iso_format(create_time_str, ZoneInfo("UTC"))
+    timestamp = _parse_iso_utc(create_time_str)
 
     # Build RawData using the canonical function
     raw_data = build_raw_data_from_simple_message(
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+import logging
 import random
 import time
 import json
@@ -55,7 +56,7 @@ from infra_layer.adapters.out.persistence.repository.conversation_data_raw_repos
     ConversationDataRepository,
 )
 from api_specs.memory_types import RawDataType
-from typing import List, Dict, Optional, Any
+from typing import Callable, List, Dict, Optional, Any
 from dataclasses import dataclass
 import uuid
 from datetime import datetime, timedelta
@@ -93,6 +94,34 @@ class MemoryDocPayload:
 
 from biz_layer.memorize_config import MemorizeConfig, DEFAULT_MEMORIZE_CONFIG
 
+# Profile -> dict converter resolved once per profile type
+_PROFILE_DUMPERS: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _profile_to_dict(profile: Any) -> Any:
+    """Convert an extracted profile to its storable dict form.
+
+    Prefers to_dict(), then plain dicts as-is, then the instance __dict__.
+    The choice is cached per type so the checks run once, not per profile.
+    """
+    profile_type = type(profile)
+    dumper = _PROFILE_DUMPERS.get(profile_type)
+    if dumper is None:
+        if hasattr(profile_type, 'to_dict'):
+            dumper = profile_type.to_dict
+        elif issubclass(profile_type, dict):
+            dumper = _identity
+        elif hasattr(profile, '__dict__'):
+            dumper = vars
+        else:
+            dumper = _identity
+        _PROFILE_DUMPERS[profile_type] = dumper
+    return dumper(profile)
+
 
 async def _trigger_clustering(
     group_id: str,
@@ -166,31 +195,26 @@ async def _trigger_clustering(
         logger.info(
             f"[Clustering] Start clustering execution: {memcell_dict['event_id']}"
         )
-        print(
-            f"[Clustering] Start clustering execution: event_id={memcell_dict['event_id']}"
-        )
 
         # Perform clustering (pure computation)
         cluster_id, cluster_state = await cluster_manager.cluster_memcell(
             memcell_dict, cluster_state
         )
 
-        # Save clustering state
-        await cluster_storage.save_cluster_state(group_id, cluster_state.to_dict())
-        logger.info(f"[Clustering] Clustering state saved")
-
-        print(f"[Clustering] Clustering completed: cluster_id={cluster_id}")
+        # Save clustering state in the background so the write overlaps with
+        # profile extraction, which only reads the in-memory state
+        save_state_task = asyncio.create_task(
+            cluster_storage.save_cluster_state(group_id, cluster_state.to_dict())
+        )
 
         if cluster_id:
             logger.info(
                 f"[Clustering] ✅ MemCell {memcell.event_id} -> Cluster {cluster_id} (group: {group_id})"
             )
-            print(f"[Clustering] ✅ MemCell {memcell.event_id} -> Cluster {cluster_id}")
         else:
             logger.warning(
                 f"[Clustering] ⚠️ MemCell {memcell.event_id} clustering returned None (group: {group_id})"
             )
-            print(f"[Clustering] ⚠️ Clustering returned None")
 
         # Profile extraction
         if cluster_id:
@@ -203,6 +227,9 @@ async def _trigger_clustering(
                 config=config,
             )
 
+        await save_state_task
+        logger.info(f"[Clustering] Clustering state saved")
+
     except Exception as e:
         # Clustering failed, print detailed error and re-raise
         import traceback
@@ -214,6 +241,39 @@ async def _trigger_clustering(
         raise  # Re-raise exception so caller knows it failed
 
 
+def _should_extract_profiles(cluster_memcell_count: int, config: MemorizeConfig) -> bool:
+    """Whether a cluster of this size is due for Profile extraction.
+
+    Extracts once the cluster reaches profile_min_memcells, then on every
+    profile_extract_interval-th memcell after that (every memcell by default).
+    """
+    if cluster_memcell_count < config.profile_min_memcells:
+        return False
+    interval = max(1, config.profile_extract_interval)
+    return (cluster_memcell_count - config.profile_min_memcells) % interval == 0
+
+
+async def _persist_profile(
+    profile_repo,  # UserProfileRawRepository
+    user_id: str,
+    profile_data: Dict[str, Any],
+    metadata: Dict[str, Any],
+    previous: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Save an extracted profile, without a version bump if its data is unchanged.
+
+    Unchanged data still refreshes the metadata (cluster link, counts), so the
+    profile stays associated with the cluster it was re-extracted from.
+    """
+    if previous is not None and previous == profile_data:
+        await profile_repo.update_profile_metadata(user_id, metadata)
+        logger.debug(f"[Profile] Unchanged, metadata refreshed: user={user_id}")
+        return
+
+    await profile_repo.save_profile(user_id, profile_data, metadata=metadata)
+    logger.info(f"[Profile] ✅ Saved: user={user_id}")
+
+
 async def _trigger_profile_extraction(
     group_id: str,
     cluster_id: str,
@@ -243,10 +303,11 @@ async def _trigger_profile_extraction(
 
         # Get the number of memcells in the current cluster
         cluster_memcell_count = cluster_state.cluster_counts.get(cluster_id) or 0
-        if cluster_memcell_count < config.profile_min_memcells:
+        if not _should_extract_profiles(cluster_memcell_count, config):
             logger.debug(
-                f"[Profile] Cluster {cluster_id} has only {cluster_memcell_count} memcells "
-                f"(requires {config.profile_min_memcells}), skipping extraction"
+                f"[Profile] Cluster {cluster_id} at {cluster_memcell_count} memcells "
+                f"(min {config.profile_min_memcells}, every {config.profile_extract_interval}), "
+                f"skipping extraction"
             )
             return
 
@@ -299,22 +360,32 @@ async def _trigger_profile_extraction(
         ]
         # ===== Common preprocessing: fetch all cluster memcells =====
         current_event_id = str(memcell.event_id) if memcell.event_id else cluster_id
-        cluster_event_ids = set()
-        if cluster_state and hasattr(cluster_state, 'eventid_to_cluster'):
-            for event_id, cid in cluster_state.eventid_to_cluster.items():
-                if cid == cluster_id and event_id != current_event_id:
-                    cluster_event_ids.add(event_id)
-
-        # Fetch cluster memcells + current memcell
-        all_memcells = []
-        if cluster_event_ids:
+        cluster_event_ids = []
+        if cluster_state is not None:
+            cluster_event_ids = [
+                event_id
+                for event_id in cluster_state.get_cluster_event_ids(cluster_id)
+                if event_id != current_event_id
+            ]
+
+        async def _fetch_cluster_memcells() -> List[Any]:
+            if not cluster_event_ids:
+                return []
             try:
                 cluster_memcells_dict = await memcell_repo.get_by_event_ids(
-                    list(cluster_event_ids)
+                    cluster_event_ids
                 )
-                all_memcells = list(cluster_memcells_dict.values())
+                return list(cluster_memcells_dict.values())
             except Exception as e:
                 logger.warning(f"[Profile] Failed to fetch cluster memcells: {e}")
+                return []
+
+        # Fetch cluster memcells and load old profiles (same for Work and Life)
+        # concurrently; the two reads are independent
+        all_memcells, old_profiles_dict = await asyncio.gather(
+            _fetch_cluster_memcells(),
+            profile_repo.get_all_profiles(group_id=group_id),
+        )
 
         # Append current memcell as the last one (new_memcell)
         all_memcells.append(memcell)
@@ -324,16 +395,16 @@ async def _trigger_profile_extraction(
 
         # ===== Extract and save profiles =====
 
-        # Load old profiles (same for Work and Life)
-        old_profiles_dict = await profile_repo.get_all_profiles(group_id=group_id)
         old_profiles = list(old_profiles_dict.values()) if old_profiles_dict else []
         logger.info(
             f"[Profile] Loaded {len(old_profiles)} existing profiles for group={group_id}"
         )
-        if old_profiles:
+        # Per-profile key dump walks every profile in the group; only pay for it when
+        # debug logging is actually enabled
+        if old_profiles and logger.isEnabledFor(logging.DEBUG):
             for uid, p in old_profiles_dict.items():
                 keys = list(p.keys()) if isinstance(p, dict) else dir(p)
-                logger.info(f"[Profile] Profile for {uid}: keys={keys[:8]}")
+                logger.debug(f"[Profile] Profile for {uid}: keys={keys[:8]}")
 
         # Extract profiles
         if profile_scenario == ScenarioType.ASSISTANT:
@@ -352,12 +423,12 @@ async def _trigger_profile_extraction(
                 group_id=group_id,
             )
 
-        # Save profiles
-        for profile in new_profiles:
+        # Save profiles (one independent upsert per user, so run them concurrently)
+        async def _save_profile(profile: Any) -> None:
             try:
                 if profile_scenario == ScenarioType.ASSISTANT:
                     user_id = profile.user_id
-                    profile_data = profile.to_dict()
+                    profile_data = _profile_to_dict(profile)
                     metadata = {
                         "group_id": group_id,
                         "scenario": ScenarioType.ASSISTANT.value,
@@ -371,17 +442,7 @@ async def _trigger_profile_extraction(
                         if isinstance(profile, dict)
                         else getattr(profile, 'user_id', None)
                     )
-                    # Convert to dict if it's a ProfileMemory object
-                    if hasattr(profile, 'to_dict'):
-                        profile_data = profile.to_dict()
-                    elif isinstance(profile, dict):
-                        profile_data = profile
-                    else:
-                        profile_data = (
-                            profile.__dict__
-                            if hasattr(profile, '__dict__')
-                            else profile
-                        )
+                    profile_data = _profile_to_dict(profile)
                     metadata = {
                         "group_id": group_id,
                         "scenario": "group_chat",
@@ -391,13 +452,18 @@ async def _trigger_profile_extraction(
                     }
 
                 if user_id:
-                    await profile_repo.save_profile(
-                        user_id, profile_data, metadata=metadata
+                    await _persist_profile(
+                        profile_repo,
+                        user_id,
+                        profile_data,
+                        metadata,
+                        previous=(old_profiles_dict or {}).get(user_id),
                     )
-                    logger.info(f"[Profile] ✅ Saved: user={user_id}")
             except Exception as e:
                 logger.warning(f"[Profile] Failed to save profile: {e}")
 
+        await asyncio.gather(*(_save_profile(p) for p in new_profiles))
+
         logger.info(f"[Profile] ✅ Completed: {len(new_profiles)} profiles")
 
     except Exception as e:
@@ -23,6 +23,10 @@ class MemorizeConfig:
     # ===== Profile extraction configuration =====
     # Minimum number of memcells required to trigger Profile extraction
     profile_min_memcells: int = 1
+    # Re-extract a cluster's profiles only on every N-th memcell once the minimum is
+    # reached (1 = every memcell). With N > 1 a cluster that stops growing between
+    # extractions leaves its newest memcells unextracted until it grows again
+    profile_extract_interval: int = 1
     # Minimum confidence required for Profile extraction
     profile_min_confidence: float = 0.6
     # Whether to enable version control
@@ -43,6 +47,7 @@ class MemorizeConfig:
             ),
             cluster_max_time_gap_days=int(os.getenv("CLUSTER_MAX_TIME_GAP_DAYS", "7")),
             profile_min_memcells=int(os.getenv("PROFILE_MIN_MEMCELLS", "1")),
+            profile_extract_interval=int(os.getenv("PROFILE_EXTRACT_INTERVAL", "1")),
             profile_min_confidence=float(os.getenv("PROFILE_MIN_CONFIDENCE", "0.6")),
             profile_enable_versioning=os.getenv(
                 "PROFILE_ENABLE_VERSIONING", "true"
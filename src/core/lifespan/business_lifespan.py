@@ -2,8 +2,11 @@
 Business lifecycle provider implementation
 """
 
+import asyncio
+import inspect
+
 from fastapi import FastAPI
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional
 
 from core.observation.logger import get_logger
 from core.di.utils import get_bean_by_type, get_beans_by_type, get_bean
@@ -45,6 +48,9 @@ class BusinessLifespanProvider(LifespanProvider):
             order (int): Execution order, business logic usually starts after database
         """
         super().__init__(name, order)
+        # DI lookups cached across repeated startups (tests, hot reload)
+        self._controller_cache: Optional[List[BaseController]] = None
+        self._capability_cache: Optional[List[ApplicationCapability]] = None
 
     async def startup(self, app: FastAPI) -> Dict[str, Any]:
         """
@@ -58,18 +64,26 @@ class BusinessLifespanProvider(LifespanProvider):
         """
         logger.info("Initializing business logic...")
 
-        # 0. Preload tokenizers to avoid blocking requests
+        # 0. Preload tokenizers to avoid blocking requests. run_in_executor
+        # submits to the worker thread right away, so the load overlaps with
+        # the synchronous registration steps below
         tokenizer_factory: TokenizerFactory = get_bean_by_type(TokenizerFactory)
-        tokenizer_factory.load_default_encodings()
+        tokenizer_task = asyncio.get_running_loop().run_in_executor(
+            None, tokenizer_factory.load_default_encodings
+        )
 
-        # 1. Create business graph structure
-        graphs = self._register_graphs(app)
+        try:
+            # 1. Create business graph structure
+            graphs = self._register_graphs(app)
 
-        # 2. Register controllers
-        controllers = self._register_controllers(app)
+            # 2. Register controllers
+            controllers = self._register_controllers(app)
 
-        # 3. Register capabilities
-        capabilities = self._register_capabilities(app)
+            # 3. Register capabilities
+            capabilities = await self._register_capabilities(app)
+        finally:
+            # Tokenizers must be ready before the app starts serving
+            await tokenizer_task
 
         logger.info("Business application initialization completed")
 
@@ -90,6 +104,10 @@ class BusinessLifespanProvider(LifespanProvider):
 
         await self._close_agentic_services()
 
+        # Drop cached beans so a reload resolves them afresh
+        self._controller_cache = None
+        self._capability_cache = None
+
         # Clean up business-related attributes in app.state
         if hasattr(app.state, 'graphs'):
             delattr(app.state, 'graphs')
@@ -102,20 +120,33 @@ class BusinessLifespanProvider(LifespanProvider):
             ("vectorize", get_vectorize_service),
             ("rerank", get_rerank_service),
         )
-        for service_name, service_getter in service_getters:
-            try:
-                service = service_getter()
-                close = getattr(service, "close", None)
-                if callable(close):
-                    await close()
-            except Exception as exc:
-                logger.warning(
-                    "Failed to close %s service during shutdown: %s", service_name, exc
-                )
+        # Close concurrently; each close is isolated so one slow or broken
+        # service cannot hold up the others
+        await asyncio.gather(
+            *(
+                self._close_service(service_name, service_getter)
+                for service_name, service_getter in service_getters
+            ),
+            return_exceptions=True,
+        )
+
+    async def _close_service(self, service_name: str, service_getter) -> None:
+        """Close a single agentic service, logging any failure."""
+        try:
+            service = service_getter()
+            close = getattr(service, "close", None)
+            if callable(close):
+                await close()
+        except Exception as exc:
+            logger.warning(
+                "Failed to close %s service during shutdown: %s", service_name, exc
+            )
 
     def _register_controllers(self, app: FastAPI) -> list:
         """Register all controllers"""
-        all_controllers = get_beans_by_type(BaseController)
+        if self._controller_cache is None:
+            self._controller_cache = get_beans_by_type(BaseController)
+        all_controllers = self._controller_cache
         for controller in all_controllers:
             controller.register_to_app(app)
         logger.info(
@@ -124,11 +155,23 @@ class BusinessLifespanProvider(LifespanProvider):
         )
         return all_controllers
 
-    def _register_capabilities(self, app: FastAPI) -> list:
-        """Register all application capabilities"""
-        capability_beans = get_beans_by_type(ApplicationCapability)
+    async def _register_capabilities(self, app: FastAPI) -> list:
+        """
+        Register all application capabilities
+
+        enable() runs in bean order; capabilities whose enable() is async
+        (e.g. network warmup) then complete concurrently.
+        """
+        if self._capability_cache is None:
+            self._capability_cache = get_beans_by_type(ApplicationCapability)
+        capability_beans = self._capability_cache
+        pending = []
         for capability in capability_beans:
-            capability.enable(app)
+            result = capability.enable(app)
+            if inspect.isawaitable(result):
+                pending.append(result)
+        if pending:
+            await asyncio.gather(*pending)
         logger.info(
             "Application capability registration completed, %d capabilities registered",
             len(capability_beans),
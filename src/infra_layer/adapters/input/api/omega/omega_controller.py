@@ -2,6 +2,7 @@
 Omega Controller - REST endpoints for omega-mode interactions.
 
 POST /api/v1/omega/process — Route through Pentagram cycle
+POST /api/v1/omega/process/stream — Same cycle as NDJSON progress events
 GET  /api/v1/omega/development — Get current development level
 GET  /api/v1/omega/identity — Get current identity state
 GET  /api/v1/omega/identity/proposals — List pending proposals
@@ -10,19 +11,68 @@ POST /api/v1/omega/identity/proposals/{id}/approve — Approve proposal
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
+import threading
 import time
 
 from fastapi import HTTPException, Request as FastAPIRequest
+from fastapi.responses import StreamingResponse
+
+try:
+    # orjson arrives with the langgraph stack; stdlib json is the fallback
+    import orjson
+    from fastapi.responses import ORJSONResponse as _JSONResponse
+except ImportError:
+    orjson = None
+    from fastapi.responses import JSONResponse as _JSONResponse
 
 from core.di.decorators import controller
 from core.interface.controller.base_controller import BaseController, get, post
 from core.constants.errors import ErrorStatus
+from omega_layer import _lazy
+from omega_layer.development.metrics import (
+    record_pentagram_cycle,
+    record_tension,
+    record_vertex_vote,
+    update_development_level,
+)
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on one /process cycle; identical requests share it meanwhile
+_INFLIGHT_TIMEOUT_S = float(os.getenv("OMEGA_PROCESS_TIMEOUT_S", "60"))
+
+# Prometheus export for /process cycles; off skips the per-cycle task entirely
+_METRICS_ENABLED = os.getenv("OMEGA_METRICS_ENABLED", "true").lower() == "true"
+
+# How often a request may trigger a background check of omega_scar.json
+_IDENTITY_REVALIDATE_S = float(os.getenv("OMEGA_IDENTITY_REVALIDATE_S", "30"))
+
+
+def _dumps_line(payload: dict) -> bytes:
+    """Encode one NDJSON line."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str) + b"\n"
+    return json.dumps(payload, default=str).encode() + b"\n"
+
+
+@functools.lru_cache(maxsize=1)
+def _build_llm_provider(provider_type, model, base_url, api_key, temperature, max_tokens):
+    """Build the vertex LLM provider once per process for a given env config."""
+    return _lazy.LLMProvider(
+        provider_type=provider_type,
+        model=model,
+        base_url=base_url,
+        api_key=api_key,
+        temperature=temperature,
+        max_tokens=max_tokens,
+    )
+
 
 @controller("omega_controller", primary=False)
 class OmegaController(BaseController):
@@ -35,68 +85,242 @@ class OmegaController(BaseController):
             default_auth="none",
         )
         self._kernel = None
+        self._kernel_lock = threading.Lock()
+        self._kernel_task = None
         self._monitor = None
         self._identity = None
+        self._identity_task = None
+        self._identity_checked_at = 0.0
+        self._background_tasks = set()
+        self._inflight = {}
         logger.info("OmegaController initialized")
 
+    def register_to_app(self, app):
+        """Register routes and start loading identity and the kernel in the background."""
+        super().register_to_app(app)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        # Imports and LLM client setup happen off the event loop before
+        # traffic arrives, so the first /process request isn't penalized
+        self._kernel_task = asyncio.ensure_future(asyncio.to_thread(self._get_kernel))
+        self._kernel_task.add_done_callback(self._log_warmup_failure)
+        self._identity_task = asyncio.ensure_future(asyncio.to_thread(self._get_identity))
+        self._identity_task.add_done_callback(self._log_warmup_failure)
+
+    @staticmethod
+    def _log_warmup_failure(task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Omega warmup failed, will retry on first request: {task.exception()}")
+
+    async def _ensure_kernel(self):
+        """Get the kernel, assembling it in a worker thread if needed."""
+        if self._kernel is not None:
+            return self._kernel
+        task = self._kernel_task
+        if task is None or task.done():
+            # Not started yet, or a previous assembly failed: (re)try
+            task = self._kernel_task = asyncio.ensure_future(
+                asyncio.to_thread(self._get_kernel)
+            )
+        return await asyncio.shield(task)
+
     def _get_kernel(self):
         """Lazy-init the MetabolicKernel with all vertices."""
-        if self._kernel is None:
-            from omega_layer.kernel.metabolic_kernel import MetabolicKernel
-            from omega_layer.vertices.ledger_vertex import LedgerVertex
-            from omega_layer.vertices.garden_vertex import GardenVertex
-            from omega_layer.vertices.mirror_vertex import MirrorVertex
-            from omega_layer.vertices.compass_vertex import CompassVertex
-            from omega_layer.vertices.orchestra_vertex import OrchestraVertex
-            from memory_layer.llm.llm_provider import LLMProvider
-
-            # Create LLM provider for vertices
-            llm = LLMProvider(
-                provider_type=os.getenv("LLM_PROVIDER", "openai"),
-                model=os.getenv("OMEGA_LLM_MODEL", os.getenv("LLM_MODEL", "gpt-4.1-mini")),
-                base_url=os.getenv("LLM_BASE_URL"),
-                api_key=os.getenv("LLM_API_KEY"),
-                temperature=float(os.getenv("LLM_TEMPERATURE", "0.3")),
-                max_tokens=int(os.getenv("LLM_MAX_TOKENS", "4096")),
-            )
+        with self._kernel_lock:
+            if self._kernel is None:
+                # Create LLM provider for vertices
+                llm = _build_llm_provider(
+                    os.getenv("LLM_PROVIDER", "openai"),
+                    os.getenv("OMEGA_LLM_MODEL", os.getenv("LLM_MODEL", "gpt-4.1-mini")),
+                    os.getenv("LLM_BASE_URL"),
+                    os.getenv("LLM_API_KEY"),
+                    float(os.getenv("LLM_TEMPERATURE", "0.3")),
+                    int(os.getenv("LLM_MAX_TOKENS", "4096")),
+                )
 
-            # Assemble Pentagram
-            self._kernel = MetabolicKernel(llm_provider=llm)
+                # Assemble Pentagram
+                kernel = _lazy.MetabolicKernel(llm_provider=llm)
 
-            ledger = LedgerVertex()
-            garden = GardenVertex()
-            garden.configure_llm(llm)
-            mirror = MirrorVertex()
-            mirror.configure_llm(llm)
-            compass = CompassVertex()
-            compass.configure_llm(llm)
-            orchestra = OrchestraVertex()
+                ledger = _lazy.LedgerVertex()
+                garden = _lazy.GardenVertex()
+                garden.configure_llm(llm)
+                mirror = _lazy.MirrorVertex()
+                mirror.configure_llm(llm)
+                compass = _lazy.CompassVertex()
+                compass.configure_llm(llm)
+                orchestra = _lazy.OrchestraVertex()
 
-            self._kernel.register_vertex(ledger)
-            self._kernel.register_vertex(garden)
-            self._kernel.register_vertex(mirror)
-            self._kernel.register_vertex(compass)
-            self._kernel.register_vertex(orchestra)
+                kernel.register_vertex(ledger)
+                kernel.register_vertex(garden)
+                kernel.register_vertex(mirror)
+                kernel.register_vertex(compass)
+                kernel.register_vertex(orchestra)
 
-            logger.info(f"Pentagram assembled: {self._kernel.vertex_count} vertices")
+                self._kernel = kernel
+                logger.info(f"Pentagram assembled: {self._kernel.vertex_count} vertices")
 
         return self._kernel
 
     def _get_monitor(self):
         if self._monitor is None:
-            from omega_layer.development.monitor import DevelopmentMonitor
-            self._monitor = DevelopmentMonitor()
+            self._monitor = _lazy.DevelopmentMonitor()
         return self._monitor
 
     def _get_identity(self):
         if self._identity is None:
-            from omega_layer.identity.topology import IdentityTopology
-            self._identity = IdentityTopology()
-            self._identity.load()
+            identity = _lazy.IdentityTopology()
+            identity.load()
+            self._identity_checked_at = time.monotonic()
+            self._identity = identity
         return self._identity
 
+    async def _ensure_identity(self):
+        """Get the identity, loading it in a worker thread if needed.
+
+        Once loaded, the in-memory state is served immediately and the scar
+        file is re-checked in the background at most every
+        OMEGA_IDENTITY_REVALIDATE_S seconds (stale-while-revalidate).
+        """
+        if self._identity is not None:
+            now = time.monotonic()
+            if now - self._identity_checked_at >= _IDENTITY_REVALIDATE_S:
+                self._identity_checked_at = now
+                self._spawn_background(self._revalidate_identity())
+            return self._identity
+        task = self._identity_task
+        if task is None or task.done():
+            task = self._identity_task = asyncio.ensure_future(
+                asyncio.to_thread(self._get_identity)
+            )
+        return await asyncio.shield(task)
+
+    async def _revalidate_identity(self) -> None:
+        """Re-read omega_scar.json if it changed (skipped while applied changes are unpersisted)."""
+        try:
+            if await asyncio.to_thread(self._identity.reload_if_changed):
+                logger.info("omega_scar.json changed on disk, identity reloaded")
+        except Exception as e:
+            logger.warning(f"Identity revalidation failed, keeping current state: {e}")
+
+    def _spawn_background(self, coro) -> None:
+        """Run a fire-and-forget coroutine, holding a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    @staticmethod
+    async def _emit_metrics(duration: float, result, level: float) -> None:
+        """Export one Pentagram cycle to Prometheus (non-fatal on failure)."""
+        try:
+            record_pentagram_cycle(
+                duration_seconds=duration,
+                vertex_count=result.successful_votes,
+                has_synthesis=result.has_synthesis,
+            )
+            for name, v in result.votes.items():
+                record_vertex_vote(vertex=name, score=v.score, success=(v.score > 0))
+            update_development_level(level)
+            for t in result.tensions:
+                record_tension(dimension=t.dimension, magnitude=t.magnitude)
+        except Exception as metric_err:
+            logger.warning(f"Prometheus metric export failed (non-fatal): {metric_err}")
+
+    async def _process_coalesced(self, experience: dict, start: float) -> dict:
+        """Share one Pentagram cycle between identical in-flight requests."""
+        key = hashlib.blake2b(
+            json.dumps(experience, sort_keys=True, default=str).encode(),
+            digest_size=16,
+        ).hexdigest()
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                asyncio.wait_for(self._run_cycle(experience, start), _INFLIGHT_TIMEOUT_S)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._finish_inflight, key))
+        # A disconnecting client must not cancel the cycle others are awaiting
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, key: str, task) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark the error retrieved even if every waiter has gone away
+            task.exception()
+
+    async def _run_cycle(self, experience: dict, start: float) -> dict:
+        """Run one Pentagram cycle and build the /process response."""
+        # Get identity state for context
+        identity = await self._ensure_identity()
+        context = {
+            "identity_state": identity.state,
+            "self_model": {},
+        }
+
+        # Process through Pentagram
+        kernel = await self._ensure_kernel()
+        result = await kernel.process(experience, context)
+
+        # Record growth + Prometheus metrics
+        monitor = self._get_monitor()
+        snapshot = monitor.record_cycle(result)
+        level = monitor.get_development_level()
+
+        # Export to Prometheus after the response is on its way
+        if _METRICS_ENABLED:
+            self._spawn_background(
+                self._emit_metrics(time.perf_counter() - start, result, level.level)
+            )
+
+        return {
+            "status": ErrorStatus.OK.value,
+            "message": "Pentagram cycle complete",
+            "result": {
+                "votes": result.votes_api,
+                "tensions": [self._tension_payload(t) for t in result.tensions],
+                "synthesis": result.synthesis.decision if result.synthesis else None,
+                **self._growth_payload(result, snapshot, level, monitor),
+            },
+        }
+
+    @staticmethod
+    def _tension_payload(t) -> dict:
+        return {"vertices": t.label, "dimension": t.dimension, "magnitude": t.magnitude}
+
+    @staticmethod
+    def _growth_payload(result, snapshot, level, monitor) -> dict:
+        return {
+            "growth": {
+                "cycle_signal": round(snapshot.growth_signal, 4),
+                "development_level": level.level,
+                "trend": level.trend,
+                "milestones": monitor.milestones,
+            },
+            "timing": {k: round(v, 3) for k, v in result.timings.items()},
+            "errors": result.errors,
+        }
+
+    @staticmethod
+    async def _read_experience(request: FastAPIRequest) -> dict:
+        """Parse a /process body into a kernel experience (400 if no message)."""
+        raw = await request.body()
+        body = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        message = body.get("message", body.get("content", ""))
+
+        if not message:
+            raise HTTPException(status_code=400, detail="'message' field required")
+
+        return {
+            "message": message,
+            "user_id": body.get("user_id", body.get("sender", "omega")),
+            "group_id": body.get("group_id", "omega_default"),
+            "metadata": body.get("metadata", {}),
+        }
+
     @post(
         "/process",
+        response_class=_JSONResponse,
         summary="Process experience through Pentagram",
         description="Route a message through all 5 vertices + metabolic kernel. Returns enriched result with growth metrics.",
     )
@@ -104,87 +328,78 @@ class OmegaController(BaseController):
         """Route experience through full Pentagram cycle."""
         start = time.perf_counter()
         try:
-            body = await request.json()
-            message = body.get("message", body.get("content", ""))
-
-            if not message:
-                raise HTTPException(status_code=400, detail="'message' field required")
-
-            experience = {
-                "message": message,
-                "user_id": body.get("user_id", body.get("sender", "omega")),
-                "group_id": body.get("group_id", "omega_default"),
-                "metadata": body.get("metadata", {}),
-            }
+            experience = await self._read_experience(request)
+            return await self._process_coalesced(experience, start)
+        except HTTPException:
+            raise
+        except asyncio.TimeoutError:
+            logger.error(f"Pentagram cycle exceeded {_INFLIGHT_TIMEOUT_S}s")
+            raise HTTPException(
+                status_code=504,
+                detail=f"Pentagram cycle timed out after {_INFLIGHT_TIMEOUT_S}s",
+            )
+        except Exception as e:
+            logger.error(f"Pentagram processing failed: {e}", exc_info=True)
+            raise HTTPException(status_code=500, detail=str(e))
 
-            # Get identity state for context
-            identity = self._get_identity()
+    @post(
+        "/process/stream",
+        summary="Stream an experience through Pentagram",
+        description="Same cycle as /process, returned as NDJSON events: one per vertex vote as it lands, then tensions, synthesis and growth.",
+    )
+    async def process_experience_stream(self, request: FastAPIRequest):
+        """Route experience through the Pentagram, streaming progress."""
+        start = time.perf_counter()
+        try:
+            experience = await self._read_experience(request)
+            identity = await self._ensure_identity()
             context = {
                 "identity_state": identity.state,
                 "self_model": {},
             }
-
-            # Process through Pentagram
-            kernel = self._get_kernel()
-            result = await kernel.process(experience, context)
-
-            # Record growth + Prometheus metrics
-            monitor = self._get_monitor()
-            snapshot = monitor.record_cycle(result)
-            level = monitor.get_development_level()
-
-            # Export to Prometheus
-            try:
-                from omega_layer.development.metrics import (
-                    record_pentagram_cycle,
-                    record_vertex_vote,
-                    update_development_level,
-                    record_tension,
-                )
-                duration = time.perf_counter() - start
-                record_pentagram_cycle(
-                    duration_seconds=duration,
-                    vertex_count=result.successful_votes,
-                    has_synthesis=result.has_synthesis,
-                )
-                for name, v in result.votes.items():
-                    record_vertex_vote(vertex=name, score=v.score, success=(v.score > 0))
-                update_development_level(level.level)
-                for t in result.tensions:
-                    record_tension(dimension=t.dimension, magnitude=t.magnitude)
-            except Exception as metric_err:
-                logger.warning(f"Prometheus metric export failed (non-fatal): {metric_err}")
-
-            return {
-                "status": ErrorStatus.OK.value,
-                "message": "Pentagram cycle complete",
-                "result": {
-                    "votes": {
-                        name: {"score": v.score, "reasoning": v.reasoning[:200], "observations": v.observations}
-                        for name, v in result.votes.items()
-                    },
-                    "tensions": [
-                        {"vertices": f"{t.vertex_a.value} vs {t.vertex_b.value}", "dimension": t.dimension, "magnitude": t.magnitude}
-                        for t in result.tensions
-                    ],
-                    "synthesis": result.synthesis.decision if result.synthesis else None,
-                    "growth": {
-                        "cycle_signal": round(snapshot.growth_signal, 4),
-                        "development_level": level.level,
-                        "trend": level.trend,
-                        "milestones": monitor.milestones,
-                    },
-                    "timing": {k: round(v, 3) for k, v in result.timings.items()},
-                    "errors": result.errors,
-                },
-            }
-
+            kernel = await self._ensure_kernel()
         except HTTPException:
             raise
         except Exception as e:
             logger.error(f"Pentagram processing failed: {e}", exc_info=True)
             raise HTTPException(status_code=500, detail=str(e))
 
+        return StreamingResponse(
+            self._stream_cycle(kernel, experience, context, start),
+            media_type="application/x-ndjson",
+        )
+
+    async def _stream_cycle(self, kernel, experience: dict, context: dict, start: float):
+        """Translate kernel events into NDJSON lines."""
+        try:
+            async for event in kernel.process_stream(experience, context):
+                kind = event[0]
+                if kind == "vote":
+                    yield _dumps_line({"event": "vote", "vertex": event[1], **event[2].to_api_dict()})
+                elif kind == "tension":
+                    yield _dumps_line({"event": "tension", **self._tension_payload(event[1])})
+                elif kind == "synthesis":
+                    synthesis = event[1]
+                    yield _dumps_line({"event": "synthesis", "synthesis": synthesis.decision if synthesis else None})
+                elif kind == "result":
+                    result = event[1]
+                    monitor = self._get_monitor()
+                    snapshot = monitor.record_cycle(result)
+                    level = monitor.get_development_level()
+                    if _METRICS_ENABLED:
+                        self._spawn_background(
+                            self._emit_metrics(time.perf_counter() - start, result, level.level)
+                        )
+                    yield _dumps_line({
+                        "event": "complete",
+                        "status": ErrorStatus.OK.value,
+                        **self._growth_payload(result, snapshot, level, monitor),
+                    })
+        except Exception as e:
+            # Headers are already sent; report the failure in-band
+            logger.error(f"Pentagram streaming failed: {e}", exc_info=True)
+            yield _dumps_line({"event": "error", "detail": str(e)})
+
     @get(
         "/development",
         summary="Get development level",
@@ -213,7 +428,7 @@ class OmegaController(BaseController):
     )
     async def get_identity(self, request: FastAPIRequest):
         """Get current identity state."""
-        identity = self._get_identity()
+        identity = await self._ensure_identity()
         state = identity.state
         if not state:
             raise HTTPException(status_code=500, detail="Identity not loaded")
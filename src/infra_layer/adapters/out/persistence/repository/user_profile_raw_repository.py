@@ -26,6 +26,7 @@ class UserProfileRawRepository(BaseRepository[UserProfile]):
 
     Provides ProfileStorage compatible interfaces:
     - save_profile(user_id, profile, metadata) -> bool
+    - update_profile_metadata(user_id, metadata) -> bool
     - get_profile(user_id) -> Optional[Any]
     - get_all_profiles() -> Dict[str, Any]
     - get_profile_history(user_id, limit) -> List[Dict]
@@ -47,6 +48,29 @@ class UserProfileRawRepository(BaseRepository[UserProfile]):
         result = await self.upsert(user_id, group_id, profile_data, metadata)
         return result is not None
 
+    async def update_profile_metadata(
+        self, user_id: str, metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Apply extraction metadata to an existing profile without a new version.
+
+        Used when re-extraction produced identical profile data: the profile is
+        still linked to the new cluster and its counters are refreshed.
+        """
+        metadata = metadata or {}
+        group_id = metadata.get("group_id", "default")
+        try:
+            existing = await self.get_by_user_and_group(user_id, group_id)
+            if existing is None:
+                return False
+            self._apply_metadata(existing, metadata)
+            await existing.save()
+            return True
+        except Exception as e:
+            logger.error(
+                f"Failed to update user profile metadata: user_id={user_id}, group_id={group_id}, error={e}"
+            )
+            return False
+
     async def get_profile(
         self, user_id: str, group_id: str = "default"
     ) -> Optional[Any]:
@@ -209,16 +233,7 @@ class UserProfileRawRepository(BaseRepository[UserProfile]):
             if existing:
                 existing.profile_data = profile_data
                 existing.version += 1
-                existing.confidence = metadata.get("confidence", existing.confidence)
-
-                if "cluster_id" in metadata:
-                    cluster_id = metadata["cluster_id"]
-                    if cluster_id not in existing.cluster_ids:
-                        existing.cluster_ids.append(cluster_id)
-                    existing.last_updated_cluster = cluster_id
-
-                if "memcell_count" in metadata:
-                    existing.memcell_count = metadata["memcell_count"]
+                self._apply_metadata(existing, metadata)
 
                 await existing.save()
                 logger.debug(
@@ -250,6 +265,19 @@ class UserProfileRawRepository(BaseRepository[UserProfile]):
             )
             return None
 
+    @staticmethod
+    def _apply_metadata(existing: UserProfile, metadata: Dict[str, Any]) -> None:
+        existing.confidence = metadata.get("confidence", existing.confidence)
+
+        if "cluster_id" in metadata:
+            cluster_id = metadata["cluster_id"]
+            if cluster_id not in existing.cluster_ids:
+                existing.cluster_ids.append(cluster_id)
+            existing.last_updated_cluster = cluster_id
+
+        if "memcell_count" in metadata:
+            existing.memcell_count = metadata["memcell_count"]
+
     async def delete_by_group(self, group_id: str) -> int:
         try:
             result = await self.model.find(UserProfile.group_id == group_id).delete()
@@ -41,6 +41,9 @@ class ClusterState:
         self.eventid_to_cluster: Dict[str, str] = {}
         self.next_cluster_idx: int = 0
         
+        # Per-cluster member buckets (derived from eventid_to_cluster, not persisted)
+        self.cluster_members: Dict[str, List[str]] = {}
+        
         # Centroid-based clustering state
         self.cluster_centroids: Dict[str, np.ndarray] = {}
         self.cluster_counts: Dict[str, int] = {}
@@ -50,7 +53,7 @@ class ClusterState:
         """Assign a new cluster ID to an event."""
         cluster_id = f"cluster_{self.next_cluster_idx:03d}"
         self.next_cluster_idx += 1
-        self.eventid_to_cluster[event_id] = cluster_id
+        self._set_event_cluster(event_id, cluster_id)
         self.cluster_ids.append(cluster_id)
         return cluster_id
     
@@ -62,10 +65,24 @@ class ClusterState:
         timestamp: Optional[float]
     ) -> None:
         """Add an event to an existing cluster."""
-        self.eventid_to_cluster[event_id] = cluster_id
+        self._set_event_cluster(event_id, cluster_id)
         self.cluster_ids.append(cluster_id)
         self._update_cluster_centroid(cluster_id, vector, timestamp)
     
+    def get_cluster_event_ids(self, cluster_id: str) -> List[str]:
+        """Get the event IDs assigned to a cluster, in assignment order."""
+        return list(self.cluster_members.get(cluster_id, ()))
+    
+    def _set_event_cluster(self, event_id: str, cluster_id: str) -> None:
+        """Map an event to a cluster, keeping the member buckets in sync."""
+        previous = self.eventid_to_cluster.get(event_id)
+        if previous is not None:
+            members = self.cluster_members.get(previous)
+            if members and event_id in members:
+                members.remove(event_id)
+        self.eventid_to_cluster[event_id] = cluster_id
+        self.cluster_members.setdefault(cluster_id, []).append(event_id)
+    
     def _update_cluster_centroid(
         self,
         cluster_id: str,
@@ -120,6 +137,8 @@ class ClusterState:
         state.cluster_ids = list(data.get("cluster_ids", []))
         state.eventid_to_cluster = dict(data.get("eventid_to_cluster", {}))
         state.next_cluster_idx = int(data.get("next_cluster_idx", 0))
+        for event_id, cluster_id in state.eventid_to_cluster.items():
+            state.cluster_members.setdefault(cluster_id, []).append(event_id)
         
         centroids = data.get("cluster_centroids", {}) or {}
         state.cluster_centroids = {
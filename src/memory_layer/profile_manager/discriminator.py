@@ -1,8 +1,10 @@
 """Value discriminator for profile extraction - determines if memcell contains profile-worthy content."""
 
-import ast
+import asyncio
+import hashlib
 import json
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -11,6 +13,68 @@ from core.observation.logger import get_logger
 
 logger = get_logger(__name__)
 
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_BRACE_RE = re.compile(r"\{[\s\S]*?\}")
+
+_GROUP_CHAT_PROMPT_HEADER = (
+    "You are a precise profile value discriminator for work/group chat scenario.\n"
+    "\n"
+    "Given the latest conversation MemCell and recent context, determine if the latest MemCell contains \n"
+    "new, concrete, and attributable information about user profile fields such as:\n"
+    "\n"
+    "Profile Fields to Consider:\n"
+    "- role_responsibility: User's role, duties, responsibilities\n"
+    "- hard_skills: Technical skills, tools, technologies\n"
+    "- soft_skills: Communication, leadership, collaboration\n"
+    "- projects_participated: Project names, roles, contributions\n"
+    "- working_habit_preference: Work style, preferences, routines\n"
+    "- personality: Character traits, temperament\n"
+    "- way_of_decision_making: Decision patterns, priorities\n"
+    "- interests: Professional interests, areas of focus\n"
+    "- tendency: Behavioral tendencies, patterns\n"
+    "\n"
+    "Rules for Judgment:\n"
+    "1. Reject small talk, vague statements, or non-attributable content\n"
+    '2. Prefer explicit statements (e.g., "I am responsible for X", "I have experience with Y")\n'
+    "3. Look for concrete evidence, not assumptions\n"
+    "4. Consider if the information is stable/lasting vs transient\n"
+    "5. Ensure the information is clearly attributable to a specific user"
+)
+
+_ASSISTANT_PROMPT_HEADER = (
+    "You are a precise value discriminator for companion/assistant scenario.\n"
+    "\n"
+    "Determine if the latest MemCell reveals stable personal traits or preferences worth capturing:\n"
+    "\n"
+    "Profile Fields to Consider:\n"
+    "- personality: Enduring personality dimensions (Big Five, MBTI indicators)\n"
+    "- way_of_decision_making: Stable decision-making patterns\n"
+    "- interests: Long-term hobbies, passions, areas of interest\n"
+    "- tendency: Behavioral patterns, recurring preferences\n"
+    "- value_system: Core values, beliefs, principles\n"
+    "- motivation_system: What drives/motivates the user\n"
+    "- working_habit_preference: Routines, habits, preferences\n"
+    "\n"
+    "Rules for Judgment:\n"
+    "1. Focus on stable, enduring traits (not transient moods or one-time events)\n"
+    "2. Reject casual chit-chat and vague statements\n"
+    "3. Look for repeated patterns or explicit self-descriptions\n"
+    "4. Prefer concrete examples over abstract claims\n"
+    "5. Ensure information is clearly attributable"
+)
+
+_PROMPT_FOOTER = (
+    "\n\nRespond with strict JSON only (no extra text):\n"
+    "{\n"
+    '  "is_high_value": true/false,\n'
+    '  "confidence": 0.0-1.0,\n'
+    '  "reasons": "Brief explanation of your judgment"\n'
+    "}"
+)
+
+_CONTEXT_SEPARATOR = "\n\n"
+_NO_CONTEXT = "No context available"
+
 
 @dataclass
 class DiscriminatorConfig:
@@ -20,11 +84,17 @@ class DiscriminatorConfig:
         min_confidence: Minimum confidence threshold (0.0-1.0)
         use_context: Whether to use previous memcells as context
         context_window: Number of previous memcells to include as context
+        json_mode: Request JSON-object output from the provider; replies are
+            still parsed leniently for backends that ignore response_format
+        cache_size: Maximum number of LLM judgments cached by prompt hash
+            (0 disables caching)
     """
     
     min_confidence: float = 0.6
     use_context: bool = True
     context_window: int = 2
+    json_mode: bool = True
+    cache_size: int = 4096
 
 
 class ValueDiscriminator:
@@ -65,6 +135,9 @@ class ValueDiscriminator:
         self.llm_provider = llm_provider
         self.config = config or DiscriminatorConfig()
         self.scenario = scenario.lower()
+        
+        # LRU of raw (is_high_value, confidence, reason) judgments keyed by prompt hash
+        self._judgment_cache: "OrderedDict[bytes, Tuple[bool, float, str]]" = OrderedDict()
     
     async def is_high_value(
         self,
@@ -80,156 +153,146 @@ class ValueDiscriminator:
         Returns:
             Tuple of (is_high_value, confidence, reason)
         """
-        recent_memcells = recent_memcells or []
-        
-        # Build prompt based on scenario
-        if self.scenario == "assistant":
-            prompt = self._build_assistant_prompt(latest_memcell, recent_memcells)
-        else:
-            prompt = self._build_group_chat_prompt(latest_memcell, recent_memcells)
-        
-        try:
-            response = await self.llm_provider.generate(prompt, temperature=0.0)
-            is_high, conf, reason = self._parse_response(response)
-            
-            # Apply confidence threshold
-            if is_high and conf >= self.config.min_confidence:
-                return True, conf, reason
-            else:
-                return False, conf, reason or "Below confidence threshold"
-        
-        except Exception as e:
-            logger.warning(f"Value discrimination failed: {e}")
-            return False, 0.0, f"Discrimination error: {str(e)}"
+        prompt = self._build_prompt(latest_memcell, recent_memcells or [])
+        return await self._judge(prompt)
     
-    def _build_group_chat_prompt(
+    async def is_high_value_batch(
         self,
-        latest: Any,
-        recent: List[Any]
-    ) -> str:
-        """Build prompt for group_chat scenario."""
-        context_texts = []
-        if self.config.use_context and recent:
-            window = recent[-self.config.context_window:]
-            for i, mc in enumerate(window):
-                text = self._extract_text(mc)
-                if text:
-                    context_texts.append(f"[Context {i+1}]\n{text}")
+        memcells: List[Any],
+        max_concurrency: int = 32
+    ) -> List[Tuple[bool, float, str]]:
+        """Judge a sequence of memcells with concurrent LLM calls.
         
-        latest_text = self._extract_text(latest)
-        context_block = "\n\n".join(context_texts) if context_texts else "No context available"
+        Each memcell is evaluated against the memcells immediately preceding it
+        in the sequence, i.e. the same context it would get from sequential
+        ``is_high_value`` calls. All prompts are built up front and dispatched
+        together, bounded by a semaphore, so the provider can batch them.
         
-        prompt = f"""You are a precise profile value discriminator for work/group chat scenario.
-
-Given the latest conversation MemCell and recent context, determine if the latest MemCell contains 
-new, concrete, and attributable information about user profile fields such as:
-
-Profile Fields to Consider:
-- role_responsibility: User's role, duties, responsibilities
-- hard_skills: Technical skills, tools, technologies
-- soft_skills: Communication, leadership, collaboration
-- projects_participated: Project names, roles, contributions
-- working_habit_preference: Work style, preferences, routines
-- personality: Character traits, temperament
-- way_of_decision_making: Decision patterns, priorities
-- interests: Professional interests, areas of focus
-- tendency: Behavioral tendencies, patterns
-
-Rules for Judgment:
-1. Reject small talk, vague statements, or non-attributable content
-2. Prefer explicit statements (e.g., "I am responsible for X", "I have experience with Y")
-3. Look for concrete evidence, not assumptions
-4. Consider if the information is stable/lasting vs transient
-5. Ensure the information is clearly attributable to a specific user
-
-Context (Previous MemCells):
-{context_block}
-
-Latest MemCell to Evaluate:
-{latest_text}
-
-Respond with strict JSON only (no extra text):
-{{
-  "is_high_value": true/false,
-  "confidence": 0.0-1.0,
-  "reasons": "Brief explanation of your judgment"
-}}"""
+        Args:
+            memcells: Memcells in arrival order
+            max_concurrency: Maximum number of in-flight LLM requests
         
-        return prompt
+        Returns:
+            List of (is_high_value, confidence, reason), in input order
+        """
+        # Extract each memcell's text once; it is reused as context for later cells
+        texts = [self._extract_text(mc) for mc in memcells]
+        window = self.config.context_window if self.config.use_context else 0
+        prompts = [
+            self._render_prompt(text, texts[max(0, i - window):i])
+            for i, text in enumerate(texts)
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _bounded_judge(prompt: str) -> Tuple[bool, float, str]:
+            async with semaphore:
+                return await self._judge(prompt)
+        
+        # Identical prompts within the batch are sent to the LLM only once
+        unique_prompts = list(dict.fromkeys(prompts))
+        judgments = await asyncio.gather(*(_bounded_judge(p) for p in unique_prompts))
+        by_prompt = dict(zip(unique_prompts, judgments))
+        return [by_prompt[p] for p in prompts]
     
-    def _build_assistant_prompt(
-        self,
-        latest: Any,
-        recent: List[Any]
-    ) -> str:
-        """Build prompt for assistant/companion scenario."""
-        context_texts = []
-        if self.config.use_context and recent:
-            window = recent[-self.config.context_window:]
-            for i, mc in enumerate(window):
-                text = self._extract_text(mc)
-                if text:
-                    context_texts.append(f"[Context {i+1}]\n{text}")
+    def _build_prompt(self, latest: Any, recent: List[Any]) -> str:
+        """Build the discrimination prompt for the configured scenario."""
+        window = self.config.context_window if self.config.use_context else 0
+        recent_texts = [
+            self._extract_text(mc) for mc in recent[max(0, len(recent) - window):]
+        ]
+        return self._render_prompt(self._extract_text(latest), recent_texts)
+    
+    def _render_prompt(self, latest_text: str, recent_texts: List[str]) -> str:
+        """Render the scenario prompt from already-extracted memcell texts."""
+        header = (
+            _ASSISTANT_PROMPT_HEADER
+            if self.scenario == "assistant"
+            else _GROUP_CHAT_PROMPT_HEADER
+        )
+        context_block = _CONTEXT_SEPARATOR.join(
+            f"[Context {i+1}]\n{text}" for i, text in enumerate(recent_texts) if text
+        ) or _NO_CONTEXT
         
-        latest_text = self._extract_text(latest)
-        context_block = "\n\n".join(context_texts) if context_texts else "No context available"
+        return (
+            f"{header}\n\nContext (Previous MemCells):\n{context_block}"
+            f"\n\nLatest MemCell to Evaluate:\n{latest_text}{_PROMPT_FOOTER}"
+        )
+    
+    async def _judge(self, prompt: str) -> Tuple[bool, float, str]:
+        """Run a built prompt through the LLM and apply the confidence threshold.
         
-        prompt = f"""You are a precise value discriminator for companion/assistant scenario.
-
-Determine if the latest MemCell reveals stable personal traits or preferences worth capturing:
-
-Profile Fields to Consider:
-- personality: Enduring personality dimensions (Big Five, MBTI indicators)
-- way_of_decision_making: Stable decision-making patterns
-- interests: Long-term hobbies, passions, areas of interest
-- tendency: Behavioral patterns, recurring preferences
-- value_system: Core values, beliefs, principles
-- motivation_system: What drives/motivates the user
-- working_habit_preference: Routines, habits, preferences
-
-Rules for Judgment:
-1. Focus on stable, enduring traits (not transient moods or one-time events)
-2. Reject casual chit-chat and vague statements
-3. Look for repeated patterns or explicit self-descriptions
-4. Prefer concrete examples over abstract claims
-5. Ensure information is clearly attributable
-
-Context (Previous MemCells):
-{context_block}
-
-Latest MemCell to Evaluate:
-{latest_text}
-
-Respond with strict JSON only (no extra text):
-{{
-  "is_high_value": true/false,
-  "confidence": 0.0-1.0,
-  "reasons": "Brief explanation of your judgment"
-}}"""
+        Judgments are cached by prompt hash, so repeated prompts skip the LLM.
+        Only judgments parsed from a valid payload are cached; empty or
+        unparseable replies are retried on the next call.
+        """
+        key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+        cached = self._judgment_cache.get(key)
+        if cached is not None:
+            self._judgment_cache.move_to_end(key)
+            is_high, conf, reason = cached
+        else:
+            try:
+                response = await self.llm_provider.generate(
+                    prompt,
+                    temperature=0.0,
+                    response_format={"type": "json_object"} if self.config.json_mode else None,
+                )
+                if not response:
+                    return False, 0.0, "Empty response"
+                payload = self._parse_payload(response)
+                if payload is None:
+                    return False, 0.0, "Failed to parse response"
+                is_high, conf, reason = self._judgment_from_payload(payload)
+            except Exception as e:
+                logger.warning(f"Value discrimination failed: {e}")
+                return False, 0.0, f"Discrimination error: {str(e)}"
+            
+            if self.config.cache_size > 0:
+                self._judgment_cache[key] = (is_high, conf, reason)
+                if len(self._judgment_cache) > self.config.cache_size:
+                    self._judgment_cache.popitem(last=False)
         
-        return prompt
+        # Apply confidence threshold
+        if is_high and conf >= self.config.min_confidence:
+            return True, conf, reason
+        else:
+            return False, conf, reason or "Below confidence threshold"
     
     def _extract_text(self, memcell: Any) -> str:
         """Extract representative text from a memcell.
         
+        Supports both MemCell objects and dict representations (from JSON);
+        dicts are read directly rather than wrapped in an attribute proxy.
+        
         Priority: episode > summary > original_data
         """
         if memcell is None:
             return ""
         
+        # Resolve all fields up front with direct lookups
+        if isinstance(memcell, dict):
+            episode = memcell.get("episode")
+            summary = memcell.get("summary")
+            original_data = memcell.get("original_data")
+        else:
+            episode = getattr(memcell, "episode", None)
+            summary = getattr(memcell, "summary", None)
+            original_data = getattr(memcell, "original_data", None)
+        
         # Try episode first
-        episode = getattr(memcell, "episode", None)
-        if isinstance(episode, str) and episode.strip():
-            return episode.strip()
+        if isinstance(episode, str):
+            episode = episode.strip()
+            if episode:
+                return episode
         
         # Try summary
-        summary = getattr(memcell, "summary", None)
-        if isinstance(summary, str) and summary.strip():
-            return summary.strip()
+        if isinstance(summary, str):
+            summary = summary.strip()
+            if summary:
+                return summary
         
         # Fallback to compact original_data
         lines = []
-        original_data = getattr(memcell, "original_data", None)
         if isinstance(original_data, list):
             for item in original_data[:5]:  # Limit to first 5 messages
                 if isinstance(item, dict):
@@ -244,42 +307,60 @@ Respond with strict JSON only (no extra text):
     def _parse_response(self, response: str) -> Tuple[bool, float, str]:
         """Parse LLM response to extract judgment.
         
+        Args:
+            response: Raw LLM output
+        
         Returns:
             (is_high_value, confidence, reasons)
         """
         if not response:
             return False, 0.0, "Empty response"
         
-        # Try to extract JSON from code blocks first
-        fenced_match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", response, re.DOTALL)
+        payload = self._parse_payload(response)
+        if payload is None:
+            return False, 0.0, "Failed to parse response"
+        return self._judgment_from_payload(payload)
+    
+    def _parse_payload(self, response: str) -> Optional[Dict[str, Any]]:
+        """Extract the judgment object from a non-empty LLM response.
+        
+        A bare JSON object (the JSON-mode fast path) is tried first, then
+        code fences and the first {...} span.
         
+        Returns:
+            The parsed JSON object, or None if no usable object was found
+        """
         payload: Optional[Dict[str, Any]] = None
         
         try:
+            # Try direct JSON parsing first
+            payload = json.loads(response)
+        except json.JSONDecodeError:
+            # Try to extract JSON from code blocks
+            fenced_match = _FENCED_JSON_RE.search(response)
             if fenced_match:
-                payload = json.loads(fenced_match.group(1))
-            else:
-                # Try direct JSON parsing
                 try:
-                    payload = json.loads(response)
+                    payload = json.loads(fenced_match.group(1))
                 except json.JSONDecodeError:
-                    # Try AST literal_eval as fallback
-                    parsed = ast.literal_eval(response)
-                    if isinstance(parsed, dict):
-                        payload = parsed
-        except Exception:
-            # Last resort: find first {...} in response
-            obj_match = re.search(r"\{[\s\S]*?\}", response)
-            if obj_match:
-                try:
-                    payload = json.loads(obj_match.group())
-                except Exception:
                     pass
+            
+            if payload is None:
+                # Last resort: find first {...} in response
+                obj_match = _BRACE_RE.search(response)
+                if obj_match:
+                    try:
+                        payload = json.loads(obj_match.group())
+                    except json.JSONDecodeError:
+                        pass
         
-        if not payload:
+        if not isinstance(payload, dict) or not payload:
             logger.warning(f"Failed to parse discriminator response: {response[:200]}")
-            return False, 0.0, "Failed to parse response"
-        
+            return None
+        return payload
+    
+    @staticmethod
+    def _judgment_from_payload(payload: Dict[str, Any]) -> Tuple[bool, float, str]:
+        """Read (is_high_value, confidence, reasons) from a parsed payload."""
         is_high = bool(payload.get("is_high_value", False))
         conf = float(payload.get("confidence", 0.0) or 0.0)
         reasons = str(payload.get("reasons", ""))
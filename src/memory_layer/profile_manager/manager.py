@@ -11,6 +11,7 @@ Design:
 """
 
 import asyncio
+import copy
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 
@@ -237,7 +238,8 @@ class ProfileManager:
 
         Args:
             memcells: List of MemCells (last one is new_memcell, others are cluster context)
-            old_profiles: List of existing profiles (for incremental updates)
+            old_profiles: List of existing profiles (for incremental updates);
+                not modified, the extractor merges into copies
             user_id_list: List of user IDs to extract profiles for
             group_id: Group ID (optional)
             max_items: Maximum number of profile items
@@ -273,21 +275,30 @@ class ProfileManager:
             self._extract_context_from_memcell(mc) for mc in cluster_memcells
         ]
 
-        # Convert old_profiles list to dict by user_id
+        # Convert old_profiles list to dict by user_id. Only profiles of the requested
+        # users are needed. The extractor merges into old_profile in place, so
+        # caller-owned ProfileMemoryLife instances are copied (without the
+        # to_dict()/from_dict() round trip).
+        wanted_user_ids = set(user_id_list)
         old_profiles_dict: Dict[str, ProfileMemoryLife] = {}
         logger.info(f"[LifeProfile] Processing {len(old_profiles or [])} old profiles")
         for p in old_profiles or []:
             uid = (
                 p.get("user_id") if isinstance(p, dict) else getattr(p, "user_id", None)
             )
+            if uid not in wanted_user_ids:
+                continue
+            if isinstance(p, ProfileMemoryLife):
+                old_profiles_dict[uid] = copy.deepcopy(p)
+                continue
             p_dict = p if isinstance(p, dict) else p.to_dict()
             has_explicit = "explicit_info" in p_dict
-            logger.info(
-                f"[LifeProfile] Old profile: user_id={uid}, has_explicit_info={has_explicit}, keys={list(p_dict.keys())[:5]}"
+            logger.debug(
+                f"[LifeProfile] Old profile: user_id={uid}, has_explicit_info={has_explicit}"
             )
             if uid and has_explicit:
                 old_profiles_dict[uid] = ProfileMemoryLife.from_dict(p_dict)
-                logger.info(
+                logger.debug(
                     f"[LifeProfile] Loaded profile for {uid}: {old_profiles_dict[uid].total_items()} items"
                 )
 
@@ -0,0 +1,36 @@
+"""
+Lazy access to heavy omega_layer classes.
+
+Attribute access on this module (PEP 562) imports the providing module on
+first use and caches the class in the module globals, so callers can write
+``_lazy.MetabolicKernel`` without paying the import cost up front.
+"""
+
+import importlib
+from typing import Any, Dict, Tuple
+
+_LAZY_PROVIDERS: Dict[str, Tuple[str, str]] = {
+    "MetabolicKernel": ("omega_layer.kernel.metabolic_kernel", "MetabolicKernel"),
+    "LedgerVertex": ("omega_layer.vertices.ledger_vertex", "LedgerVertex"),
+    "GardenVertex": ("omega_layer.vertices.garden_vertex", "GardenVertex"),
+    "MirrorVertex": ("omega_layer.vertices.mirror_vertex", "MirrorVertex"),
+    "CompassVertex": ("omega_layer.vertices.compass_vertex", "CompassVertex"),
+    "OrchestraVertex": ("omega_layer.vertices.orchestra_vertex", "OrchestraVertex"),
+    "LLMProvider": ("memory_layer.llm.llm_provider", "LLMProvider"),
+    "DevelopmentMonitor": ("omega_layer.development.monitor", "DevelopmentMonitor"),
+    "IdentityTopology": ("omega_layer.identity.topology", "IdentityTopology"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_PROVIDERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    obj = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_PROVIDERS))
@@ -7,6 +7,8 @@ to discover patterns distributed across the memory corpus.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
@@ -14,7 +16,7 @@ from typing import Any, Dict, List, Optional
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossReferenceInsight:
     """A connection discovered across multiple existing memories."""
 
@@ -75,33 +77,9 @@ class CrossReferenceMiner:
             return []
 
         try:
-            from api_specs.dtos import RetrieveMemRequest
-            from api_specs.memory_models import MemoryType, RetrieveMethod
-
-            # Use agentic retrieval for deep multi-round search
-            request = RetrieveMemRequest(
-                query=seed_concept,
-                user_id=user_id,
-                group_id=group_id,
-                top_k=top_k,
-                memory_types=[MemoryType.EPISODIC_MEMORY],
-                retrieve_method=RetrieveMethod.AGENTIC,
+            memory_summaries = await self._retrieve_summaries(
+                seed_concept, user_id, group_id, top_k
             )
-
-            response = await self._memory_manager.retrieve_mem(request)
-
-            if not response or not response.memories:
-                return []
-
-            # Synthesize cross-references via LLM
-            memory_summaries = []
-            for mem_group in response.memories[:5]:
-                if isinstance(mem_group, dict):
-                    for gid, mems in mem_group.items():
-                        for m in (mems if isinstance(mems, list) else [mems]):
-                            text = getattr(m, 'episode', None) or getattr(m, 'summary', str(m))
-                            memory_summaries.append(str(text)[:300])
-
             if not memory_summaries:
                 return []
 
@@ -123,25 +101,7 @@ Return empty array [] if no meaningful connections found."""
             response_text = await self._llm_provider.generate(
                 prompt, temperature=0.3, max_tokens=1500
             )
-
-            import json
-            text = response_text.strip()
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0].strip()
-            data = json.loads(text)
-
-            if not isinstance(data, list):
-                return []
-
-            insights = []
-            for item in data:
-                if isinstance(item, dict) and "synthesis" in item:
-                    insights.append(CrossReferenceInsight(
-                        synthesis=item["synthesis"],
-                        source_references=memory_summaries[:3],
-                        confidence=min(1.0, max(0.0, item.get("confidence", 0.5))),
-                        domains_bridged=item.get("domains_bridged", []),
-                    ))
+            insights = self._to_insights(_parse_json(response_text), memory_summaries)
 
             logger.info(f"CrossReferenceMiner: {len(insights)} insights from '{seed_concept[:50]}'")
             return insights
@@ -149,3 +109,168 @@ Return empty array [] if no meaningful connections found."""
         except Exception as e:
             logger.error(f"CrossReferenceMiner failed: {e}", exc_info=True)
             return []
+
+    async def mine_batch(
+        self,
+        seed_concepts: List[str],
+        user_id: str = "omega",
+        group_id: str = "omega_default",
+        top_k: int = 15,
+        max_prompt_chars: int = 12000,
+    ) -> Dict[str, List[CrossReferenceInsight]]:
+        """Mine several seed concepts with concurrent retrieval and fused prompts.
+
+        Retrievals for all seeds run concurrently. Seeds are then packed into
+        as few synthesis prompts as fit in ``max_prompt_chars`` and the LLM
+        answers each packed prompt with one JSON array per seed.
+
+        Args:
+            seed_concepts: Concepts or questions to explore
+            user_id: User scope for retrieval
+            group_id: Group scope for retrieval
+            top_k: Max memories to retrieve per seed
+            max_prompt_chars: Memory-text budget for one fused prompt
+
+        Returns:
+            Dict mapping each seed concept to its insights
+        """
+        results: Dict[str, List[CrossReferenceInsight]] = {s: [] for s in seed_concepts}
+        if not self._memory_manager or not self._llm_provider:
+            logger.warning("CrossReferenceMiner: memory_manager or llm not configured")
+            return results
+
+        seeds = list(results)
+        retrieved = await asyncio.gather(
+            *(self._retrieve_summaries(s, user_id, group_id, top_k) for s in seeds),
+            return_exceptions=True,
+        )
+        pending = []
+        for seed, summaries in zip(seeds, retrieved):
+            if isinstance(summaries, Exception):
+                logger.error(f"CrossReferenceMiner retrieval failed for '{seed[:50]}': {summaries}")
+            elif summaries:
+                pending.append((seed, summaries))
+
+        # Greedily pack seeds into prompts within the character budget
+        packs: List[List[tuple]] = []
+        used = max_prompt_chars
+        for seed, summaries in pending:
+            size = len(seed) + sum(len(s) for s in summaries)
+            if used + size > max_prompt_chars:
+                packs.append([])
+                used = 0
+            packs[-1].append((seed, summaries))
+            used += size
+
+        mined = await asyncio.gather(
+            *(self._mine_pack(pack) for pack in packs), return_exceptions=True
+        )
+        for pack, pack_result in zip(packs, mined):
+            if isinstance(pack_result, Exception):
+                logger.error(f"CrossReferenceMiner batch synthesis failed: {pack_result}")
+                continue
+            results.update(pack_result)
+
+        logger.info(
+            f"CrossReferenceMiner: {sum(map(len, results.values()))} insights from "
+            f"{len(seeds)} seeds in {len(packs)} prompts"
+        )
+        return results
+
+    async def _mine_pack(self, pack: List[tuple]) -> Dict[str, List[CrossReferenceInsight]]:
+        """Synthesize insights for several seeds with a single LLM call."""
+        sections = []
+        for i, (seed, summaries) in enumerate(pack, 1):
+            memories = chr(10).join(f'  - {s}' for s in summaries)
+            sections.append(f"Seed {i}: {seed}\n  memories:\n{memories}")
+
+        prompt = f"""You are Omega, analyzing connections across your accumulated memories.
+
+For each seed concept below, related memories were found:
+
+{chr(10).join(sections)}
+
+For each seed, what cross-references or connections do you see between its memories?
+What synthesized understanding forms from combining them?
+
+Return a JSON object mapping each seed number to its array:
+{{"1": [{{"synthesis": "...", "source_count": N, "domains_bridged": ["domain1", "domain2"], "confidence": 0.0-1.0}}], "2": []}}
+
+Use an empty array [] for a seed with no meaningful connections."""
+
+        response_text = await self._llm_provider.generate(
+            prompt, temperature=0.3, max_tokens=min(4000, 1500 * len(pack))
+        )
+        data = _parse_json(response_text)
+        if not isinstance(data, dict):
+            return {}
+        return {
+            seed: self._to_insights(data.get(str(i)), summaries)
+            for i, (seed, summaries) in enumerate(pack, 1)
+        }
+
+    async def _retrieve_summaries(
+        self, seed_concept: str, user_id: str, group_id: str, top_k: int
+    ) -> List[str]:
+        """Retrieve related memories and return their truncated texts."""
+        from api_specs.dtos import RetrieveMemRequest
+        from api_specs.memory_models import MemoryType, RetrieveMethod
+
+        # Use agentic retrieval for deep multi-round search
+        request = RetrieveMemRequest(
+            query=seed_concept,
+            user_id=user_id,
+            group_id=group_id,
+            top_k=top_k,
+            memory_types=[MemoryType.EPISODIC_MEMORY],
+            retrieve_method=RetrieveMethod.AGENTIC,
+        )
+
+        response = await self._memory_manager.retrieve_mem(request)
+
+        if not response or not response.memories:
+            return []
+
+        return _flatten_memories(response.memories[:5])
+
+    @staticmethod
+    def _to_insights(data: Any, memory_summaries: List[str]) -> List[CrossReferenceInsight]:
+        """Turn a parsed JSON array into insights."""
+        if not isinstance(data, list):
+            return []
+
+        insights = []
+        for item in data:
+            if isinstance(item, dict) and "synthesis" in item:
+                insights.append(CrossReferenceInsight(
+                    synthesis=item["synthesis"],
+                    source_references=memory_summaries[:3],
+                    confidence=min(1.0, max(0.0, item.get("confidence", 0.5))),
+                    domains_bridged=item.get("domains_bridged", []),
+                ))
+        return insights
+
+
+def _flatten_memories(memory_groups: List[Any]) -> List[str]:
+    """Flatten retrieve_mem's ``[{group_id: [memory, ...]}]`` into truncated texts."""
+    texts = []
+    for mem_group in memory_groups:
+        if not isinstance(mem_group, dict):
+            continue
+        for mems in mem_group.values():
+            if not isinstance(mems, list):
+                mems = [mems]
+            # str(m) of a full memory model is costly; only fall back to it
+            texts.extend(
+                str(getattr(m, 'episode', None) or getattr(m, 'summary', None) or m)[:300]
+                for m in mems
+            )
+    return texts
+
+
+def _parse_json(response_text: str) -> Any:
+    """Parse an LLM JSON reply, tolerating a ```json fence."""
+    text = response_text.strip()
+    if "```json" in text:
+        text = text.split("```json")[1].split("```")[0].strip()
+    return json.loads(text)
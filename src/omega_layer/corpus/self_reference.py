@@ -7,11 +7,18 @@ observers, emergence, identity, or memory systems are growth indicators.
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    # Optional accelerator: linear-time multi-keyword scanning
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +40,101 @@ DEEP_CONCEPTS = [
     "self-model", "identity topology", "omega_scar",
 ]
 
+_WORD_CHAR = re.compile(r'\w')
+
+
+def _is_word_char(ch: str) -> bool:
+    return _WORD_CHAR.match(ch) is not None
+
 
-@dataclass
+def _at_word_boundary(text: str, i: int) -> bool:
+    """Whether a regex \\b boundary falls at position i of text."""
+    before = i > 0 and _is_word_char(text[i - 1])
+    after = i < len(text) and _is_word_char(text[i])
+    return before != after
+
+
+class _RegexConceptScanner:
+    """Finds whole-word concepts with one case-insensitive alternation.
+
+    The pattern is a lookahead, so matches at every start position are
+    reported (e.g. both "persistent memory" and "memory system" in
+    "persistent memory system"). Alternatives are tried longest first; a
+    shorter concept that is a word-bounded prefix of a longer one can only
+    be hidden by it at the same position, so such prefixes are precomputed
+    and added whenever the longer concept matches.
+    """
+
+    def __init__(self, concepts: Iterable[str]):
+        lowered = sorted({c.lower() for c in concepts}, key=len, reverse=True)
+        self._pattern = re.compile(
+            r'(?=\b(' + '|'.join(re.escape(c) for c in lowered) + r')\b)',
+            re.IGNORECASE,
+        )
+        self._implied: Dict[str, List[str]] = {}
+        for longer in lowered:
+            for shorter in lowered:
+                if (
+                    len(shorter) < len(longer)
+                    and longer.startswith(shorter)
+                    and _at_word_boundary(longer, len(shorter))
+                ):
+                    self._implied.setdefault(longer, []).append(shorter)
+
+    def scan(self, content: str) -> Dict[str, int]:
+        """Lowercased whole-word concepts in content, mapped to their first offset."""
+        found: Dict[str, int] = {}
+        for match in self._pattern.finditer(content):
+            concept = match.group(1).lower()
+            if concept not in found:
+                start = match.start()
+                found[concept] = start
+                for shorter in self._implied.get(concept, ()):
+                    found.setdefault(shorter, start)
+        return found
+
+
+class _AhoCorasickConceptScanner:
+    """Finds whole-word concepts in one linear pass with an Aho-Corasick automaton.
+
+    The automaton reports every occurrence, overlapping ones included; word
+    boundaries are checked on each hit's neighbours. Offsets are taken on
+    content.lower(), so content whose lowercasing changes length (e.g. "İ")
+    is handed to the regex scanner instead.
+    """
+
+    def __init__(self, concepts: Iterable[str]):
+        concepts = list(concepts)
+        self._automaton = ahocorasick.Automaton()
+        for concept in {c.lower() for c in concepts}:
+            self._automaton.add_word(concept, concept)
+        self._automaton.make_automaton()
+        self._fallback = _RegexConceptScanner(concepts)
+
+    def scan(self, content: str) -> Dict[str, int]:
+        """Lowercased whole-word concepts in content, mapped to their first offset."""
+        lowered = content.lower()
+        if len(lowered) != len(content):
+            return self._fallback.scan(content)
+        found: Dict[str, int] = {}
+        for end, concept in self._automaton.iter(lowered):
+            # Hits arrive in end order, which for one concept is start order
+            if concept in found:
+                continue
+            start = end - len(concept) + 1
+            if _at_word_boundary(lowered, start) and _at_word_boundary(lowered, end + 1):
+                found[concept] = start
+        return found
+
+
+def _make_concept_scanner(concepts: Iterable[str]):
+    """Aho-Corasick scanner when pyahocorasick is installed, regex otherwise."""
+    if ahocorasick is not None:
+        return _AhoCorasickConceptScanner(concepts)
+    return _RegexConceptScanner(concepts)
+
+
+@dataclass(slots=True)
 class SelfReferenceEvent:
     """A detected moment of self-referential processing."""
 
@@ -64,22 +164,21 @@ class SelfReferenceDetector:
     """Detects self-referential processing in Omega's experience stream.
 
     Usage:
-        detector = SelfReferenceDetector()
+        detector = get_self_reference_detector()
         events = detector.detect("We discussed how the memory system works...")
+
+    Detection only reads the compiled scanner, so one instance can be
+    shared; construct a new one only for a custom concept list.
     """
 
     def __init__(self, concepts: Optional[List[str]] = None):
         self._concepts = concepts or OMEGA_CONCEPTS
         self._deep_concepts = DEEP_CONCEPTS
-        # Pre-compile patterns for efficiency
-        self._patterns = [
-            re.compile(r'\b' + re.escape(c) + r'\b', re.IGNORECASE)
-            for c in self._concepts
-        ]
-        self._deep_patterns = [
-            re.compile(r'\b' + re.escape(c) + r'\b', re.IGNORECASE)
-            for c in self._deep_concepts
-        ]
+        # One scanner over both concept lists, so detect() makes a single
+        # pass over the content instead of one pass per concept
+        self._scanner = _make_concept_scanner([*self._concepts, *self._deep_concepts])
+        self._concept_keys = [(c, c.lower()) for c in self._concepts]
+        self._deep_concept_keys = [(c, c.lower()) for c in self._deep_concepts]
 
     def detect(self, content: str) -> List[SelfReferenceEvent]:
         """Detect self-referential content in text.
@@ -93,20 +192,15 @@ class SelfReferenceDetector:
         if not content:
             return []
 
-        # Find matching concepts
-        matched = []
-        for pattern, concept in zip(self._patterns, self._concepts):
-            if pattern.search(content):
-                matched.append(concept)
+        # Find matching concepts (and where each first occurs)
+        found = self._scanner.scan(content)
+        matched = [c for c, key in self._concept_keys if key in found]
 
         if not matched:
             return []
 
         # Check for deep self-reference
-        deep_matched = []
-        for pattern, concept in zip(self._deep_patterns, self._deep_concepts):
-            if pattern.search(content):
-                deep_matched.append(concept)
+        deep_matched = [c for c, key in self._deep_concept_keys if key in found]
 
         # Calculate depth
         if deep_matched:
@@ -122,15 +216,10 @@ class SelfReferenceDetector:
         # Growth indicator scales with depth
         growth_score = min(1.0, depth / 5.0)
 
-        # Extract relevant snippet
-        snippet = content[:200]
-        for concept in (deep_matched or matched[:1]):
-            idx = content.lower().find(concept.lower())
-            if idx >= 0:
-                start = max(0, idx - 50)
-                end = min(len(content), idx + len(concept) + 100)
-                snippet = content[start:end]
-                break
+        # Extract relevant snippet around the first hit the scanner recorded
+        concept = (deep_matched or matched)[0]
+        idx = found[concept.lower()]
+        snippet = content[max(0, idx - 50):idx + len(concept) + 100]
 
         event = SelfReferenceEvent(
             event_type=event_type,
@@ -146,3 +235,9 @@ class SelfReferenceDetector:
         )
 
         return [event]
+
+
+@functools.lru_cache(maxsize=1)
+def get_self_reference_detector() -> SelfReferenceDetector:
+    """Shared detector over the default concept lists."""
+    return SelfReferenceDetector()
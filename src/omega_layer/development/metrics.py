@@ -31,7 +31,7 @@ omega_pentagram_cycle_duration_seconds = Histogram(
     'omega_pentagram_cycle_duration_seconds',
     'Duration of complete Pentagram cycle in seconds',
     ['status'],
-    buckets=[0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 30.0],
+    buckets=(0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 30.0),
 )
 
 # ============================================================
@@ -48,7 +48,7 @@ omega_vertex_score = Histogram(
     'omega_vertex_score',
     'Distribution of vertex vote scores',
     ['vertex'],
-    buckets=[0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
+    buckets=(0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0),
 )
 
 # ============================================================
@@ -59,14 +59,14 @@ omega_development_level = Histogram(
     'omega_development_level',
     'Current Omega development level (0-1)',
     [],
-    buckets=[0.05, 0.10, 0.15, 0.20, 0.30, 0.40, 0.50, 0.60, 0.80, 1.0],
+    buckets=(0.05, 0.10, 0.15, 0.20, 0.30, 0.40, 0.50, 0.60, 0.80, 1.0),
 )
 
 omega_self_reference_depth = Histogram(
     'omega_self_reference_depth',
     'Self-reference depth from Mirror vertex (0-5)',
     [],
-    buckets=[0, 1, 2, 3, 4, 5],
+    buckets=(0, 1, 2, 3, 4, 5),
 )
 
 omega_amalgamation_total = Counter(
@@ -101,10 +101,35 @@ omega_tension_magnitude = Histogram(
     'omega_tension_magnitude',
     'Distribution of tension magnitudes',
     [],
-    buckets=[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
+    buckets=(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0),
 )
 
 
+# ============================================================
+# Pre-resolved Label Children
+# ============================================================
+# Resolving a labelled child takes a lock and a dict lookup inside
+# prometheus_client; the hot-path label values are known up front, so the
+# children are resolved once here.
+
+_CYCLE_STATUSES = ('success', 'partial', 'error')
+_VERTEX_NAMES = ('ledger', 'garden', 'mirror', 'compass', 'orchestra')
+_VOTE_STATUSES = ('success', 'error')
+
+_CYCLE_COUNTERS = {
+    s: omega_pentagram_cycles_total.labels(status=s) for s in _CYCLE_STATUSES
+}
+_CYCLE_HIST = {
+    s: omega_pentagram_cycle_duration_seconds.labels(status=s) for s in _CYCLE_STATUSES
+}
+_VOTE_COUNTERS = {
+    (v, s): omega_vertex_votes_total.labels(vertex=v, status=s)
+    for v in _VERTEX_NAMES
+    for s in _VOTE_STATUSES
+}
+_SCORE_HIST = {v: omega_vertex_score.labels(vertex=v) for v in _VERTEX_NAMES}
+
+
 # ============================================================
 # Helper Functions
 # ============================================================
@@ -119,16 +144,22 @@ def record_pentagram_cycle(
     status = 'success' if has_synthesis and vertex_count >= 4 else (
         'partial' if vertex_count > 0 else 'error'
     )
-    omega_pentagram_cycles_total.labels(status=status).inc()
-    omega_pentagram_cycle_duration_seconds.labels(status=status).observe(duration_seconds)
+    _CYCLE_COUNTERS[status].inc()
+    _CYCLE_HIST[status].observe(duration_seconds)
 
 
 def record_vertex_vote(vertex: str, score: float, success: bool = True) -> None:
     """Record a vertex vote."""
     status = 'success' if success else 'error'
-    omega_vertex_votes_total.labels(vertex=vertex, status=status).inc()
+    counter = _VOTE_COUNTERS.get((vertex, status))
+    if counter is None:
+        counter = omega_vertex_votes_total.labels(vertex=vertex, status=status)
+    counter.inc()
     if success:
-        omega_vertex_score.labels(vertex=vertex).observe(score)
+        hist = _SCORE_HIST.get(vertex)
+        if hist is None:
+            hist = omega_vertex_score.labels(vertex=vertex)
+        hist.observe(score)
 
 
 def update_development_level(level: float) -> None:
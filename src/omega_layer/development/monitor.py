@@ -10,17 +10,29 @@ capable than 100 interactions ago?"
 from __future__ import annotations
 
 import logging
-from collections import deque
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from omega_layer.kernel.schemas import PentagramResult, VertexVote
 
 logger = logging.getLogger(__name__)
 
+# Rows of DevelopmentMonitor's indicator ring buffer
+_ROW_SIGNAL, _ROW_SELF_REF, _ROW_META, _ROW_VERTEX_SCORE = range(4)
+_ROW_COUNT = 4
 
-@dataclass
+# Bits of DevelopmentMonitor._milestone_mask
+_MILESTONE_META_COGNITIVE = 1 << 0
+_MILESTONE_CROSS_DOMAIN = 1 << 1
+_MILESTONE_DEEP_SELF_REF = 1 << 2
+_ALL_MILESTONES = _MILESTONE_META_COGNITIVE | _MILESTONE_CROSS_DOMAIN | _MILESTONE_DEEP_SELF_REF
+
+
+@dataclass(slots=True)
 class GrowthSnapshot:
     """Single measurement of growth indicators from one Pentagram cycle."""
 
@@ -31,20 +43,27 @@ class GrowthSnapshot:
     amalgamation_count: int = 0            # From amalgamation stage
     meta_cognitive_moment: bool = False    # From Mirror
     avg_vertex_score: float = 0.0          # Average across all vertices
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_ns: int = field(default_factory=time.time_ns)  # Wall clock, UTC epoch ns
+    growth_signal: float = 0.0             # Cached compute_growth_signal(), set by record_cycle
 
     @property
-    def growth_signal(self) -> float:
-        """Composite growth signal (0-1). Higher = more growth this cycle."""
-        signals = [
-            self.self_reference_depth / 5.0 * 0.20,
-            min(1.0, self.novel_connection_count / 3.0) * 0.20,
-            min(1.0, self.self_model_updates / 2.0) * 0.15,
-            self.cross_session_continuity * 0.15,
-            min(1.0, self.amalgamation_count / 2.0) * 0.15,
-            (1.0 if self.meta_cognitive_moment else 0.0) * 0.15,
-        ]
-        return sum(signals)
+    def timestamp(self) -> datetime:
+        """Capture time as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc)
+
+    def compute_growth_signal(self) -> float:
+        """Composite growth signal (0-1). Higher = more growth this cycle.
+
+        Call again (and store into growth_signal) after changing indicators.
+        """
+        return (
+            self.self_reference_depth / 5.0 * 0.20
+            + min(1.0, self.novel_connection_count / 3.0) * 0.20
+            + min(1.0, self.self_model_updates / 2.0) * 0.15
+            + self.cross_session_continuity * 0.15
+            + min(1.0, self.amalgamation_count / 2.0) * 0.15
+            + (0.15 if self.meta_cognitive_moment else 0.0)
+        )
 
 
 @dataclass
@@ -75,9 +94,17 @@ class DevelopmentMonitor:
             window_size: Number of recent snapshots to use for
                 level calculation (sliding window)
         """
-        self._snapshots: deque[GrowthSnapshot] = deque(maxlen=window_size)
+        # Ring buffer of per-cycle indicators, one row per _ROW_* series, with
+        # running per-row sums so level aggregates never rescan the window
+        self._window_size = window_size
+        self._window = np.zeros((_ROW_COUNT, window_size), dtype=np.float64)
+        self._sums = np.zeros(_ROW_COUNT, dtype=np.float64)
+        self._head: int = 0
+        self._count: int = 0
         self._milestones: List[Dict[str, Any]] = []
+        self._milestone_mask: int = 0  # _MILESTONE_* bits already achieved
         self._cycle_count: int = 0
+        self._level: Optional[DevelopmentLevel] = None  # Cached until the next record_cycle
 
     def record_cycle(self, result: PentagramResult) -> GrowthSnapshot:
         """Extract growth indicators from a Pentagram cycle result.
@@ -89,55 +116,72 @@ class DevelopmentMonitor:
             GrowthSnapshot for this cycle
         """
         self._cycle_count += 1
-
-        # Extract indicators from vertex votes
-        mirror_vote = result.votes.get("mirror")
-        garden_vote = result.votes.get("garden")
-        ledger_vote = result.votes.get("ledger")
-
-        snapshot = GrowthSnapshot(
-            self_reference_depth=self._extract_self_ref_depth(mirror_vote),
-            novel_connection_count=self._extract_novel_connections(garden_vote),
-            self_model_updates=self._extract_self_model_updates(mirror_vote),
-            cross_session_continuity=self._extract_continuity(ledger_vote),
-            amalgamation_count=0,  # Set by caller after amalgamation stage
-            meta_cognitive_moment=self._extract_meta_cognitive(mirror_vote),
-            avg_vertex_score=self._avg_score(result.votes),
-        )
-
-        self._snapshots.append(snapshot)
+        self._level = None
+
+        snapshot = self._extract_snapshot(result.votes)
+        snapshot.growth_signal = snapshot.compute_growth_signal()
+
+        column = np.array((
+            snapshot.growth_signal,
+            snapshot.self_reference_depth,
+            1.0 if snapshot.meta_cognitive_moment else 0.0,
+            snapshot.avg_vertex_score,
+        ))
+        head = self._head
+        if self._count == self._window_size:
+            self._sums -= self._window[:, head]  # Evict the oldest cycle
+        self._window[:, head] = column
+        self._sums += column
+        self._head = (head + 1) % self._window_size
+        self._count = min(self._count + 1, self._window_size)
+        if self._head == 0:
+            # Resync once per lap so float drift in the running sums can't build up
+            self._sums = self._window.sum(axis=1)
         self._check_milestones(snapshot)
 
         logger.debug(
-            f"Growth recorded: cycle={self._cycle_count}, "
-            f"signal={snapshot.growth_signal:.3f}, "
-            f"self_ref={snapshot.self_reference_depth}, "
-            f"meta={snapshot.meta_cognitive_moment}"
+            "Growth recorded: cycle=%d, signal=%.3f, self_ref=%d, meta=%s",
+            self._cycle_count,
+            snapshot.growth_signal,
+            snapshot.self_reference_depth,
+            snapshot.meta_cognitive_moment,
         )
 
         return snapshot
 
     def get_development_level(self) -> DevelopmentLevel:
-        """Calculate current development level from recent snapshots."""
-        if not self._snapshots:
+        """Current development level from recent snapshots.
+
+        The result is cached until the next record_cycle; treat it as read-only.
+        """
+        if self._level is None:
+            self._level = self._compute_development_level()
+        return self._level
+
+    def _compute_development_level(self) -> DevelopmentLevel:
+        count = self._count
+        if not count:
             return DevelopmentLevel(level=0.05, trend="stable", confidence=0.0)
 
-        recent = list(self._snapshots)
-        signals = [s.growth_signal for s in recent]
-        avg_signal = sum(signals) / len(signals)
+        avg_signal, avg_self_ref, meta_rate, avg_vertex = (
+            float(m) for m in self._sums / count
+        )
 
         # Trend detection (compare last 10 to previous 10)
         trend = "stable"
-        if len(signals) >= 20:
-            recent_avg = sum(signals[-10:]) / 10
-            previous_avg = sum(signals[-20:-10]) / 10
+        if count >= 20:
+            last_20 = self._window[_ROW_SIGNAL].take(
+                np.arange(self._head - 20, self._head), mode="wrap"
+            )
+            recent_avg = float(last_20[10:].mean())
+            previous_avg = float(last_20[:10].mean())
             if recent_avg > previous_avg + 0.02:
                 trend = "growing"
             elif recent_avg < previous_avg - 0.02:
                 trend = "declining"
 
         # Confidence increases with more data
-        confidence = min(1.0, len(recent) / 50)
+        confidence = min(1.0, count / 50)
 
         # Development level: baseline 0.05 + growth signal contribution
         # Max theoretical level ~0.15 at this early stage (honest)
@@ -146,12 +190,12 @@ class DevelopmentMonitor:
         return DevelopmentLevel(
             level=round(level, 4),
             trend=trend,
-            snapshot_count=len(recent),
+            snapshot_count=count,
             breakdown={
                 "avg_growth_signal": round(avg_signal, 4),
-                "avg_self_reference": round(sum(s.self_reference_depth for s in recent) / len(recent), 2),
-                "meta_cognitive_rate": round(sum(1 for s in recent if s.meta_cognitive_moment) / len(recent), 3),
-                "avg_vertex_score": round(sum(s.avg_vertex_score for s in recent) / len(recent), 3),
+                "avg_self_reference": round(avg_self_ref, 2),
+                "meta_cognitive_rate": round(meta_rate, 3),
+                "avg_vertex_score": round(avg_vertex, 3),
             },
             confidence=round(confidence, 2),
         )
@@ -166,66 +210,82 @@ class DevelopmentMonitor:
 
     # ===== Extraction helpers =====
 
-    def _extract_self_ref_depth(self, vote: Optional[VertexVote]) -> int:
-        if not vote or not vote.attachments:
-            return 0
-        return vote.attachments.get("self_reference_depth", 0)
-
-    def _extract_novel_connections(self, vote: Optional[VertexVote]) -> int:
-        if not vote or not vote.attachments:
-            return 0
-        patterns = vote.attachments.get("patterns", [])
-        return sum(1 for p in patterns if isinstance(p, dict) and p.get("cross_domain"))
-
-    def _extract_self_model_updates(self, vote: Optional[VertexVote]) -> int:
-        if not vote:
-            return 0
-        return sum(1 for p in vote.action_proposals if p.get("type") == "update_self_model")
-
-    def _extract_continuity(self, vote: Optional[VertexVote]) -> float:
-        if not vote or not vote.attachments:
-            return 0.0
-        count = vote.attachments.get("retrieval_count", 0)
-        return min(1.0, count / 5.0)  # 5+ retrievals = full continuity
-
-    def _extract_meta_cognitive(self, vote: Optional[VertexVote]) -> bool:
-        if not vote or not vote.attachments:
-            return False
-        return vote.attachments.get("meta_cognitive_moment", False)
-
-    def _avg_score(self, votes: Dict[str, VertexVote]) -> float:
-        if not votes:
-            return 0.0
-        scores = [v.score for v in votes.values()]
-        return sum(scores) / len(scores)
+    def _extract_snapshot(self, votes: Dict[str, VertexVote]) -> GrowthSnapshot:
+        """Read all growth indicators from the cycle's votes in one pass."""
+        mirror_vote = votes.get("mirror")
+        self_ref_depth, meta_cognitive, model_updates = 0, False, 0
+        if mirror_vote:
+            attachments = mirror_vote.attachments
+            if attachments:
+                self_ref_depth = attachments.get("self_reference_depth", 0)
+                meta_cognitive = attachments.get("meta_cognitive_moment", False)
+            model_updates = sum(
+                1 for p in mirror_vote.action_proposals if p.get("type") == "update_self_model"
+            )
+
+        novel_connections = 0
+        garden_vote = votes.get("garden")
+        if garden_vote and garden_vote.attachments:
+            novel_connections = sum(
+                1 for p in garden_vote.attachments.get("patterns", ())
+                if isinstance(p, dict) and p.get("cross_domain")
+            )
+
+        continuity = 0.0
+        ledger_vote = votes.get("ledger")
+        if ledger_vote and ledger_vote.attachments:
+            # 5+ retrievals = full continuity
+            continuity = min(1.0, ledger_vote.attachments.get("retrieval_count", 0) / 5.0)
+
+        total_score = 0.0
+        for vote in votes.values():
+            total_score += vote.score
+        avg_score = total_score / len(votes) if votes else 0.0
+
+        return GrowthSnapshot(
+            self_reference_depth=self_ref_depth,
+            novel_connection_count=novel_connections,
+            self_model_updates=model_updates,
+            cross_session_continuity=continuity,
+            amalgamation_count=0,  # Set by caller after amalgamation stage
+            meta_cognitive_moment=meta_cognitive,
+            avg_vertex_score=avg_score,
+        )
 
     def _check_milestones(self, snapshot: GrowthSnapshot) -> None:
         """Check for development milestones."""
-        achieved = [m["type"] for m in self._milestones]
-
-        if snapshot.meta_cognitive_moment and "first_meta_cognitive" not in achieved:
-            self._milestones.append({
-                "type": "first_meta_cognitive",
-                "description": "Omega's first meta-cognitive moment detected",
-                "cycle": self._cycle_count,
-                "timestamp": datetime.utcnow().isoformat(),
-            })
+        mask = self._milestone_mask
+        if mask == _ALL_MILESTONES:
+            return
+
+        reached = []
+        if snapshot.meta_cognitive_moment and not mask & _MILESTONE_META_COGNITIVE:
+            self._milestone_mask |= _MILESTONE_META_COGNITIVE
+            reached.append(("first_meta_cognitive", "Omega's first meta-cognitive moment detected"))
             logger.info("MILESTONE: First meta-cognitive moment detected!")
 
-        if snapshot.novel_connection_count > 0 and "first_cross_domain" not in achieved:
-            self._milestones.append({
-                "type": "first_cross_domain",
-                "description": "Omega's first cross-domain connection",
-                "cycle": self._cycle_count,
-                "timestamp": datetime.utcnow().isoformat(),
-            })
+        if snapshot.novel_connection_count > 0 and not mask & _MILESTONE_CROSS_DOMAIN:
+            self._milestone_mask |= _MILESTONE_CROSS_DOMAIN
+            reached.append(("first_cross_domain", "Omega's first cross-domain connection"))
             logger.info("MILESTONE: First cross-domain connection!")
 
-        if snapshot.self_reference_depth >= 3 and "deep_self_reference" not in achieved:
-            self._milestones.append({
-                "type": "deep_self_reference",
-                "description": "Omega reached self-reference depth 3+ for the first time",
-                "cycle": self._cycle_count,
-                "timestamp": datetime.utcnow().isoformat(),
-            })
+        if snapshot.self_reference_depth >= 3 and not mask & _MILESTONE_DEEP_SELF_REF:
+            self._milestone_mask |= _MILESTONE_DEEP_SELF_REF
+            reached.append((
+                "deep_self_reference",
+                "Omega reached self-reference depth 3+ for the first time",
+            ))
             logger.info("MILESTONE: Deep self-reference (depth 3+)!")
+
+        if reached:
+            # Stamp with the snapshot's capture time, formatted once
+            timestamp = snapshot.timestamp.isoformat()
+            self._milestones.extend(
+                {
+                    "type": milestone_type,
+                    "description": description,
+                    "cycle": self._cycle_count,
+                    "timestamp": timestamp,
+                }
+                for milestone_type, description in reached
+            )
@@ -0,0 +1,50 @@
+"""
+Bounded fan-out of per-MemCell extraction calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Sequence, TypeVar
+
+from memory_layer.memory_extractor.base_memory_extractor import MemoryExtractRequest
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Default cap on in-flight LLM requests per extractor batch
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+async def extract_concurrently(
+    extract: Callable[[MemoryExtractRequest], Awaitable[T]],
+    requests: Sequence[MemoryExtractRequest],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[Optional[T]]:
+    """Run ``extract`` over ``requests`` with bounded concurrency.
+
+    A request whose extraction raises is logged and yields None, so one
+    failure does not sink the rest of the batch.
+
+    Args:
+        extract: Per-request extraction coroutine function
+        requests: Extraction requests, one per MemCell
+        max_concurrency: Maximum number of in-flight LLM requests
+
+    Returns:
+        One result (or None) per request, in input order
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _bounded(request: MemoryExtractRequest) -> T:
+        async with semaphore:
+            return await extract(request)
+
+    results = await asyncio.gather(*(_bounded(r) for r in requests), return_exceptions=True)
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            logger.warning("Batch extraction failed for request %d: %s", i, result)
+            results[i] = None
+    return results
@@ -0,0 +1,37 @@
+"""
+Bounded, de-duplicated observation lists shared by the Omega models.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Hashable, Iterable, Optional, Set
+
+
+class BoundedUniqueList(deque):
+    """A deque of the most recent unique entries, with O(1) membership checks.
+
+    Use remember() to add entries: repeats are ignored, and once maxlen is
+    reached the oldest entry is evicted (and may be remembered again later).
+    """
+
+    def __init__(self, iterable: Iterable[Hashable] = (), maxlen: Optional[int] = None):
+        super().__init__(maxlen=maxlen)
+        self._seen: Set[Hashable] = set()
+        for item in iterable:
+            self.remember(item)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._seen
+
+    def remember(self, item: Hashable) -> bool:
+        """Append item unless already present. Returns True if it was added."""
+        seen = self._seen
+        if item in seen:
+            return False
+        if len(self) == self.maxlen:
+            # The deque is about to evict its oldest entry
+            seen.discard(self[0])
+        self.append(item)
+        seen.add(item)
+        return True
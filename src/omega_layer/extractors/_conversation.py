@@ -0,0 +1,21 @@
+"""
+Shared rendering of MemCell ``original_data`` into prompt transcript text.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable
+
+
+def _format_line(data: Dict[str, Any]) -> str:
+    speaker = data.get("speaker_name") or data.get("sender", "Unknown")
+    content = data.get("content", "")
+    timestamp = data.get("timestamp", "")
+    if timestamp:
+        return f"[{timestamp}] {speaker}: {content}"
+    return f"{speaker}: {content}"
+
+
+def format_conversation(data_list: Iterable[Dict[str, Any]]) -> str:
+    """Render messages as ``[timestamp] speaker: content`` lines."""
+    return "\n".join(_format_line(data) for data in data_list)
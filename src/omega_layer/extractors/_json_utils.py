@@ -0,0 +1,56 @@
+"""
+Shared parsing for JSON replies from extractor LLM prompts.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    # Faster C/Rust decoder when available; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _strip_fences(text: str) -> str:
+    """Return the body of the first ```json (or bare ```) fence, if any."""
+    start = text.find("```")
+    if start < 0:
+        # Common case: bare JSON, one scan and no copies
+        return text
+    json_start = text.find("```json", start)
+    start = json_start + 7 if json_start >= 0 else start + 3
+    end = text.find("```", start)
+    return (text[start:] if end < 0 else text[start:end]).strip()
+
+
+def parse_llm_json(response: str) -> Any:
+    """Parse an LLM reply that may wrap its JSON in a markdown code fence.
+
+    Raises:
+        ValueError: If the payload is not valid JSON
+    """
+    payload = _strip_fences(response.strip())
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # stdlib accepts a few things orjson rejects (NaN, Infinity)
+            pass
+    return json.loads(payload)
+
+
+def dumps_for_prompt(obj: Any) -> str:
+    """Render ``obj`` as indented JSON for embedding in an LLM prompt.
+
+    Unserializable values fall back to ``str()``; non-ASCII text is kept as-is.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    return json.dumps(obj, default=str, indent=2, ensure_ascii=False)
@@ -0,0 +1,79 @@
+"""
+Process-wide memoization of extractor LLM calls.
+
+Extractors are rebuilt for every MemCell, so the cache lives at module level
+and is keyed by a hash of the fully rendered prompt plus generation options.
+A prompt-template change therefore invalidates its entries automatically.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from omega_layer.extractors._json_utils import parse_llm_json
+
+# Maximum number of cached replies; 0 disables caching
+_CACHE_SIZE = int(os.getenv("OMEGA_PROMPT_CACHE_SIZE", "1024"))
+
+# Seconds a cached reply stays valid
+_CACHE_TTL_S = float(os.getenv("OMEGA_PROMPT_CACHE_TTL_S", "3600"))
+
+
+class PromptCache:
+    """LRU cache of parsed LLM replies with a per-entry TTL."""
+
+    def __init__(self, max_size: int = _CACHE_SIZE, ttl_s: float = _CACHE_TTL_S):
+        self.max_size = max_size
+        self.ttl_s = ttl_s
+        self._entries: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+
+    @staticmethod
+    def key(prompt: str, **options: Any) -> bytes:
+        payload = prompt + "\x00" + repr(sorted(options.items()))
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl_s:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: bytes, value: Any) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+prompt_cache = PromptCache()
+
+
+async def generate_json(llm_provider, prompt: str, **options: Any) -> Any:
+    """Generate and parse a JSON reply, reusing a cached result for the same prompt.
+
+    Only successfully parsed replies are cached; errors propagate uncached.
+    """
+    key = PromptCache.key(prompt, **options)
+    data = prompt_cache.get(key)
+    if data is None:
+        response = await llm_provider.generate(prompt, **options)
+        data = parse_llm_json(response)
+        prompt_cache.set(key, data)
+    return data
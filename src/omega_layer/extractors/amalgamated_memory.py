@@ -9,18 +9,38 @@ Types: EXTENSION, CORRECTION, CONNECTION, NOVEL
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 from omega_layer.kernel.schemas import SynthesisType
 from omega_layer.prompts.en.amalgamation_prompts import AMALGAMATION_PROMPT
+from omega_layer.prompts._template import PromptTemplate
+from omega_layer.extractors._json_utils import dumps_for_prompt
+from omega_layer.extractors._prompt_cache import generate_json
 
 logger = logging.getLogger(__name__)
 
+_PROMPT = PromptTemplate(AMALGAMATION_PROMPT)
 
-@dataclass
+# Only the first few memories on each side are shown to the LLM
+_PROMPT_MEMORY_LIMIT = 5
+
+# Bulky fields that carry nothing the LLM can reason about
+_PROMPT_OMIT_KEYS = frozenset({"vector", "vector_model", "embedding", "original_data"})
+
+
+def _project_for_prompt(memories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Trim memories to the leading few, without embedding/raw-data fields."""
+    return [
+        {k: v for k, v in memory.items() if k not in _PROMPT_OMIT_KEYS}
+        if isinstance(memory, dict)
+        else memory
+        for memory in memories[:_PROMPT_MEMORY_LIMIT]
+    ]
+
+
+@dataclass(slots=True)
 class AmalgamatedMemory:
     """Synthesized understanding from combining new + existing knowledge."""
 
@@ -77,19 +97,17 @@ class AmalgamatedMemorySynthesizer:
             return []
 
         try:
-            new_summary = json.dumps(new_memories[:5], default=str, indent=2)
-            existing_summary = json.dumps(existing_memories[:5], default=str, indent=2)
+            new_summary = dumps_for_prompt(_project_for_prompt(new_memories))
+            existing_summary = dumps_for_prompt(_project_for_prompt(existing_memories))
 
-            prompt = AMALGAMATION_PROMPT.format(
+            prompt = _PROMPT.render(
                 new_memories=new_summary,
                 existing_memories=existing_summary,
             )
 
-            response = await self.llm_provider.generate(
-                prompt, temperature=0.4, max_tokens=2000
+            data = await generate_json(
+                self.llm_provider, prompt, temperature=0.4, max_tokens=2000
             )
-
-            data = self._parse_json(response)
             if not isinstance(data, list):
                 return []
 
@@ -111,20 +129,14 @@ class AmalgamatedMemorySynthesizer:
                         significance=min(1.0, max(0.0, item.get("significance", 0.5))),
                     ))
 
-            logger.info(
-                f"Amalgamation: {len(results)} synthesized memories "
-                f"({', '.join(r.synthesis_type.value for r in results)})"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Amalgamation: %d synthesized memories (%s)",
+                    len(results),
+                    ", ".join(r.synthesis_type.value for r in results),
+                )
             return results
 
         except Exception as e:
             logger.error(f"Amalgamation failed: {e}", exc_info=True)
             return []
-
-    def _parse_json(self, response: str) -> Any:
-        text = response.strip()
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0].strip()
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0].strip()
-        return json.loads(text)
@@ -6,7 +6,6 @@ CausalPatternExtractor - Extracts cause-effect chains Omega observes.
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
@@ -17,11 +16,17 @@ from memory_layer.memory_extractor.base_memory_extractor import (
 )
 from api_specs.memory_types import MemoryType
 from omega_layer.prompts.en.causal_pattern_prompts import CAUSAL_PATTERN_EXTRACTION_PROMPT
+from omega_layer.prompts._template import PromptTemplate
+from omega_layer.extractors._batch import DEFAULT_MAX_CONCURRENCY, extract_concurrently
+from omega_layer.extractors._conversation import format_conversation
+from omega_layer.extractors._prompt_cache import generate_json
 
 logger = logging.getLogger(__name__)
 
+_PROMPT = PromptTemplate(CAUSAL_PATTERN_EXTRACTION_PROMPT)
 
-@dataclass
+
+@dataclass(slots=True)
 class CausalPattern:
     """A cause-effect relationship Omega observed."""
 
@@ -59,18 +64,16 @@ class CausalPatternExtractor(MemoryExtractor):
             return None
 
         try:
-            conversation = self._format_conversation(request.memcell.original_data)
+            conversation = format_conversation(request.memcell.original_data)
 
-            prompt = CAUSAL_PATTERN_EXTRACTION_PROMPT.format(
+            prompt = _PROMPT.render(
                 conversation=conversation,
                 existing_patterns="No existing patterns available",
             )
 
-            response = await self.llm_provider.generate(
-                prompt, temperature=0.3, max_tokens=2000
+            patterns_data = await generate_json(
+                self.llm_provider, prompt, temperature=0.3, max_tokens=2000
             )
-
-            patterns_data = self._parse_json(response)
             if not isinstance(patterns_data, list):
                 return []
 
@@ -87,29 +90,17 @@ class CausalPatternExtractor(MemoryExtractor):
                         direction=item.get("direction", "cause_to_effect"),
                     ))
 
-            logger.info(f"CausalPatternExtractor: Extracted {len(patterns)} patterns")
+            logger.info("CausalPatternExtractor: Extracted %d patterns", len(patterns))
             return patterns if patterns else None
 
         except Exception as e:
             logger.error(f"CausalPatternExtractor failed: {e}", exc_info=True)
             return None
 
-    def _format_conversation(self, data_list: List[Dict]) -> str:
-        lines = []
-        for data in data_list:
-            speaker = data.get("speaker_name") or data.get("sender", "Unknown")
-            content = data.get("content", "")
-            timestamp = data.get("timestamp", "")
-            if timestamp:
-                lines.append(f"[{timestamp}] {speaker}: {content}")
-            else:
-                lines.append(f"{speaker}: {content}")
-        return "\n".join(lines)
-
-    def _parse_json(self, response: str) -> Any:
-        text = response.strip()
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0].strip()
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0].strip()
-        return json.loads(text)
+    async def extract_batch(
+        self,
+        requests: List[MemoryExtractRequest],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[Optional[List[CausalPattern]]]:
+        """Extract from several MemCells concurrently, in input order."""
+        return await extract_concurrently(self.extract_memory, requests, max_concurrency)
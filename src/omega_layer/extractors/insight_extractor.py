@@ -8,7 +8,6 @@ Extends the existing MemoryExtractor pattern.
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
@@ -19,11 +18,17 @@ from memory_layer.memory_extractor.base_memory_extractor import (
 )
 from api_specs.memory_types import MemoryType, BaseMemory
 from omega_layer.prompts.en.insight_prompts import INSIGHT_EXTRACTION_PROMPT
+from omega_layer.prompts._template import PromptTemplate
+from omega_layer.extractors._batch import DEFAULT_MAX_CONCURRENCY, extract_concurrently
+from omega_layer.extractors._conversation import format_conversation
+from omega_layer.extractors._prompt_cache import generate_json
 
 logger = logging.getLogger(__name__)
 
+_PROMPT = PromptTemplate(INSIGHT_EXTRACTION_PROMPT)
 
-@dataclass
+
+@dataclass(slots=True)
 class Insight:
     """A single insight Omega extracted from experience."""
 
@@ -72,19 +77,17 @@ class InsightExtractor(MemoryExtractor):
 
         try:
             # Build conversation text from memcell original data
-            conversation = self._format_conversation(request.memcell.original_data)
+            conversation = format_conversation(request.memcell.original_data)
             existing_context = "No existing context available"  # TODO: retrieve from memory
 
-            prompt = INSIGHT_EXTRACTION_PROMPT.format(
+            prompt = _PROMPT.render(
                 conversation=conversation,
                 existing_context=existing_context,
             )
 
-            response = await self.llm_provider.generate(
-                prompt, temperature=0.3, max_tokens=2000
+            insights_data = await generate_json(
+                self.llm_provider, prompt, temperature=0.3, max_tokens=2000
             )
-
-            insights_data = self._parse_json(response)
             if not isinstance(insights_data, list):
                 return []
 
@@ -100,29 +103,17 @@ class InsightExtractor(MemoryExtractor):
                         connects_to=item.get("connects_to", "none"),
                     ))
 
-            logger.info(f"InsightExtractor: Extracted {len(insights)} insights")
+            logger.info("InsightExtractor: Extracted %d insights", len(insights))
             return insights if insights else None
 
         except Exception as e:
             logger.error(f"InsightExtractor failed: {e}", exc_info=True)
             return None
 
-    def _format_conversation(self, data_list: List[Dict]) -> str:
-        lines = []
-        for data in data_list:
-            speaker = data.get("speaker_name") or data.get("sender", "Unknown")
-            content = data.get("content", "")
-            timestamp = data.get("timestamp", "")
-            if timestamp:
-                lines.append(f"[{timestamp}] {speaker}: {content}")
-            else:
-                lines.append(f"{speaker}: {content}")
-        return "\n".join(lines)
-
-    def _parse_json(self, response: str) -> Any:
-        text = response.strip()
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0].strip()
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0].strip()
-        return json.loads(text)
+    async def extract_batch(
+        self,
+        requests: List[MemoryExtractRequest],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[Optional[List[Insight]]]:
+        """Extract from several MemCells concurrently, in input order."""
+        return await extract_concurrently(self.extract_memory, requests, max_concurrency)
@@ -9,12 +9,43 @@ where its understanding is shallow.
 from __future__ import annotations
 
 import logging
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
+from itertools import islice
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
+from omega_layer.extractors._bounded import BoundedUniqueList
+
 logger = logging.getLogger(__name__)
 
+# Each observation list keeps only its most recent entries
+_MAX_LIST_ENTRIES = 10
+
+# Observation aspect → bounded list it is recorded in
+_ASPECT_LISTS = {
+    "knowledge_gap": "growth_edges",
+    "reasoning_style": "reasoning_tendencies",
+    "communication_tendency": "communication_notes",
+    "preference": "interests",
+    "cognitive_pattern": "cognitive_style",
+    "growth_edge": "growth_edges",
+}
+
+# Knowledge domains recognised in observations, matched as substrings.
+# The lookahead reports overlapping hits too (e.g. "code" and "design"
+# in "codesign"), as separate `in` checks would.
+_KNOWLEDGE_DOMAINS = (
+    "architecture", "philosophy", "code", "communication",
+    "consciousness", "cooking", "science", "math", "design",
+)
+_DOMAIN_RE = re.compile("(?=(" + "|".join(_KNOWLEDGE_DOMAINS) + "))", re.IGNORECASE)
+
+
+_bounded = partial(BoundedUniqueList, maxlen=_MAX_LIST_ENTRIES)
+
 
 @dataclass
 class OmegaSelfModel:
@@ -24,33 +55,37 @@ class OmegaSelfModel:
     knowledge_depth: Dict[str, int] = field(default_factory=dict)
 
     # How Omega tends to reason
-    reasoning_tendencies: List[str] = field(default_factory=list)
+    reasoning_tendencies: BoundedUniqueList = field(default_factory=_bounded)
 
     # What Omega finds interesting (topics that consistently score high)
-    interests: List[str] = field(default_factory=list)
+    interests: BoundedUniqueList = field(default_factory=_bounded)
 
     # Where understanding is shallow (known gaps)
-    growth_edges: List[str] = field(default_factory=list)
+    growth_edges: BoundedUniqueList = field(default_factory=_bounded)
 
     # Communication patterns
-    communication_notes: List[str] = field(default_factory=list)
+    communication_notes: BoundedUniqueList = field(default_factory=_bounded)
 
     # Cognitive style observations
-    cognitive_style: List[str] = field(default_factory=list)
+    cognitive_style: BoundedUniqueList = field(default_factory=_bounded)
 
     # Metadata
     observation_count: int = 0
     last_updated: Optional[datetime] = None
     version: int = 1
 
+    def __post_init__(self):
+        for name in set(_ASPECT_LISTS.values()):
+            setattr(self, name, _bounded(getattr(self, name)))
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "knowledge_depth": self.knowledge_depth,
-            "reasoning_tendencies": self.reasoning_tendencies,
-            "interests": self.interests,
-            "growth_edges": self.growth_edges,
-            "communication_notes": self.communication_notes,
-            "cognitive_style": self.cognitive_style,
+            "reasoning_tendencies": list(self.reasoning_tendencies),
+            "interests": list(self.interests),
+            "growth_edges": list(self.growth_edges),
+            "communication_notes": list(self.communication_notes),
+            "cognitive_style": list(self.cognitive_style),
             "observation_count": self.observation_count,
             "last_updated": self.last_updated.isoformat() if self.last_updated else None,
             "version": self.version,
@@ -60,14 +95,14 @@ class OmegaSelfModel:
         """Generate a concise text summary for use in prompts."""
         parts = []
         if self.knowledge_depth:
-            top = sorted(self.knowledge_depth.items(), key=lambda x: x[1], reverse=True)[:5]
+            top = sorted(self.knowledge_depth.items(), key=itemgetter(1), reverse=True)[:5]
             parts.append(f"Strong areas: {', '.join(f'{k}({v}/5)' for k, v in top)}")
         if self.growth_edges:
-            parts.append(f"Growth edges: {', '.join(self.growth_edges[:3])}")
+            parts.append(f"Growth edges: {', '.join(islice(self.growth_edges, 3))}")
         if self.reasoning_tendencies:
-            parts.append(f"Reasoning style: {', '.join(self.reasoning_tendencies[:3])}")
+            parts.append(f"Reasoning style: {', '.join(islice(self.reasoning_tendencies, 3))}")
         if self.interests:
-            parts.append(f"Interests: {', '.join(self.interests[:3])}")
+            parts.append(f"Interests: {', '.join(islice(self.interests, 3))}")
         return "; ".join(parts) if parts else "Self-model not yet developed"
 
     def integrate_observations(self, observations: List[Dict[str, Any]]) -> int:
@@ -91,24 +126,8 @@ class OmegaSelfModel:
             if aspect == "knowledge_depth":
                 # Try to extract domain from observation
                 self._update_knowledge(observation, growth)
-            elif aspect == "knowledge_gap":
-                if observation not in self.growth_edges:
-                    self.growth_edges.append(observation)
-            elif aspect == "reasoning_style":
-                if observation not in self.reasoning_tendencies:
-                    self.reasoning_tendencies.append(observation)
-            elif aspect == "communication_tendency":
-                if observation not in self.communication_notes:
-                    self.communication_notes.append(observation)
-            elif aspect == "preference":
-                if observation not in self.interests:
-                    self.interests.append(observation)
-            elif aspect == "cognitive_pattern":
-                if observation not in self.cognitive_style:
-                    self.cognitive_style.append(observation)
-            elif aspect == "growth_edge":
-                if observation not in self.growth_edges:
-                    self.growth_edges.append(observation)
+            elif aspect in _ASPECT_LISTS:
+                getattr(self, _ASPECT_LISTS[aspect]).remember(observation)
 
             count += 1
 
@@ -117,26 +136,21 @@ class OmegaSelfModel:
             self.last_updated = datetime.utcnow()
             self.version += 1
             logger.info(
-                f"Self-model updated: +{count} observations, "
-                f"v{self.version}, {self.observation_count} total"
+                "Self-model updated: +%d observations, v%d, %d total",
+                count,
+                self.version,
+                self.observation_count,
             )
 
-        # Keep lists manageable
-        self.reasoning_tendencies = self.reasoning_tendencies[-10:]
-        self.interests = self.interests[-10:]
-        self.growth_edges = self.growth_edges[-10:]
-        self.communication_notes = self.communication_notes[-10:]
-        self.cognitive_style = self.cognitive_style[-10:]
-
         return count
 
     def _update_knowledge(self, observation: str, growth: float) -> None:
         """Update knowledge depth based on observation."""
         # Simple heuristic: look for domain keywords in observation
-        obs_lower = observation.lower()
-        for domain in ["architecture", "philosophy", "code", "communication",
-                       "consciousness", "cooking", "science", "math", "design"]:
-            if domain in obs_lower:
-                current = self.knowledge_depth.get(domain, 2)
-                delta = 1 if growth > 0.3 else (0 if growth >= 0 else -1)
-                self.knowledge_depth[domain] = max(1, min(5, current + delta))
+        domains = {m.group(1).lower() for m in _DOMAIN_RE.finditer(observation)}
+        if not domains:
+            return
+        delta = 1 if growth > 0.3 else (0 if growth >= 0 else -1)
+        depth = self.knowledge_depth
+        for domain in domains:
+            depth[domain] = max(1, min(5, depth.get(domain, 2) + delta))
@@ -12,51 +12,96 @@ for better collaboration.
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
+from omega_layer.extractors._bounded import BoundedUniqueList
+
 logger = logging.getLogger(__name__)
 
+# Each observation list keeps only its most recent entries
+_MAX_LIST_ENTRIES = 15
+
+_LIST_ATTRS = (
+    "communication_preferences",
+    "interests",
+    "interaction_patterns",
+    "working_style",
+    "energy_patterns",
+)
+
+
+# Observation aspect (and its short alias) → list it is recorded in
+_ASPECT_LISTS = {
+    "communication": "communication_preferences",
+    "communication_preference": "communication_preferences",
+    "interest": "interests",
+    "topic": "interests",
+    "interaction": "interaction_patterns",
+    "interaction_pattern": "interaction_patterns",
+    "working": "working_style",
+    "working_style": "working_style",
+    "energy": "energy_patterns",
+    "energy_pattern": "energy_patterns",
+}
+
+
+_bounded = partial(BoundedUniqueList, maxlen=_MAX_LIST_ENTRIES)
+
 
 @dataclass
 class RyanModel:
     """Omega's understanding of Ryan."""
 
     # Communication style
-    communication_preferences: List[str] = field(default_factory=list)
+    communication_preferences: BoundedUniqueList = field(default_factory=_bounded)
     # e.g., "Prefers concise answers", "Likes meta-analysis", "Values honesty over comfort"
 
     # Topics Ryan engages with deeply
-    interests: List[str] = field(default_factory=list)
+    interests: BoundedUniqueList = field(default_factory=_bounded)
     # e.g., "consciousness", "architecture", "emergence"
 
     # How Ryan interacts
-    interaction_patterns: List[str] = field(default_factory=list)
+    interaction_patterns: BoundedUniqueList = field(default_factory=_bounded)
     # e.g., "Asks for meta-step-back before proceeding", "Iterates rapidly"
 
     # Working approach
-    working_style: List[str] = field(default_factory=list)
+    working_style: BoundedUniqueList = field(default_factory=_bounded)
     # e.g., "Thinks in sessions not months", "Values speed with correctness"
 
     # Emotional/energy patterns
-    energy_patterns: List[str] = field(default_factory=list)
+    energy_patterns: BoundedUniqueList = field(default_factory=_bounded)
     # e.g., "More creative in morning", "Frustrated by over-engineering"
 
     # Metadata
     observation_count: int = 0
-    last_updated: Optional[datetime] = None
+    last_updated_ts: Optional[float] = None  # Wall clock, UTC epoch seconds
     version: int = 1
 
+    def __post_init__(self):
+        for name in _LIST_ATTRS:
+            setattr(self, name, _bounded(getattr(self, name)))
+
+    @property
+    def last_updated(self) -> Optional[datetime]:
+        """Time of the last integrated batch as an aware UTC datetime."""
+        if self.last_updated_ts is None:
+            return None
+        return datetime.fromtimestamp(self.last_updated_ts, tz=timezone.utc)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "communication_preferences": self.communication_preferences,
-            "interests": self.interests,
-            "interaction_patterns": self.interaction_patterns,
-            "working_style": self.working_style,
-            "energy_patterns": self.energy_patterns,
+            "communication_preferences": list(self.communication_preferences),
+            "interests": list(self.interests),
+            "interaction_patterns": list(self.interaction_patterns),
+            "working_style": list(self.working_style),
+            "energy_patterns": list(self.energy_patterns),
             "observation_count": self.observation_count,
-            "last_updated": self.last_updated.isoformat() if self.last_updated else None,
+            "last_updated": self.last_updated.isoformat() if self.last_updated_ts is not None else None,
             "version": self.version,
         }
 
@@ -64,11 +109,11 @@ class RyanModel:
         """Concise summary for prompt injection."""
         parts = []
         if self.communication_preferences:
-            parts.append(f"Communication: {', '.join(self.communication_preferences[:3])}")
+            parts.append(f"Communication: {', '.join(islice(self.communication_preferences, 3))}")
         if self.interests:
-            parts.append(f"Interests: {', '.join(self.interests[:3])}")
+            parts.append(f"Interests: {', '.join(islice(self.interests, 3))}")
         if self.interaction_patterns:
-            parts.append(f"Style: {', '.join(self.interaction_patterns[:2])}")
+            parts.append(f"Style: {', '.join(islice(self.interaction_patterns, 2))}")
         return "; ".join(parts) if parts else "Ryan model not yet developed"
 
     def integrate_observations(self, observations: List[Dict[str, Any]]) -> int:
@@ -88,34 +133,15 @@ class RyanModel:
             if not observation:
                 continue
 
-            if aspect in ("communication", "communication_preference"):
-                if observation not in self.communication_preferences:
-                    self.communication_preferences.append(observation)
-            elif aspect in ("interest", "topic"):
-                if observation not in self.interests:
-                    self.interests.append(observation)
-            elif aspect in ("interaction", "interaction_pattern"):
-                if observation not in self.interaction_patterns:
-                    self.interaction_patterns.append(observation)
-            elif aspect in ("working", "working_style"):
-                if observation not in self.working_style:
-                    self.working_style.append(observation)
-            elif aspect in ("energy", "energy_pattern"):
-                if observation not in self.energy_patterns:
-                    self.energy_patterns.append(observation)
+            name = _ASPECT_LISTS.get(aspect)
+            if name is not None:
+                getattr(self, name).remember(observation)
 
             count += 1
 
         if count > 0:
             self.observation_count += count
-            self.last_updated = datetime.utcnow()
+            self.last_updated_ts = time.time()
             self.version += 1
 
-        # Keep lists manageable
-        for attr in ['communication_preferences', 'interests', 'interaction_patterns',
-                     'working_style', 'energy_patterns']:
-            lst = getattr(self, attr)
-            if len(lst) > 15:
-                setattr(self, attr, lst[-15:])
-
         return count
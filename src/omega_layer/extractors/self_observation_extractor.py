@@ -6,7 +6,6 @@ How it reasoned, what it found difficult, where understanding shifted.
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
@@ -17,11 +16,17 @@ from memory_layer.memory_extractor.base_memory_extractor import (
 )
 from api_specs.memory_types import MemoryType
 from omega_layer.prompts.en.self_observation_prompts import SELF_OBSERVATION_EXTRACTION_PROMPT
+from omega_layer.prompts._template import PromptTemplate
+from omega_layer.extractors._batch import DEFAULT_MAX_CONCURRENCY, extract_concurrently
+from omega_layer.extractors._conversation import format_conversation
+from omega_layer.extractors._prompt_cache import generate_json
 
 logger = logging.getLogger(__name__)
 
+_PROMPT = PromptTemplate(SELF_OBSERVATION_EXTRACTION_PROMPT)
 
-@dataclass
+
+@dataclass(slots=True)
 class SelfObservation:
     """Something Omega learned about itself from an experience."""
 
@@ -53,18 +58,16 @@ class SelfObservationExtractor(MemoryExtractor):
             return None
 
         try:
-            conversation = self._format_conversation(request.memcell.original_data)
+            conversation = format_conversation(request.memcell.original_data)
 
-            prompt = SELF_OBSERVATION_EXTRACTION_PROMPT.format(
+            prompt = _PROMPT.render(
                 conversation=conversation,
                 self_model="Self-model not yet built",  # TODO: load from DB
             )
 
-            response = await self.llm_provider.generate(
-                prompt, temperature=0.3, max_tokens=1500
+            obs_data = await generate_json(
+                self.llm_provider, prompt, temperature=0.3, max_tokens=1500
             )
-
-            obs_data = self._parse_json(response)
             if not isinstance(obs_data, list):
                 return []
 
@@ -78,29 +81,17 @@ class SelfObservationExtractor(MemoryExtractor):
                         evidence=item.get("evidence", ""),
                     ))
 
-            logger.info(f"SelfObservationExtractor: Extracted {len(observations)} observations")
+            logger.info("SelfObservationExtractor: Extracted %d observations", len(observations))
             return observations if observations else None
 
         except Exception as e:
             logger.error(f"SelfObservationExtractor failed: {e}", exc_info=True)
             return None
 
-    def _format_conversation(self, data_list: List[Dict]) -> str:
-        lines = []
-        for data in data_list:
-            speaker = data.get("speaker_name") or data.get("sender", "Unknown")
-            content = data.get("content", "")
-            timestamp = data.get("timestamp", "")
-            if timestamp:
-                lines.append(f"[{timestamp}] {speaker}: {content}")
-            else:
-                lines.append(f"{speaker}: {content}")
-        return "\n".join(lines)
-
-    def _parse_json(self, response: str) -> Any:
-        text = response.strip()
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0].strip()
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0].strip()
-        return json.loads(text)
+    async def extract_batch(
+        self,
+        requests: List[MemoryExtractRequest],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[Optional[List[SelfObservation]]]:
+        """Extract from several MemCells concurrently, in input order."""
+        return await extract_concurrently(self.extract_memory, requests, max_concurrency)
@@ -10,14 +10,65 @@ from __future__ import annotations
 
 import logging
 from collections import deque
-from typing import Any, Dict, List, Optional
+from typing import Dict, List, Tuple
 
 from omega_layer.identity.schemas import DriftReport
 from omega_layer.identity.topology import IdentityTopology
-from omega_layer.kernel.schemas import PentagramResult, VertexVote
+from omega_layer.kernel.schemas import PentagramResult
 
 logger = logging.getLogger(__name__)
 
+# Per-cycle (sum, count) pairs: Mirror invariant alignment, tension magnitude,
+# Compass goal alignment, Orchestra score
+_Signals = Tuple[float, float, float, float, float, float, float, float]
+_SIGNAL_FIELDS = 8
+
+_NUMBER = (int, float)
+
+
+def _extract_signals(result: PentagramResult) -> _Signals:
+    """Reduce one cycle to the (sum, count) contributions of each drift proxy."""
+    votes = result.votes
+
+    # Invariant alignment: proxy via Mirror vertex alignment scores
+    mirror_sum = mirror_n = 0.0
+    mirror = votes.get("mirror")
+    if mirror and mirror.attachments:
+        alignment = mirror.attachments.get("identity_alignment", {})
+        if isinstance(alignment, dict):
+            score = alignment.get("invariant_alignment", 1.0)
+            mirror_sum = score if isinstance(score, _NUMBER) else 1.0
+            mirror_n = 1.0
+
+    # Coherence: proxy via tension magnitudes
+    tension_sum = 0.0
+    for t in result.tensions:
+        tension_sum += t.magnitude
+
+    # Value misalignment: proxy via Compass goal alignment
+    compass_sum = compass_n = 0.0
+    compass = votes.get("compass")
+    if compass and compass.attachments:
+        goal = compass.attachments.get("goal_alignment", {})
+        if isinstance(goal, dict):
+            score = goal.get("alignment_score", 1.0)
+            compass_sum = score if isinstance(score, _NUMBER) else 1.0
+            compass_n = 1.0
+
+    # Relationship integrity: proxy via Orchestra expression quality
+    orchestra_sum = orchestra_n = 0.0
+    orchestra = votes.get("orchestra")
+    if orchestra:
+        orchestra_sum = orchestra.score
+        orchestra_n = 1.0
+
+    return (
+        mirror_sum, mirror_n,
+        tension_sum, float(len(result.tensions)),
+        compass_sum, compass_n,
+        orchestra_sum, orchestra_n,
+    )
+
 
 class StandaloneDriftDetector:
     """Aggregates behavioral signals from Pentagram cycles for drift detection.
@@ -37,12 +88,32 @@ class StandaloneDriftDetector:
         window_size: int = 50,
     ):
         self._topology = topology
-        self._recent_cycles: deque[PentagramResult] = deque(maxlen=window_size)
+        # Each cycle is reduced to its _Signals at record time; running sums over
+        # the window make aggregation O(1) however many tensions a cycle had
+        self._recent_signals: deque[_Signals] = deque(maxlen=window_size)
+        self._sums: List[float] = [0.0] * _SIGNAL_FIELDS
+        self._appends_since_resync: int = 0
         self._check_count: int = 0
 
     def record_cycle(self, result: PentagramResult) -> None:
         """Record a Pentagram cycle for drift analysis."""
-        self._recent_cycles.append(result)
+        recent = self._recent_signals
+        if not recent.maxlen:
+            return
+        signals = _extract_signals(result)
+        sums = self._sums
+        if len(recent) == recent.maxlen:
+            for i, value in enumerate(recent[0]):
+                sums[i] -= value
+        recent.append(signals)
+        for i, value in enumerate(signals):
+            sums[i] += value
+
+        self._appends_since_resync += 1
+        if self._appends_since_resync >= recent.maxlen:
+            # Recompute once per window so float drift in the sums can't build up
+            self._sums = [sum(column) for column in zip(*recent)]
+            self._appends_since_resync = 0
 
     def check_now(self) -> DriftReport:
         """Run drift detection against accumulated behavioral signals.
@@ -78,73 +149,27 @@ class StandaloneDriftDetector:
         - value_misalignment: Do actions diverge from stated values?
         - relationship_integrity: Is interaction quality with Ryan maintained?
         """
-        if not self._recent_cycles:
-            return {
-                "invariant_alignment": 1.0,
-                "coherence": 1.0,
-                "value_misalignment": 0.0,
-                "relationship_integrity": 1.0,
-            }
-
-        cycles = list(self._recent_cycles)
-
-        # Invariant alignment: proxy via Mirror vertex alignment scores
-        mirror_alignments = []
-        for c in cycles:
-            mirror = c.votes.get("mirror")
-            if mirror and mirror.attachments:
-                alignment = mirror.attachments.get("identity_alignment", {})
-                if isinstance(alignment, dict):
-                    score = alignment.get("invariant_alignment", 1.0)
-                    mirror_alignments.append(score if isinstance(score, (int, float)) else 1.0)
+        (
+            mirror_sum, mirror_n,
+            tension_sum, tension_n,
+            compass_sum, compass_n,
+            orchestra_sum, orchestra_n,
+        ) = self._sums
 
         # Coherence: low tension magnitude = high coherence
-        avg_tension = 0.0
-        tension_count = 0
-        for c in cycles:
-            for t in c.tensions:
-                avg_tension += t.magnitude
-                tension_count += 1
-        if tension_count > 0:
-            avg_tension /= tension_count
+        avg_tension = tension_sum / tension_n if tension_n else 0.0
         coherence = 1.0 - avg_tension  # High tension = low coherence
 
-        # Value misalignment: proxy via Compass goal alignment
-        compass_alignments = []
-        for c in cycles:
-            compass = c.votes.get("compass")
-            if compass and compass.attachments:
-                goal = compass.attachments.get("goal_alignment", {})
-                if isinstance(goal, dict):
-                    score = goal.get("alignment_score", 1.0)
-                    compass_alignments.append(score if isinstance(score, (int, float)) else 1.0)
-
-        # Relationship integrity: proxy via Orchestra expression quality
-        orchestra_scores = []
-        for c in cycles:
-            orchestra = c.votes.get("orchestra")
-            if orchestra:
-                orchestra_scores.append(orchestra.score)
-
         return {
-            "invariant_alignment": (
-                sum(mirror_alignments) / len(mirror_alignments)
-                if mirror_alignments else 1.0
-            ),
+            "invariant_alignment": mirror_sum / mirror_n if mirror_n else 1.0,
             "coherence": max(0.0, min(1.0, coherence)),
-            "value_misalignment": (
-                1.0 - (sum(compass_alignments) / len(compass_alignments))
-                if compass_alignments else 0.0
-            ),
-            "relationship_integrity": (
-                sum(orchestra_scores) / len(orchestra_scores)
-                if orchestra_scores else 1.0
-            ),
+            "value_misalignment": 1.0 - compass_sum / compass_n if compass_n else 0.0,
+            "relationship_integrity": orchestra_sum / orchestra_n if orchestra_n else 1.0,
         }
 
     @property
     def cycle_count(self) -> int:
-        return len(self._recent_cycles)
+        return len(self._recent_signals)
 
     @property
     def check_count(self) -> int:
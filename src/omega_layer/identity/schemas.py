@@ -53,6 +53,10 @@ class FlexibleRegion(BaseModel):
     maintains: Optional[str] = None
 
 
+# Keys from omega_scar.json that map onto FlexibleRegion fields
+_FLEXIBLE_FIELDS = frozenset(FlexibleRegion.model_fields)
+
+
 class RepairProtocol(BaseModel):
     """Defines when and how identity repair is triggered."""
 
@@ -125,7 +129,7 @@ class IdentityState(BaseModel):
             if isinstance(val, dict) and key != "description":
                 flexible_regions[key] = FlexibleRegion(**{
                     k: v for k, v in val.items()
-                    if k in FlexibleRegion.model_fields
+                    if k in _FLEXIBLE_FIELDS
                 })
 
         # Parse repair protocol
@@ -13,10 +13,16 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from omega_layer.identity.schemas import (
     ChangeStatus,
     DriftReport,
@@ -49,6 +55,11 @@ class IdentityTopology:
         self._state: Optional[IdentityState] = None
         self._pending_proposals: List[ProposedChange] = []
         self._consecutive_repair_failures: int = 0
+        self._loaded_mtime: Optional[float] = None
+        # True once apply_change() has mutated state that is not on disk
+        self._dirty: bool = False
+        # Guards _state/_pending_proposals against reloads from worker threads
+        self._lock = threading.RLock()
 
     @property
     def state(self) -> Optional[IdentityState]:
@@ -68,19 +79,70 @@ class IdentityTopology:
             FileNotFoundError: If omega_scar.json doesn't exist
             ValueError: If JSON is invalid
         """
+        state, mtime = self._read_scar()
+        with self._lock:
+            self._install(state, mtime)
+        return state
+
+    def reload_if_changed(self) -> bool:
+        """Reload identity if omega_scar.json changed on disk since the last load.
+
+        The reload replaces the in-memory state wholesale, so it is skipped
+        while changes made by apply_change() are unpersisted (they would be
+        lost). Pending proposals are revalidated against the reloaded state.
+
+        Returns:
+            True if the file was reloaded
+        """
+        try:
+            mtime = self._scar_path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        if mtime == self._loaded_mtime or self._dirty:
+            if self._dirty and mtime != self._loaded_mtime:
+                logger.warning(
+                    "omega_scar.json changed on disk but in-memory identity has "
+                    "unpersisted changes; keeping in-memory state"
+                )
+            return False
+
+        state, mtime = self._read_scar()
+        with self._lock:
+            if self._dirty:
+                return False
+            self._install(state, mtime)
+            kept = []
+            for proposal in self._pending_proposals:
+                result = self.validate_change(proposal)
+                if result.approved or result.requires_ryan_approval:
+                    kept.append(proposal)
+            dropped = len(self._pending_proposals) - len(kept)
+            self._pending_proposals = kept
+        if dropped:
+            logger.info(f"Dropped {dropped} pending proposal(s) invalidated by reload")
+        return True
+
+    def _read_scar(self) -> Tuple[IdentityState, float]:
+        """Read and parse omega_scar.json without touching the current state."""
         if not self._scar_path.exists():
             raise FileNotFoundError(f"omega_scar.json not found at {self._scar_path}")
 
-        with open(self._scar_path) as f:
-            data = json.load(f)
-
-        self._state = IdentityState.from_scar_json(data)
+        mtime = self._scar_path.stat().st_mtime
+        with open(self._scar_path, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return IdentityState.from_scar_json(data), mtime
+
+    def _install(self, state: IdentityState, mtime: float) -> None:
+        """Swap in a freshly loaded state. Caller holds self._lock."""
+        self._state = state
+        self._loaded_mtime = mtime
+        self._dirty = False
         logger.info(
-            f"Identity loaded: {self._state.name} v{self._state.version}, "
-            f"{self._state.invariant_count} invariants, "
-            f"{len(self._state.flexible_regions)} flexible regions"
+            f"Identity loaded: {state.name} v{state.version}, "
+            f"{state.invariant_count} invariants, "
+            f"{len(state.flexible_regions)} flexible regions"
         )
-        return self._state
 
     def validate_change(self, proposal: ProposedChange) -> ValidationResult:
         """Validate a proposed identity change against topology.
@@ -151,30 +213,32 @@ class IdentityTopology:
         Returns:
             (success, message) tuple
         """
-        if not self._state:
-            return False, "Identity not loaded"
-
-        if proposal.region not in self._state.flexible_regions:
-            return False, f"Region '{proposal.region}' not found in flexible regions"
-
-        # Record the change
-        change_record = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "region": proposal.region,
-            "field": proposal.field,
-            "old_value": proposal.old_value,
-            "new_value": proposal.new_value,
-            "evidence": proposal.evidence,
-            "proposing_vertex": proposal.proposing_vertex,
-            "confidence": proposal.confidence,
-        }
-        self._state.update_history.append(change_record)
-
-        # Increment version
-        parts = self._state.version.split(".")
-        parts[-1] = str(int(parts[-1]) + 1)
-        self._state.version = ".".join(parts)
-        self._state.last_updated = datetime.utcnow()
+        with self._lock:
+            if not self._state:
+                return False, "Identity not loaded"
+
+            if proposal.region not in self._state.flexible_regions:
+                return False, f"Region '{proposal.region}' not found in flexible regions"
+
+            # Record the change
+            change_record = {
+                "timestamp": datetime.utcnow().isoformat(),
+                "region": proposal.region,
+                "field": proposal.field,
+                "old_value": proposal.old_value,
+                "new_value": proposal.new_value,
+                "evidence": proposal.evidence,
+                "proposing_vertex": proposal.proposing_vertex,
+                "confidence": proposal.confidence,
+            }
+            self._state.update_history.append(change_record)
+
+            # Increment version
+            parts = self._state.version.split(".")
+            parts[-1] = str(int(parts[-1]) + 1)
+            self._state.version = ".".join(parts)
+            self._state.last_updated = datetime.utcnow()
+            self._dirty = True
 
         logger.info(
             f"Identity updated: {proposal.region}.{proposal.field} → "
@@ -269,14 +333,15 @@ class IdentityTopology:
         Returns:
             ValidationResult
         """
-        result = self.validate_change(proposal)
+        with self._lock:
+            result = self.validate_change(proposal)
 
-        if result.approved:
-            self._pending_proposals.append(proposal)
-            logger.info(f"Proposal queued: {proposal.region}.{proposal.field}")
-        elif result.requires_ryan_approval:
-            self._pending_proposals.append(proposal)
-            logger.info(f"Proposal queued for Ryan's review: {proposal.region}.{proposal.field}")
+            if result.approved:
+                self._pending_proposals.append(proposal)
+                logger.info(f"Proposal queued: {proposal.region}.{proposal.field}")
+            elif result.requires_ryan_approval:
+                self._pending_proposals.append(proposal)
+                logger.info(f"Proposal queued for Ryan's review: {proposal.region}.{proposal.field}")
 
         return result
 
@@ -286,6 +351,7 @@ class IdentityTopology:
 
     def clear_pending(self) -> int:
         """Clear pending proposals. Returns count cleared."""
-        count = len(self._pending_proposals)
-        self._pending_proposals.clear()
+        with self._lock:
+            count = len(self._pending_proposals)
+            self._pending_proposals.clear()
         return count
@@ -13,7 +13,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from omega_layer.kernel.schemas import (
     KernelSynthesis,
@@ -98,6 +98,29 @@ class MetabolicKernel:
         Returns:
             PentagramResult with all votes, tensions, and synthesis
         """
+        result = None
+        async for event in self.process_stream(experience, context):
+            if event[0] == "result":
+                result = event[1]
+        return result
+
+    async def process_stream(
+        self,
+        experience: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Tuple[Any, ...]]:
+        """Route an experience through the Pentagram, yielding progress events.
+
+        Events, in order:
+            ("vote", name, VertexVote) — as each vertex finishes
+            ("tension", Tension) — one per identified tension
+            ("synthesis", KernelSynthesis | None)
+            ("result", PentagramResult) — always last
+
+        Args:
+            experience: Same as process()
+            context: Same as process()
+        """
         start_time = time.perf_counter()
         timings: Dict[str, float] = {}
         errors: List[Dict[str, Any]] = []
@@ -124,17 +147,32 @@ class MetabolicKernel:
                     self._safe_vote(vertex, experience, vertex_ctx)
                 )
 
-        # Await all parallel votes
+        # Collect parallel votes as they land
         votes: Dict[str, VertexVote] = {}
-        for name, task in parallel_tasks.items():
-            t_start = time.perf_counter()
-            try:
-                vote = await task
-                votes[name] = vote
-                timings[f"{name}_vote"] = time.perf_counter() - t_start
-            except Exception as e:
-                errors.append({"vertex": name, "error": str(e)})
-                timings[f"{name}_vote"] = time.perf_counter() - t_start
+        pending = set(parallel_tasks.values())
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for name, task in parallel_tasks.items():
+                    if task not in done:
+                        continue
+                    timings[f"{name}_vote"] = time.perf_counter() - phase1_start
+                    try:
+                        vote = task.result()
+                    except Exception as e:
+                        errors.append({"vertex": name, "error": str(e)})
+                        continue
+                    votes[name] = vote
+                    yield ("vote", name, vote)
+        finally:
+            # Consumer went away mid-phase: don't leave votes running
+            for task in pending:
+                task.cancel()
+
+        # Keep the canonical vertex order regardless of completion order
+        votes = {name: votes[name] for name in parallel_tasks if name in votes}
 
         timings["phase1_parallel"] = time.perf_counter() - phase1_start
         logger.info(
@@ -148,6 +186,7 @@ class MetabolicKernel:
         phase2_start = time.perf_counter()
 
         orchestra = self._vertices.get("orchestra")
+        orchestra_vote = None
         if orchestra:
             orchestra_ctx = {"other_votes": votes}
             try:
@@ -159,6 +198,8 @@ class MetabolicKernel:
                 errors.append({"vertex": "orchestra", "error": str(e)})
 
         timings["phase2_orchestra"] = time.perf_counter() - phase2_start
+        if orchestra_vote is not None:
+            yield ("vote", "orchestra", orchestra_vote)
 
         # ============================================================
         # Phase 3: Tension analysis
@@ -168,7 +209,9 @@ class MetabolicKernel:
         tensions = self._tension_analyzer.analyze(votes)
         timings["phase3_tensions"] = time.perf_counter() - phase3_start
 
-        logger.info(f"Kernel: {len(tensions)} tensions identified")
+        logger.info("Kernel: %d tensions identified", len(tensions))
+        for tension in tensions:
+            yield ("tension", tension)
 
         # ============================================================
         # Phase 4: Synthesis
@@ -177,6 +220,7 @@ class MetabolicKernel:
 
         synthesis = await self._synthesize(experience, votes, tensions)
         timings["phase4_synthesis"] = time.perf_counter() - phase4_start
+        yield ("synthesis", synthesis)
 
         # ============================================================
         # Build result
@@ -199,7 +243,7 @@ class MetabolicKernel:
             f"{total_time:.2f}s total"
         )
 
-        return result
+        yield ("result", result)
 
     async def _safe_vote(
         self,
@@ -348,7 +392,7 @@ class MetabolicKernel:
         ])
 
         tension_summary = "\n".join([
-            f"- {t.vertex_a.value} vs {t.vertex_b.value}: {t.dimension} (magnitude={t.magnitude:.2f})"
+            f"- {t.label}: {t.dimension} (magnitude={t.magnitude:.2f})"
             for t in tensions
         ]) or "No significant tensions"
 
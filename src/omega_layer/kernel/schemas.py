@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator
@@ -33,6 +34,10 @@ class SynthesisType(str, Enum):
     NOVEL = "novel"              # Entirely new synthesis
 
 
+# Length of VertexVote.reasoning_preview
+REASONING_PREVIEW_CHARS = 200
+
+
 class VertexVote(BaseModel):
     """A single vertex's analysis of an experience.
 
@@ -48,6 +53,15 @@ class VertexVote(BaseModel):
     attachments: Dict[str, Any] = Field(default_factory=dict, description="Additional data (e.g., retrieved_memories from Ledger, patterns from Garden)")
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
+    @cached_property
+    def reasoning_preview(self) -> str:
+        """Reasoning truncated for summaries and API responses (computed once)."""
+        return self.reasoning[:REASONING_PREVIEW_CHARS]
+
+    def to_api_dict(self) -> Dict[str, Any]:
+        """Vote as returned by the omega API (reasoning preview, no attachments)."""
+        return {"score": self.score, "reasoning": self.reasoning_preview, "observations": self.observations}
+
     model_config = {"json_schema_extra": {"examples": [
         {
             "vertex_name": "garden",
@@ -73,6 +87,11 @@ class Tension(BaseModel):
     magnitude: float = Field(ge=0.0, le=1.0, description="How strong the tension is (0=agreement, 1=complete opposition)")
     resolution_hint: str = Field(default="", description="Suggested resolution direction")
 
+    @cached_property
+    def label(self) -> str:
+        """Human-readable pair, e.g. "ledger vs garden" (computed once)."""
+        return f"{self.vertex_a.value} vs {self.vertex_b.value}"
+
     @field_validator("vertex_b")
     @classmethod
     def vertices_must_differ(cls, v: VertexName, info) -> VertexName:
@@ -119,6 +138,11 @@ class PentagramResult(BaseModel):
     errors: List[Dict[str, Any]] = Field(default_factory=list, description="Any errors that occurred during processing")
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
+    @cached_property
+    def votes_api(self) -> Dict[str, Dict[str, Any]]:
+        """API dicts for all votes, built once per result."""
+        return {name: v.to_api_dict() for name, v in self.votes.items()}
+
     @property
     def total_duration(self) -> float:
         """Total processing time in seconds."""
@@ -0,0 +1,35 @@
+"""
+Pre-parsed ``str.format`` prompt templates.
+"""
+
+from __future__ import annotations
+
+from string import Formatter
+from typing import Any, Optional, Tuple
+
+
+class PromptTemplate:
+    """A ``str.format`` template split into literal/field pairs once, up front.
+
+    render(**values) gives the same result as ``template.format(**values)``
+    for plain ``{name}`` fields, without re-parsing the template each call.
+    """
+
+    __slots__ = ("template", "_parts")
+
+    def __init__(self, template: str):
+        self.template = template
+        parts = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            if field_name is not None and (format_spec or conversion or not field_name.isidentifier()):
+                raise ValueError(f"Unsupported prompt field: {{{field_name}}}")
+            parts.append((literal, field_name))
+        self._parts: Tuple[Tuple[str, Optional[str]], ...] = tuple(parts)
+
+    def render(self, **values: Any) -> str:
+        out = []
+        for literal, field_name in self._parts:
+            out.append(literal)
+            if field_name is not None:
+                out.append(str(values[field_name]))
+        return "".join(out)
@@ -57,7 +57,7 @@ class OrchestraVertex(BaseVertex):
                 if isinstance(v, VertexVote):
                     vote_summaries[name] = {
                         "score": v.score,
-                        "reasoning": v.reasoning[:200],
+                        "reasoning": v.reasoning_preview,
                         "key_observations": v.observations[:3],
                     }
                 elif isinstance(v, dict):
@@ -1,5 +1,7 @@
 """Tests for business lifespan shutdown cleanup."""
 
+import asyncio
+import threading
 from types import SimpleNamespace
 
 import pytest
@@ -36,3 +38,117 @@ async def test_shutdown_closes_vectorize_and_rerank_services(monkeypatch):
     assert vectorize.closed is True
     assert rerank.closed is True
     assert not hasattr(app.state, "graphs")
+
+
+@pytest.mark.asyncio
+async def test_shutdown_closes_services_despite_failures(monkeypatch):
+    rerank = DummyService()
+
+    def broken_vectorize():
+        raise RuntimeError("not initialized")
+
+    monkeypatch.setattr(
+        business_lifespan, "get_vectorize_service", broken_vectorize, raising=False
+    )
+    monkeypatch.setattr(
+        business_lifespan, "get_rerank_service", lambda: rerank, raising=False
+    )
+
+    await BusinessLifespanProvider().shutdown(SimpleNamespace(state=SimpleNamespace()))
+
+    assert rerank.closed is True
+
+
+@pytest.mark.asyncio
+async def test_async_capabilities_are_enabled_concurrently(monkeypatch):
+    started = []
+    release = asyncio.Event()
+
+    class AsyncCapability:
+        def __init__(self, name):
+            self.name = name
+
+        async def enable(self, app):
+            started.append(self.name)
+            if len(started) == 2:
+                release.set()
+            await asyncio.wait_for(release.wait(), timeout=1)
+
+    class SyncCapability:
+        enabled = False
+
+        def enable(self, app):
+            SyncCapability.enabled = True
+
+    capabilities = [AsyncCapability("a"), SyncCapability(), AsyncCapability("b")]
+    monkeypatch.setattr(
+        business_lifespan, "get_beans_by_type", lambda bean_type: capabilities
+    )
+
+    result = await BusinessLifespanProvider()._register_capabilities(SimpleNamespace())
+
+    assert result == capabilities
+    assert started == ["a", "b"]
+    assert SyncCapability.enabled is True
+
+
+@pytest.mark.asyncio
+async def test_capability_lookup_is_cached_until_shutdown(monkeypatch):
+    lookups = []
+
+    def fake_get_beans_by_type(bean_type):
+        lookups.append(bean_type)
+        return []
+
+    monkeypatch.setattr(business_lifespan, "get_beans_by_type", fake_get_beans_by_type)
+    monkeypatch.setattr(
+        business_lifespan, "get_vectorize_service", DummyService, raising=False
+    )
+    monkeypatch.setattr(
+        business_lifespan, "get_rerank_service", DummyService, raising=False
+    )
+    provider = BusinessLifespanProvider()
+
+    await provider._register_capabilities(SimpleNamespace())
+    await provider._register_capabilities(SimpleNamespace())
+    assert len(lookups) == 1
+
+    await provider.shutdown(SimpleNamespace(state=SimpleNamespace()))
+    await provider._register_capabilities(SimpleNamespace())
+    assert len(lookups) == 2
+
+
+@pytest.mark.asyncio
+async def test_startup_overlaps_tokenizer_preload_with_registration(monkeypatch):
+    """The tokenizer load runs while controllers register and is awaited before startup returns."""
+    load_started = threading.Event()
+    registered = threading.Event()
+    overlapped = []
+
+    class FakeTokenizerFactory:
+        loaded = False
+
+        def load_default_encodings(self):
+            load_started.set()
+            registered.wait(timeout=2)
+            FakeTokenizerFactory.loaded = True
+
+    def register_controllers(self, app):
+        # Blocks the event loop, so only an already-submitted load can start
+        overlapped.append(load_started.wait(timeout=2))
+        registered.set()
+        return []
+
+    monkeypatch.setattr(
+        business_lifespan, "get_bean_by_type", lambda bean_type: FakeTokenizerFactory()
+    )
+    monkeypatch.setattr(business_lifespan, "get_beans_by_type", lambda bean_type: [])
+    monkeypatch.setattr(BusinessLifespanProvider, "_register_controllers", register_controllers)
+
+    result = await BusinessLifespanProvider().startup(
+        SimpleNamespace(state=SimpleNamespace())
+    )
+
+    assert overlapped == [True]
+    assert FakeTokenizerFactory.loaded is True
+    assert result == {'graphs': {}, 'controllers': [], 'capabilities': []}
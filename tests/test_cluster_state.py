@@ -0,0 +1,31 @@
+"""Unit tests for ClusterState bookkeeping."""
+
+import sys
+import os
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from memory_layer.cluster_manager.manager import ClusterState
+
+
+def test_cluster_members_track_assignments():
+    """Member buckets follow new/existing cluster assignments."""
+    state = ClusterState()
+    cid = state.assign_new_cluster("e1")
+    state.add_to_cluster("e2", cid, np.ones(3, dtype=np.float32), 1.0)
+    other = state.assign_new_cluster("e3")
+
+    assert state.get_cluster_event_ids(cid) == ["e1", "e2"]
+    assert state.get_cluster_event_ids(other) == ["e3"]
+    assert state.get_cluster_event_ids("missing") == []
+
+
+def test_cluster_members_rebuilt_from_dict():
+    """Member buckets are derived from eventid_to_cluster on load."""
+    state = ClusterState()
+    cid = state.assign_new_cluster("e1")
+    state.add_to_cluster("e2", cid, np.ones(3, dtype=np.float32), 1.0)
+
+    restored = ClusterState.from_dict(state.to_dict())
+    assert restored.get_cluster_event_ids(cid) == ["e1", "e2"]
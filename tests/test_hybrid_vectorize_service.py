@@ -0,0 +1,309 @@
+"""Unit tests for HybridVectorizeService with fake providers."""
+
+import sys
+import os
+import numpy as np
+import pytest
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from agentic_layer.vectorize_interface import VectorizeError
+from agentic_layer.vectorize_service import (
+    HybridVectorizeConfig,
+    HybridVectorizeService,
+)
+
+
+class FakeProvider:
+    """Records the texts it is asked to embed and returns len-based vectors."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def get_embedding(self, text, instruction=None, is_query=False):
+        self.calls.append([text])
+        return np.array([len(text)], dtype=np.float32)
+
+    async def get_embeddings(self, texts, instruction=None, is_query=False):
+        self.calls.append(list(texts))
+        return [np.array([len(t)], dtype=np.float32) for t in texts]
+
+    async def close(self):
+        pass
+
+
+class FailingProvider(FakeProvider):
+    """Fails every call after recording it."""
+
+    async def get_embedding(self, text, instruction=None, is_query=False):
+        self.calls.append([text])
+        raise VectorizeError("connection refused")
+
+    async def get_embeddings(self, texts, instruction=None, is_query=False):
+        self.calls.append(list(texts))
+        raise VectorizeError("connection refused")
+
+
+def make_service(primary=None, fallback=None, **overrides) -> HybridVectorizeService:
+    config = HybridVectorizeConfig(fallback_provider="none")
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    service = HybridVectorizeService(config)
+    service.primary_service = primary or FakeProvider()
+    if fallback is not None:
+        service.config.enable_fallback = True
+        service.fallback_service = fallback
+    return service
+
+
+@pytest.mark.asyncio
+async def test_get_embedding_uses_cache():
+    """Repeated texts are served from the cache as read-only arrays."""
+    service = make_service()
+    first = await service.get_embedding("hello")
+    second = await service.get_embedding("hello")
+    await service.get_embedding("hello", is_query=True)
+
+    assert second is first
+    assert not second.flags.writeable
+    assert len(service.primary_service.calls) == 2
+    assert service.get_cache_stats() == {"hits": 1, "misses": 2, "size": 2}
+
+
+@pytest.mark.asyncio
+async def test_get_embeddings_sends_only_uncached():
+    """Batch calls embed only cache misses and keep input order."""
+    service = make_service(embedding_cache_size=2)
+    await service.get_embedding("bb")
+
+    result = await service.get_embeddings(["a", "bb", "cccc"])
+
+    assert [float(e[0]) for e in result] == [1.0, 2.0, 4.0]
+    assert service.primary_service.calls[-1] == ["a", "cccc"]
+    assert service.get_cache_stats()["size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_get_embeddings_dedupes_and_sorts_by_length():
+    """Duplicates are embedded once and dispatched shortest-first."""
+    service = make_service(embedding_cache_size=0)
+    texts = ["cccc", "a", "cccc", "bb", "a"]
+
+    result = await service.get_embeddings(texts)
+
+    assert service.primary_service.calls == [["a", "bb", "cccc"]]
+    assert [float(e[0]) for e in result] == [4.0, 1.0, 4.0, 2.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_skips_primary_until_reset():
+    """After max failures the primary is skipped until a half-open probe succeeds."""
+    primary, fallback = FailingProvider(), FakeProvider()
+    service = make_service(
+        primary=primary,
+        fallback=fallback,
+        max_primary_failures=2,
+        primary_retries=1,
+        circuit_reset_seconds=60,
+        embedding_cache_size=0,
+    )
+
+    for _ in range(4):
+        await service.get_embedding("x")
+
+    assert len(primary.calls) == 2
+    assert len(fallback.calls) == 4
+    assert service.get_circuit_state() == "open"
+
+    service._breakers["get_embedding"].opened_at -= 61
+    service.primary_service = FakeProvider()
+    await service.get_embedding("x")
+    assert service.get_circuit_state() == "closed"
+    assert service.get_failure_count() == 0
+
+
+def test_primary_timeout_bounds_each_http_attempt():
+    """primary_timeout_s becomes the primary client's timeout; the fallback keeps timeout."""
+    config = HybridVectorizeConfig(fallback_provider="none")
+    config.primary_timeout_s, config.timeout = 1.5, 30
+    assert HybridVectorizeService(config).primary_service.config.timeout == 1.5
+
+    config.primary_timeout_s = 0
+    assert HybridVectorizeService(config).primary_service.config.timeout == 30
+
+
+@pytest.mark.asyncio
+async def test_primary_backend_calls_are_bounded_by_primary_retries():
+    """Only the hybrid retries the primary: one backend request per attempt."""
+    requests = []
+
+    async def refuse(**kwargs):
+        requests.append(kwargs["input"])
+        raise ConnectionError("Connection error.")
+
+    config = HybridVectorizeConfig(fallback_provider="none")
+    config.primary_retries, config.max_retries = 2, 3
+    service = HybridVectorizeService(config)
+    service.primary_service.client = SimpleNamespace(embeddings=SimpleNamespace(create=refuse))
+
+    with pytest.raises(VectorizeError):
+        await service.get_embedding("abc")
+
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_embeddings_batch_fans_out_in_order():
+    """Each batch is embedded separately and results keep batch order."""
+    service = make_service(embedding_cache_size=0, max_concurrent_batches=2)
+    batches = [["a"], ["bb", "ccc"], [], ["dddd"]]
+
+    result = await service.get_embeddings_batch(batches)
+
+    assert [[float(e[0]) for e in batch] for batch in result] == [[1.0], [2.0, 3.0], [], [4.0]]
+    assert sorted(map(tuple, service.primary_service.calls)) == [("a",), ("bb", "ccc"), ("dddd",)]
+
+
+class PickyProvider(FakeProvider):
+    """Fails any request containing the text "bad"."""
+
+    async def get_embeddings(self, texts, instruction=None, is_query=False):
+        if "bad" in texts:
+            self.calls.append(list(texts))
+            raise VectorizeError("Error code: 400 invalid input")
+        return await super().get_embeddings(texts, instruction, is_query)
+
+
+@pytest.mark.asyncio
+async def test_get_embeddings_batch_isolates_failed_batches():
+    """A failing batch comes back empty without failing its siblings."""
+    service = make_service(primary=PickyProvider(), embedding_cache_size=0)
+
+    result = await service.get_embeddings_batch([["a"], ["bad", "x"], ["ccc"]])
+
+    assert [[float(e[0]) for e in batch] for batch in result] == [[1.0], [], [3.0]]
+
+
+class FlakyProvider(FakeProvider):
+    """Raises the given error once, then behaves."""
+
+    def __init__(self, error):
+        super().__init__()
+        self.error = error
+
+    async def get_embedding(self, text, instruction=None, is_query=False):
+        if self.error is not None:
+            self.calls.append([text])
+            error, self.error = self.error, None
+            raise error
+        return await super().get_embedding(text, instruction, is_query)
+
+
+@pytest.mark.asyncio
+async def test_transient_primary_error_is_retried():
+    """Connection errors are retried on the primary before falling back."""
+    primary, fallback = FlakyProvider(VectorizeError("Connection error.")), FakeProvider()
+    service = make_service(primary=primary, fallback=fallback, embedding_cache_size=0)
+
+    await service.get_embedding("abc")
+
+    assert len(primary.calls) == 2
+    assert fallback.calls == []
+    assert service.get_failure_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_non_transient_primary_error_falls_back_immediately():
+    """Client-side errors are not retried."""
+    primary, fallback = FlakyProvider(VectorizeError("Error code: 400 invalid input")), FakeProvider()
+    service = make_service(primary=primary, fallback=fallback, embedding_cache_size=0)
+
+    await service.get_embedding("abc")
+
+    assert len(primary.calls) == 1
+    assert fallback.calls == [["abc"]]
+
+
+@pytest.mark.asyncio
+async def test_hybrid_service_singleton_is_rebuilt_after_close():
+    """Concurrent lookups share one instance; close() drops it."""
+    from concurrent.futures import ThreadPoolExecutor
+    from agentic_layer import vectorize_service
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        instances = list(pool.map(lambda _: vectorize_service.get_hybrid_service(), range(16)))
+    assert all(inst is instances[0] for inst in instances)
+
+    await instances[0].close()
+    assert vectorize_service.get_hybrid_service() is not instances[0]
+    await vectorize_service.get_hybrid_service().close()
+
+
+@pytest.mark.asyncio
+async def test_programming_errors_are_not_routed_to_fallback():
+    """Non-service errors propagate instead of counting as primary failures."""
+    fallback = FakeProvider()
+    service = make_service(
+        primary=FlakyProvider(TypeError("bad argument")),
+        fallback=fallback,
+        embedding_cache_size=0,
+    )
+
+    with pytest.raises(TypeError):
+        await service.get_embedding("abc")
+
+    assert fallback.calls == []
+    assert service.get_failure_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_circuit_breakers_are_per_operation():
+    """An open circuit on one operation does not divert the others."""
+    primary, fallback = FailingProvider(), FakeProvider()
+    service = make_service(
+        primary=primary,
+        fallback=fallback,
+        max_primary_failures=1,
+        primary_retries=1,
+        embedding_cache_size=0,
+    )
+
+    await service.get_embedding("x")
+    assert service.get_circuit_state("get_embedding") == "open"
+    assert service.get_circuit_state("get_embeddings") == "closed"
+
+    await service.get_embeddings(["y"])
+    assert primary.calls == [["x"], ["y"]]
+    assert service.get_circuit_state() == "open"
+
+    service.reset_failure_count()
+    assert service.get_circuit_state() == "closed"
+    assert service.get_failure_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_returned_embeddings_are_shared_read_only():
+    """Duplicate texts share one frozen array, even with the cache disabled."""
+    service = make_service(embedding_cache_size=0)
+
+    first, second = await service.get_embeddings(["same", "same"])
+
+    assert first is second
+    assert first.dtype == np.float32
+    with pytest.raises(ValueError):
+        first[0] = 1.0
+
+
+@pytest.mark.asyncio
+async def test_fp16_cache_storage_returns_float32():
+    """FP16 cache storage is internal; hits still come back as float32."""
+    service = make_service(embedding_cache_dtype="fp16")
+
+    miss = await service.get_embedding("hello")
+    hit = await service.get_embedding("hello")
+
+    assert service._cache[service._cache_key("hello", None, False)].dtype == np.float16
+    assert miss.dtype == hit.dtype == np.float32
+    np.testing.assert_allclose(hit, miss)
+    assert not hit.flags.writeable
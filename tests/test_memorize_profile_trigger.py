@@ -0,0 +1,73 @@
+"""Unit tests for the per-cluster Profile extraction trigger."""
+
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from biz_layer.mem_memorize import _persist_profile, _should_extract_profiles
+from biz_layer.memorize_config import MemorizeConfig
+
+
+def extracting_counts(config, upto=10):
+    return [n for n in range(upto + 1) if _should_extract_profiles(n, config)]
+
+
+def test_default_config_extracts_on_every_memcell():
+    """By default every memcell from the minimum onwards triggers extraction."""
+    assert MemorizeConfig().profile_extract_interval == 1
+    assert extracting_counts(MemorizeConfig()) == list(range(1, 11))
+
+
+def test_interval_debounces_from_the_minimum():
+    """An opt-in interval extracts at the minimum and every N-th memcell after."""
+    config = MemorizeConfig(profile_min_memcells=2, profile_extract_interval=3)
+    assert extracting_counts(config) == [2, 5, 8]
+
+
+def test_interval_is_read_from_env(monkeypatch):
+    """PROFILE_EXTRACT_INTERVAL opts in; unset keeps per-memcell extraction."""
+    monkeypatch.delenv("PROFILE_EXTRACT_INTERVAL", raising=False)
+    assert MemorizeConfig.from_env().profile_extract_interval == 1
+    monkeypatch.setenv("PROFILE_EXTRACT_INTERVAL", "4")
+    assert MemorizeConfig.from_env().profile_extract_interval == 4
+
+
+class FakeProfileRepo:
+    def __init__(self):
+        self.saved = []
+        self.metadata_updates = []
+
+    async def save_profile(self, user_id, profile, metadata=None):
+        self.saved.append((user_id, profile, metadata))
+        return True
+
+    async def update_profile_metadata(self, user_id, metadata=None):
+        self.metadata_updates.append((user_id, metadata))
+        return True
+
+
+@pytest.mark.asyncio
+async def test_unchanged_profile_refreshes_metadata_without_new_version():
+    """Identical data skips the versioned upsert but still links the new cluster."""
+    repo = FakeProfileRepo()
+    metadata = {"group_id": "g", "cluster_id": "c2", "memcell_count": 4}
+
+    await _persist_profile(repo, "u1", {"role": "dev"}, metadata, previous={"role": "dev"})
+
+    assert repo.saved == []
+    assert repo.metadata_updates == [("u1", metadata)]
+
+
+@pytest.mark.asyncio
+async def test_changed_or_new_profile_is_saved():
+    """Changed and first-time profiles go through the versioned save."""
+    repo = FakeProfileRepo()
+    metadata = {"group_id": "g", "cluster_id": "c1"}
+
+    await _persist_profile(repo, "u1", {"role": "lead"}, metadata, previous={"role": "dev"})
+    await _persist_profile(repo, "u2", {"role": "dev"}, metadata)
+
+    assert [user for user, _, _ in repo.saved] == ["u1", "u2"]
+    assert repo.metadata_updates == []
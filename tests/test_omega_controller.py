@@ -0,0 +1,273 @@
+"""Unit tests for OmegaController kernel assembly and request handling."""
+
+import sys
+import os
+import asyncio
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from infra_layer.adapters.input.api.omega import omega_controller
+from infra_layer.adapters.input.api.omega.omega_controller import OmegaController
+from omega_layer import _lazy
+
+
+class FakeKernel:
+    instances = 0
+
+    def __init__(self, llm_provider=None):
+        FakeKernel.instances += 1
+        self.vertices = []
+
+    def register_vertex(self, vertex):
+        self.vertices.append(vertex)
+
+    @property
+    def vertex_count(self):
+        return len(self.vertices)
+
+
+class FakeVertex:
+    def configure_llm(self, llm):
+        self.llm = llm
+
+
+@pytest.fixture
+def fake_pentagram(monkeypatch):
+    FakeKernel.instances = 0
+    omega_controller._build_llm_provider.cache_clear()
+    monkeypatch.setattr(_lazy, "MetabolicKernel", FakeKernel, raising=False)
+    monkeypatch.setattr(_lazy, "LLMProvider", lambda **kwargs: object(), raising=False)
+    for name in ("LedgerVertex", "GardenVertex", "MirrorVertex", "CompassVertex", "OrchestraVertex"):
+        monkeypatch.setattr(_lazy, name, FakeVertex, raising=False)
+    yield
+    omega_controller._build_llm_provider.cache_clear()
+
+
+def test_lazy_module_resolves_and_caches_providers():
+    """Lazy attributes import on first access and are cached afterwards."""
+    kernel_cls = _lazy.MetabolicKernel
+    assert kernel_cls.__name__ == "MetabolicKernel"
+    assert _lazy.__dict__["MetabolicKernel"] is kernel_cls
+    with pytest.raises(AttributeError):
+        _lazy.NotAProvider
+
+
+@pytest.mark.asyncio
+async def test_ensure_kernel_assembles_once(fake_pentagram):
+    """Concurrent first requests share one off-loop kernel assembly."""
+    controller = OmegaController()
+
+    kernels = await asyncio.gather(*(controller._ensure_kernel() for _ in range(5)))
+
+    assert FakeKernel.instances == 1
+    assert all(k is kernels[0] for k in kernels)
+    assert kernels[0].vertex_count == 5
+
+
+def test_llm_provider_is_shared_across_controllers(fake_pentagram):
+    """Re-created controllers reuse the provider built for the same env config."""
+    first = OmegaController()._get_kernel().vertices[1].llm
+    second = OmegaController()._get_kernel().vertices[1].llm
+
+    assert FakeKernel.instances == 2
+    assert second is first
+
+
+@pytest.mark.asyncio
+async def test_metrics_are_emitted_in_background():
+    """Metric export runs as a tracked background task after the handler returns."""
+    from types import SimpleNamespace
+    from prometheus_client import REGISTRY
+
+    def votes_for(vertex):
+        return REGISTRY.get_sample_value(
+            "omega_vertex_votes_total", {"vertex": vertex, "status": "success"}
+        ) or 0.0
+
+    controller = OmegaController()
+    result = SimpleNamespace(
+        successful_votes=1,
+        has_synthesis=False,
+        votes={"mirror": SimpleNamespace(score=0.5)},
+        tensions=[],
+    )
+    before = votes_for("mirror")
+
+    controller._spawn_background(controller._emit_metrics(0.1, result, 0.2))
+    assert len(controller._background_tasks) == 1
+    await asyncio.gather(*controller._background_tasks)
+
+    assert votes_for("mirror") == before + 1
+    assert not controller._background_tasks
+
+
+def test_process_route_parses_raw_body():
+    """/process reads the raw body itself and rejects an empty message."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+    OmegaController().register_to_app(app)
+    client = TestClient(app)
+
+    response = client.post("/api/v1/omega/process", content=b'{"message": ""}')
+
+    assert response.status_code == 400
+    assert "'message' field required" in response.text
+
+
+@pytest.mark.asyncio
+async def test_identical_inflight_requests_share_one_cycle():
+    """Concurrent identical experiences run one cycle; different ones run their own."""
+    controller = OmegaController()
+    calls = []
+
+    async def fake_cycle(experience, start):
+        calls.append(experience["message"])
+        await asyncio.sleep(0.01)
+        return {"message": experience["message"]}
+
+    controller._run_cycle = fake_cycle
+    same = {"message": "hi", "user_id": "u", "group_id": "g", "metadata": {}}
+    other = dict(same, message="bye")
+
+    results = await asyncio.gather(
+        *(controller._process_coalesced(dict(same), 0.0) for _ in range(3)),
+        controller._process_coalesced(other, 0.0),
+    )
+
+    assert sorted(calls) == ["bye", "hi"]
+    assert [r["message"] for r in results] == ["hi", "hi", "hi", "bye"]
+    assert controller._inflight == {}
+
+    await controller._process_coalesced(dict(same), 0.0)
+    assert calls.count("hi") == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_cycle_error_reaches_every_waiter():
+    """A failing shared cycle raises in each waiter and frees its in-flight slot."""
+    controller = OmegaController()
+    calls = []
+
+    async def failing_cycle(experience, start):
+        calls.append(experience["message"])
+        await asyncio.sleep(0.01)
+        raise RuntimeError("kernel down")
+
+    controller._run_cycle = failing_cycle
+    same = {"message": "hi", "user_id": "u", "group_id": "g", "metadata": {}}
+
+    results = await asyncio.gather(
+        *(controller._process_coalesced(dict(same), 0.0) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert calls == ["hi"]
+    assert all(isinstance(r, RuntimeError) and str(r) == "kernel down" for r in results)
+    assert controller._inflight == {}
+
+
+def test_process_timeout_returns_504(monkeypatch):
+    """A cycle exceeding OMEGA_PROCESS_TIMEOUT_S answers 504 with a message."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    async def slow_cycle(experience, start):
+        await asyncio.sleep(1)
+
+    monkeypatch.setattr(omega_controller, "_INFLIGHT_TIMEOUT_S", 0.01)
+    controller = OmegaController()
+    controller._run_cycle = slow_cycle
+    app = FastAPI()
+    controller.register_to_app(app)
+
+    response = TestClient(app).post("/api/v1/omega/process", json={"message": "hi"})
+
+    assert response.status_code == 504
+    assert "timed out" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("metrics_enabled", [True, False])
+def test_process_stream_emits_ndjson_events(monkeypatch, metrics_enabled):
+    """/process/stream sends one NDJSON line per kernel event, then growth."""
+    import json
+    from types import SimpleNamespace
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from omega_layer.kernel.schemas import VertexName, VertexVote
+
+    vote = VertexVote(vertex_name=VertexName.GARDEN, score=0.5, reasoning="ok")
+    result = SimpleNamespace(
+        votes={"garden": vote}, tensions=[], successful_votes=1,
+        has_synthesis=False, timings={"total": 0.01234}, errors=[],
+    )
+
+    class StreamingKernel:
+        async def process_stream(self, experience, context):
+            yield ("vote", "garden", vote)
+            yield ("synthesis", None)
+            yield ("result", result)
+
+    class FakeMonitor:
+        milestones = []
+
+        def record_cycle(self, result):
+            return SimpleNamespace(growth_signal=0.1)
+
+        def get_development_level(self):
+            return SimpleNamespace(level=0.2, trend="growing")
+
+    app = FastAPI()
+    controller = OmegaController()
+    spawned = []
+    monkeypatch.setattr(omega_controller, "_METRICS_ENABLED", metrics_enabled)
+    monkeypatch.setattr(controller, "_spawn_background", lambda coro: spawned.append(coro.close()))
+    controller._kernel = StreamingKernel()
+    controller._monitor = FakeMonitor()
+    controller._identity = SimpleNamespace(state=None)
+    controller._identity_checked_at = float("inf")
+    controller.register_to_app(app)
+
+    response = TestClient(app).post("/api/v1/omega/process/stream", json={"message": "hi"})
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["event"] for line in lines] == ["vote", "synthesis", "complete"]
+    assert lines[0] == {"event": "vote", "vertex": "garden", "score": 0.5, "reasoning": "ok", "observations": []}
+    assert lines[-1]["timing"] == {"total": 0.012}
+    assert len(spawned) == (1 if metrics_enabled else 0)
+
+
+@pytest.mark.asyncio
+async def test_identity_loads_once_then_revalidates_in_background(monkeypatch):
+    """Identity loads off-loop once; later reads are served from memory."""
+    from infra_layer.adapters.input.api.omega import omega_controller as module
+
+    class FakeTopology:
+        loads = 0
+
+        def __init__(self):
+            self.state = "loaded"
+            self.checks = 0
+
+        def load(self):
+            FakeTopology.loads += 1
+
+        def reload_if_changed(self):
+            self.checks += 1
+            return False
+
+    monkeypatch.setattr(_lazy, "IdentityTopology", FakeTopology, raising=False)
+    controller = OmegaController()
+
+    identities = await asyncio.gather(*(controller._ensure_identity() for _ in range(3)))
+    assert FakeTopology.loads == 1
+    assert all(i is identities[0] for i in identities)
+
+    monkeypatch.setattr(module, "_IDENTITY_REVALIDATE_S", 0.0)
+    assert await controller._ensure_identity() is identities[0]
+    await asyncio.gather(*controller._background_tasks)
+    assert identities[0].checks == 1
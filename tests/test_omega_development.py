@@ -0,0 +1,127 @@
+"""Unit tests for DevelopmentMonitor growth tracking."""
+
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from omega_layer.development.monitor import DevelopmentMonitor, GrowthSnapshot
+from omega_layer.kernel.schemas import PentagramResult, VertexName, VertexVote
+
+
+def make_result(self_ref_depth=0, meta=False, retrievals=0, score=0.5):
+    votes = {
+        "mirror": VertexVote(
+            vertex_name=VertexName.MIRROR, score=score, reasoning="m",
+            attachments={"self_reference_depth": self_ref_depth, "meta_cognitive_moment": meta},
+        ),
+        "ledger": VertexVote(
+            vertex_name=VertexName.LEDGER, score=score, reasoning="l",
+            attachments={"retrieval_count": retrievals},
+        ),
+    }
+    return PentagramResult(experience={"message": "m"}, votes=votes)
+
+
+def test_growth_signal_is_computed_once_on_record():
+    """record_cycle stores the composite growth signal on the snapshot."""
+    monitor = DevelopmentMonitor()
+    snapshot = monitor.record_cycle(make_result(self_ref_depth=5, meta=True, retrievals=5))
+
+    assert snapshot.growth_signal == pytest.approx(0.20 + 0.15 + 0.15)
+    assert snapshot.growth_signal == snapshot.compute_growth_signal()
+    assert not hasattr(snapshot, "__dict__")
+    assert GrowthSnapshot().growth_signal == 0.0
+
+
+def test_development_level_over_wrapped_window():
+    """Aggregates and trend use only the last window_size cycles, in order."""
+    monitor = DevelopmentMonitor(window_size=25)
+    for _ in range(15):
+        monitor.record_cycle(make_result(self_ref_depth=5, meta=True, retrievals=5))
+    for _ in range(20):
+        monitor.record_cycle(make_result(score=0.2))
+
+    level = monitor.get_development_level()
+
+    # Window holds 5 high cycles (0.5 signal) and 20 flat ones
+    assert level.snapshot_count == 25
+    assert level.breakdown["avg_growth_signal"] == pytest.approx(round(5 * 0.5 / 25, 4))
+    assert level.breakdown["avg_self_reference"] == 1.0
+    assert level.breakdown["meta_cognitive_rate"] == 0.2
+    assert level.breakdown["avg_vertex_score"] == round((5 * 0.5 + 20 * 0.2) / 25, 3)
+    assert level.trend == "stable"
+
+    for _ in range(10):
+        monitor.record_cycle(make_result(self_ref_depth=5, meta=True, retrievals=5))
+    assert monitor.get_development_level().trend == "growing"
+    assert type(monitor.get_development_level().level) is float
+
+
+def test_milestones_fire_once_each():
+    """Each milestone is recorded the first time only."""
+    monitor = DevelopmentMonitor()
+    monitor.record_cycle(make_result(self_ref_depth=3))
+    monitor.record_cycle(make_result(self_ref_depth=4, meta=True))
+    monitor.record_cycle(make_result(self_ref_depth=5, meta=True))
+
+    assert [m["type"] for m in monitor.milestones] == ["deep_self_reference", "first_meta_cognitive"]
+    assert [m["cycle"] for m in monitor.milestones] == [1, 2]
+
+
+def test_snapshot_timestamp_is_formatted_lazily():
+    """Snapshots keep epoch nanoseconds; milestones share the snapshot's UTC time."""
+    from datetime import timezone
+
+    monitor = DevelopmentMonitor()
+    snapshot = monitor.record_cycle(make_result(self_ref_depth=3, meta=True))
+
+    assert isinstance(snapshot.timestamp_ns, int)
+    assert snapshot.timestamp.tzinfo is timezone.utc
+    stamps = {m["timestamp"] for m in monitor.milestones}
+    assert stamps == {snapshot.timestamp.isoformat()}
+    assert len(monitor.milestones) == 2
+
+
+def test_snapshot_reads_all_vertex_indicators():
+    """Mirror, Garden and Ledger indicators all land on the snapshot."""
+    result = make_result(self_ref_depth=2, meta=True, retrievals=10, score=0.4)
+    result.votes["mirror"].action_proposals = [{"type": "update_self_model"}, {"type": "other"}]
+    result.votes["garden"] = VertexVote(
+        vertex_name=VertexName.GARDEN, score=0.7, reasoning="g",
+        attachments={"patterns": [{"cross_domain": True}, {"cross_domain": False}, "x"]},
+    )
+
+    snapshot = DevelopmentMonitor().record_cycle(result)
+
+    assert (snapshot.self_reference_depth, snapshot.meta_cognitive_moment) == (2, True)
+    assert snapshot.self_model_updates == 1
+    assert snapshot.novel_connection_count == 1
+    assert snapshot.cross_session_continuity == 1.0
+    assert snapshot.avg_vertex_score == pytest.approx(0.5)
+    assert DevelopmentMonitor().record_cycle(PentagramResult(experience={"message": "m"}, votes={})).avg_vertex_score == 0.0
+
+
+def test_running_sums_track_window_contents():
+    """Running sums stay equal to a full rescan across evictions and laps."""
+    import numpy as np
+
+    monitor = DevelopmentMonitor(window_size=7)
+    for i in range(30):
+        monitor.record_cycle(make_result(self_ref_depth=i % 6, meta=i % 3 == 0, retrievals=i % 5, score=i / 30))
+        count = monitor._count
+        np.testing.assert_allclose(monitor._sums, monitor._window[:, :count].sum(axis=1))
+
+
+def test_development_level_is_cached_until_next_cycle():
+    """Repeated reads share one DevelopmentLevel; recording a cycle invalidates it."""
+    monitor = DevelopmentMonitor()
+    empty = monitor.get_development_level()
+    assert monitor.get_development_level() is empty
+
+    monitor.record_cycle(make_result(self_ref_depth=5, meta=True, retrievals=5))
+    level = monitor.get_development_level()
+    assert level is not empty
+    assert level.snapshot_count == 1
+    assert monitor.get_development_level() is level
@@ -14,10 +14,20 @@ from omega_layer.extractors.causal_pattern_extractor import CausalPatternExtract
 from omega_layer.extractors.self_observation_extractor import SelfObservationExtractor, SelfObservation
 from omega_layer.extractors.amalgamated_memory import AmalgamatedMemorySynthesizer, AmalgamatedMemory
 from omega_layer.extractors.omega_self_model import OmegaSelfModel
-from omega_layer.corpus.self_reference import SelfReferenceDetector
+from omega_layer.extractors.ryan_model import RyanModel
+from omega_layer.extractors._bounded import BoundedUniqueList
+from omega_layer.corpus.self_reference import SelfReferenceDetector, get_self_reference_detector
 from api_specs.memory_types import MemCell
 
 
+@pytest.fixture(autouse=True)
+def clear_prompt_cache():
+    from omega_layer.extractors._prompt_cache import prompt_cache
+    prompt_cache.clear()
+    yield
+    prompt_cache.clear()
+
+
 def make_mock_llm(response) -> AsyncMock:
     mock = AsyncMock()
     mock.generate = AsyncMock(return_value=json.dumps(response))
@@ -61,6 +71,82 @@ async def test_insight_extractor_empty():
     assert result is None or result == []
 
 
+@pytest.mark.asyncio
+async def test_extract_batch_bounds_concurrency_and_keeps_order():
+    """Batch extraction overlaps LLM calls up to the cap and keeps input order."""
+    import asyncio
+    from memory_layer.memory_extractor.base_memory_extractor import MemoryExtractRequest
+
+    active = peak = 0
+
+    async def generate(prompt, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return json.dumps([{"insight": prompt.count("cell"), "depth_level": 1}])
+
+    llm = AsyncMock()
+    llm.generate = generate
+    ext = InsightExtractor(llm_provider=llm)
+    requests = []
+    for i in range(5):
+        memcell = make_sample_memcell()
+        memcell.original_data = [{"speaker_name": "Ryan", "content": "cell " * (i + 1)}]
+        requests.append(MemoryExtractRequest(memcell=memcell))
+
+    results = await ext.extract_batch(requests, max_concurrency=2)
+
+    assert peak == 2
+    baseline = results[0][0].insight - 1
+    assert [r[0].insight - baseline for r in results] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_repeated_prompt_is_served_from_prompt_cache():
+    """Re-extracting the same MemCell reuses the parsed reply; expiry refetches."""
+    from memory_layer.memory_extractor.base_memory_extractor import MemoryExtractRequest
+    from omega_layer.extractors._prompt_cache import prompt_cache
+
+    llm = make_mock_llm([{"insight": "cached", "depth_level": 2}])
+    request = MemoryExtractRequest(memcell=make_sample_memcell())
+
+    first = await InsightExtractor(llm_provider=llm).extract_memory(request)
+    second = await InsightExtractor(llm_provider=llm).extract_memory(request)
+    assert [i.insight for i in second] == [i.insight for i in first] == ["cached"]
+    assert llm.generate.await_count == 1
+
+    llm.generate.return_value = "not json"
+    await CausalPatternExtractor(llm_provider=llm).extract_memory(request)
+    assert len(prompt_cache) == 1
+
+    prompt_cache.ttl_s, saved_ttl = -1.0, prompt_cache.ttl_s
+    try:
+        await InsightExtractor(llm_provider=llm).extract_memory(request)
+    finally:
+        prompt_cache.ttl_s = saved_ttl
+    assert llm.generate.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_extract_batch_logs_and_drops_failures():
+    """A request that raises yields None without failing the rest of the batch."""
+    from memory_layer.memory_extractor.base_memory_extractor import MemoryExtractRequest
+
+    ext = SelfObservationExtractor(llm_provider=make_mock_llm([]))
+
+    async def flaky(request):
+        if request.user_id == "bad":
+            raise RuntimeError("provider exploded")
+        return [request.user_id]
+
+    ext.extract_memory = flaky
+    requests = [MemoryExtractRequest(memcell=make_sample_memcell(), user_id=u) for u in ("a", "bad", "c")]
+
+    assert await ext.extract_batch(requests) == [["a"], None, ["c"]]
+
+
 # ===== CausalPatternExtractor =====
 
 @pytest.mark.asyncio
@@ -119,6 +205,66 @@ async def test_amalgamation_empty_existing():
     assert result == []
 
 
+@pytest.mark.asyncio
+async def test_amalgamation_prompt_drops_bulky_fields():
+    """Only the leading memories reach the prompt, without vectors or raw data."""
+    llm = make_mock_llm([])
+    synth = AmalgamatedMemorySynthesizer(llm_provider=llm)
+    new = [{"text": f"new {i}", "vector": [0.1] * 8} for i in range(7)]
+    existing = [{"text": "café", "original_data": [{"content": "raw"}], 1: "x"}]
+
+    await synth.synthesize(new_memories=new, existing_memories=existing)
+
+    prompt = llm.generate.call_args.args[0]
+    assert "new 4" in prompt and "new 5" not in prompt
+    assert "café" in prompt
+    assert "vector" not in prompt and "original_data" not in prompt
+
+
+def test_parse_llm_json_handles_fences_and_fallback():
+    """Fenced, bare-fenced and plain replies parse; NaN falls back to stdlib json."""
+    from omega_layer.extractors._json_utils import parse_llm_json
+
+    assert parse_llm_json('```json\n[{"a": 1}]\n``` trailing') == [{"a": 1}]
+    assert parse_llm_json('Here:\n```\n{"b": 2}\n```') == {"b": 2}
+    assert parse_llm_json('  [1, 2]  ') == [1, 2]
+    assert parse_llm_json('```\n[1]\n``` or ```json\n[2]\n```') == [2]
+    assert parse_llm_json('[NaN]')[0] != parse_llm_json('[NaN]')[0]
+    with pytest.raises(ValueError):
+        parse_llm_json("not json")
+
+
+def test_format_conversation_renders_speaker_lines():
+    """Timestamped messages get a prefix; missing speakers fall back to sender."""
+    from omega_layer.extractors._conversation import format_conversation
+
+    text = format_conversation([
+        {"speaker_name": "Ryan", "content": "hi", "timestamp": "t1"},
+        {"sender": "omega", "content": "hello"},
+        {},
+    ])
+    assert text == "[t1] Ryan: hi\nomega: hello\nUnknown: "
+    assert format_conversation([]) == ""
+
+
+def test_prompt_template_render_matches_str_format():
+    """Pre-parsed templates render exactly like str.format, escapes included."""
+    from string import Formatter
+    from omega_layer.prompts._template import PromptTemplate
+    from omega_layer.prompts.en.amalgamation_prompts import AMALGAMATION_PROMPT
+    from omega_layer.prompts.en.causal_pattern_prompts import CAUSAL_PATTERN_EXTRACTION_PROMPT
+    from omega_layer.prompts.en.insight_prompts import INSIGHT_EXTRACTION_PROMPT
+    from omega_layer.prompts.en.self_observation_prompts import SELF_OBSERVATION_EXTRACTION_PROMPT
+
+    for template in (AMALGAMATION_PROMPT, CAUSAL_PATTERN_EXTRACTION_PROMPT,
+                     INSIGHT_EXTRACTION_PROMPT, SELF_OBSERVATION_EXTRACTION_PROMPT):
+        values = {name: f"<{name} {{x}}>" for _, name, _, _ in Formatter().parse(template) if name}
+        assert PromptTemplate(template).render(**values) == template.format(**values)
+
+    with pytest.raises(ValueError):
+        PromptTemplate("{value:>10}")
+
+
 # ===== OmegaSelfModel =====
 
 def test_self_model_integration():
@@ -136,6 +282,92 @@ def test_self_model_integration():
     assert model.version == 2  # Incremented from 1
 
 
+def test_self_model_lists_are_bounded_and_deduplicated():
+    """Observation lists keep the latest 10 unique entries; evicted ones may return."""
+    model = OmegaSelfModel(interests=["seed"])
+    model.integrate_observations(
+        [{"aspect": "preference", "observation": f"topic {i}"} for i in range(12)]
+        + [{"aspect": "preference", "observation": "topic 11"}]
+    )
+    assert list(model.interests) == [f"topic {i}" for i in range(2, 12)]
+    assert model.to_dict()["interests"] == list(model.interests)
+
+    model.integrate_observations([{"aspect": "preference", "observation": "topic 0"}])
+    assert model.interests[-1] == "topic 0"
+    assert "topic 2" not in model.interests
+    assert model.to_summary().startswith("Interests: topic 3, topic 4, topic 5")
+
+
+def test_self_model_knowledge_domains_match_once_per_observation():
+    """Each domain moves at most one step per observation, overlapping hits included."""
+    model = OmegaSelfModel()
+    model.integrate_observations([
+        {"aspect": "knowledge_depth", "observation": "Codesign and more CODE review", "growth_indicator": 0.5},
+    ])
+    assert model.knowledge_depth == {"code": 3, "design": 3}
+
+
+def test_bounded_unique_list_tracks_evictions():
+    """Repeats are ignored, and evicted entries leave the membership index."""
+    items = BoundedUniqueList(["a", "b", "a"], maxlen=2)
+    assert list(items) == ["a", "b"]
+    assert items.remember("b") is False
+    assert items.remember("c") is True
+    assert list(items) == ["b", "c"] and "a" not in items
+    assert items.remember("a") is True
+    assert list(items) == ["c", "a"]
+
+
+# ===== RyanModel =====
+
+def test_ryan_model_dedupes_and_trims_lists():
+    """Observation lists keep the latest 15 unique entries; evicted ones may return."""
+    model = RyanModel(interests=["seed"])
+    count = model.integrate_observations(
+        [{"aspect": "topic", "observation": f"topic {i}"} for i in range(15)]
+        + [{"aspect": "interest", "observation": "topic 14"}, {"aspect": "energy", "observation": ""}]
+    )
+    assert count == 16
+    assert list(model.interests) == [f"topic {i}" for i in range(15)]
+    assert model.to_dict()["interests"] == list(model.interests)
+
+    model.integrate_observations([{"aspect": "interest", "observation": "seed"}])
+    assert model.interests[-1] == "seed"
+    assert "topic 0" not in model.interests
+    assert model.to_summary() == "Interests: topic 1, topic 2, topic 3"
+
+
+def test_ryan_model_routes_aspect_aliases():
+    """Each aspect and its alias land in the same list; unknown aspects still count."""
+    model = RyanModel()
+    count = model.integrate_observations([
+        {"aspect": "communication", "observation": "concise"},
+        {"aspect": "communication_preference", "observation": "honest"},
+        {"aspect": "working", "observation": "fast"},
+        {"aspect": "energy_pattern", "observation": "mornings"},
+        {"aspect": "interaction", "observation": "meta-steps"},
+        {"aspect": "mood", "observation": "curious"},
+    ])
+    assert count == 6
+    assert list(model.communication_preferences) == ["concise", "honest"]
+    assert list(model.working_style) == ["fast"]
+    assert list(model.energy_patterns) == ["mornings"]
+    assert list(model.interaction_patterns) == ["meta-steps"]
+
+
+def test_ryan_model_formats_last_updated_lazily():
+    """The update time is stored as epoch seconds and exposed as aware UTC."""
+    from datetime import timezone
+
+    model = RyanModel()
+    assert model.last_updated is None and model.to_dict()["last_updated"] is None
+
+    model.integrate_observations([{"aspect": "topic", "observation": "emergence"}])
+    assert isinstance(model.last_updated_ts, float)
+    assert model.last_updated.tzinfo is timezone.utc
+    assert model.to_dict()["last_updated"] == model.last_updated.isoformat()
+
+
 # ===== SelfReferenceDetector =====
 
 def test_self_reference_detects_omega_concepts():
@@ -152,3 +384,83 @@ def test_self_reference_ignores_mundane():
     det = SelfReferenceDetector()
     events = det.detect("I had pizza for dinner and watched a movie")
     assert len(events) == 0
+
+
+def test_self_reference_matches_overlapping_and_nested_concepts():
+    """Overlapping and prefix concepts are all reported, in list order."""
+    det = SelfReferenceDetector(["memory", "memory system", "persistent memory", "self-aware"])
+    events = det.detect("A Persistent Memory System that is self-awareness-free")
+    assert events[0].matched_concepts == ["memory", "memory system", "persistent memory"]
+
+
+def test_aho_corasick_scanner_matches_regex_scanner():
+    """The optional Aho-Corasick scanner agrees with the regex scanner."""
+    pytest.importorskip("ahocorasick")
+    from omega_layer.corpus import self_reference
+
+    concepts = ["memory", "memory system", "persistent memory", "self-aware", "omega"]
+    texts = [
+        "A Persistent Memory System that is self-awareness-free",
+        "omega_scar and Omega's self-aware memory",
+        "nothing relevant here",
+        "İİİİ then the omega observer",
+    ]
+    regex_scanner = self_reference._RegexConceptScanner(concepts)
+    ac_scanner = self_reference._AhoCorasickConceptScanner(concepts)
+    for text in texts:
+        assert ac_scanner.scan(text) == regex_scanner.scan(text)
+
+
+def test_self_reference_snippet_centres_on_first_whole_word_hit():
+    """The snippet is cut around the scanner's recorded offset of the deep concept."""
+    det = SelfReferenceDetector()
+    content = "x" * 300 + " omegas are not omega " + "y" * 300
+    event = det.detect(content)[0]
+    idx = content.index(" omega ") + 1
+    assert event.content_snippet == content[idx - 50:idx + len("omega") + 100]
+
+
+def test_default_self_reference_detector_is_shared():
+    """The default detector is built once and reused."""
+    det = get_self_reference_detector()
+    assert get_self_reference_detector() is det
+    assert det.detect("the pentagram and the observer")[0].event_type == "deep_self_reference"
+
+
+# ===== CrossReferenceMiner =====
+
+@pytest.mark.asyncio
+async def test_cross_reference_mine_batch_fuses_seeds():
+    """Seeds share one fused synthesis prompt; each gets its own insights."""
+    from types import SimpleNamespace
+    from omega_layer.corpus.cross_reference import CrossReferenceMiner
+
+    memory_manager = AsyncMock()
+    memory_manager.retrieve_mem = AsyncMock(side_effect=lambda req: SimpleNamespace(
+        memories=[{"g": [SimpleNamespace(episode=f"memory about {req.query}")]}]
+    ))
+    llm = make_mock_llm({"1": [{"synthesis": "alpha link", "confidence": 0.8}], "2": []})
+    miner = CrossReferenceMiner(memory_manager=memory_manager, llm_provider=llm)
+
+    results = await miner.mine_batch(["alpha", "beta"])
+
+    assert memory_manager.retrieve_mem.await_count == 2
+    assert llm.generate.await_count == 1
+    assert "Seed 2: beta" in llm.generate.call_args.args[0]
+    assert [i.synthesis for i in results["alpha"]] == ["alpha link"]
+    assert results["alpha"][0].source_references == ["memory about alpha"]
+    assert results["beta"] == []
+
+
+def test_flatten_memories_prefers_episode_then_summary():
+    """Grouped retrieval results flatten to truncated episode/summary texts."""
+    from types import SimpleNamespace
+    from omega_layer.corpus.cross_reference import _flatten_memories
+
+    groups = [
+        {"g1": [SimpleNamespace(episode="e" * 400), SimpleNamespace(episode=None, summary="s")]},
+        {"g2": SimpleNamespace(summary="single")},
+        "not a group",
+    ]
+
+    assert _flatten_memories(groups) == ["e" * 300, "s", "single"]
@@ -2,6 +2,7 @@
 
 import sys
 import os
+import json
 import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -116,3 +117,106 @@ def test_repair_protocol_thresholds(topology):
     assert repair.value_misalignment_threshold == 0.15
     assert repair.relationship_integrity_threshold == 0.9
     assert repair.alert_ryan_after_failures == 3
+
+
+def test_reload_if_changed_only_on_new_mtime(tmp_path):
+    """The scar file is re-read only when its mtime moves."""
+    from omega_layer.identity.topology import DEFAULT_SCAR_PATH
+
+    scar = tmp_path / "omega_scar.json"
+    scar.write_text(DEFAULT_SCAR_PATH.read_text())
+    topo = IdentityTopology(str(scar))
+    topo.load()
+    first = topo.state
+
+    assert topo.reload_if_changed() is False
+    assert topo.state is first
+
+    stat = scar.stat()
+    os.utime(scar, (stat.st_atime, stat.st_mtime + 10))
+    assert topo.reload_if_changed() is True
+    assert topo.state is not first
+
+
+def test_drift_detector_running_sums_follow_window(topology):
+    """Aggregates cover only the last window_size cycles, evictions included."""
+    from omega_layer.identity.drift_detector import StandaloneDriftDetector
+    from omega_layer.kernel.schemas import PentagramResult, Tension, VertexName, VertexVote
+
+    def cycle(alignment, tension, orchestra):
+        votes = {
+            "mirror": VertexVote(
+                vertex_name=VertexName.MIRROR, score=0.5, reasoning="m",
+                attachments={"identity_alignment": {"invariant_alignment": alignment}},
+            ),
+            "orchestra": VertexVote(vertex_name=VertexName.ORCHESTRA, score=orchestra, reasoning="o"),
+        }
+        tensions = [Tension(vertex_a=VertexName.MIRROR, vertex_b=VertexName.GARDEN,
+                            dimension="d", magnitude=tension)] * 2
+        return PentagramResult(experience={"message": "m"}, votes=votes, tensions=tensions)
+
+    detector = StandaloneDriftDetector(topology, window_size=3)
+    assert detector._aggregate_signals() == {
+        "invariant_alignment": 1.0, "coherence": 1.0,
+        "value_misalignment": 0.0, "relationship_integrity": 1.0,
+    }
+
+    for i in range(5):
+        detector.record_cycle(cycle(alignment=i / 10, tension=i / 10, orchestra=i / 5))
+
+    signals = detector._aggregate_signals()
+    assert detector.cycle_count == 3
+    assert signals["invariant_alignment"] == pytest.approx(0.3)
+    assert signals["coherence"] == pytest.approx(0.7)
+    assert signals["value_misalignment"] == 0.0
+    assert signals["relationship_integrity"] == pytest.approx(0.6)
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+
+def test_reload_skipped_while_changes_unpersisted(tmp_path):
+    """A scar-file reload never discards versions applied in memory."""
+    from omega_layer.identity.topology import DEFAULT_SCAR_PATH
+
+    scar = tmp_path / "omega_scar.json"
+    scar.write_text(DEFAULT_SCAR_PATH.read_text())
+    topo = IdentityTopology(str(scar))
+    topo.load()
+    region = next(iter(topo.state.flexible_regions))
+    topo.apply_change(ProposedChange(
+        region=region, field="f", new_value="v", evidence="e", proposing_vertex="garden",
+    ))
+    version = topo.state.version
+
+    _bump_mtime(scar)
+    assert topo.reload_if_changed() is False
+    assert topo.state.version == version
+    assert len(topo.state.update_history) == 1
+
+
+def test_reload_revalidates_pending_proposals(tmp_path):
+    """Proposals for regions removed from the scar file are dropped on reload."""
+    from omega_layer.identity.topology import DEFAULT_SCAR_PATH
+
+    scar = tmp_path / "omega_scar.json"
+    data = json.loads(DEFAULT_SCAR_PATH.read_text())
+    scar.write_text(json.dumps(data))
+    topo = IdentityTopology(str(scar))
+    topo.load()
+    kept, removed = list(topo.state.flexible_regions)[:2]
+    for region in (kept, removed):
+        topo.propose_change(ProposedChange(
+            region=region, field="f", new_value="v", evidence="e", proposing_vertex="garden",
+        ))
+    assert len(topo.pending_proposals) == 2
+
+    oi = data.get("omega_identity", data)
+    oi["topology"]["flexible_regions"][removed]["mutable"] = False
+    scar.write_text(json.dumps(data))
+    _bump_mtime(scar)
+
+    assert topo.reload_if_changed() is True
+    assert [p.region for p in topo.pending_proposals] == [kept]
@@ -124,3 +124,52 @@ async def test_kernel_identifies_tensions():
 
     result = await kernel.process({"message": "test"})
     assert len(result.tensions) >= 1
+
+
+@pytest.mark.asyncio
+async def test_kernel_process_stream_yields_votes_as_they_land():
+    """Faster vertices are streamed first; the result keeps canonical vote order."""
+    import asyncio
+
+    class SlowVertex(MockVertex):
+        async def vote(self, experience, context=None):
+            await asyncio.sleep(0.02)
+            return await super().vote(experience, context)
+
+    kernel = MetabolicKernel()
+    kernel.register_vertex(SlowVertex(VertexName.LEDGER, 1.0))
+    kernel.register_vertex(MockVertex(VertexName.GARDEN, 0.2))
+    kernel.register_vertex(MockVertex(VertexName.ORCHESTRA, 0.5))
+
+    events = [event async for event in kernel.process_stream({"message": "test"})]
+    kinds = [event[0] for event in events]
+
+    assert [e[1] for e in events if e[0] == "vote"] == ["garden", "ledger", "orchestra"]
+    assert kinds.index("tension") > kinds.index("vote")
+    assert kinds[-2:] == ["synthesis", "result"]
+    assert list(events[-1][1].votes) == ["ledger", "garden", "orchestra"]
+
+
+def test_vote_preview_and_tension_label_are_derived_not_serialized():
+    """Derived display strings are cached on the model and stay out of dumps."""
+    vote = VertexVote(vertex_name=VertexName.MIRROR, score=0.4, reasoning="r" * 300)
+    tension = Tension(
+        vertex_a=VertexName.LEDGER, vertex_b=VertexName.GARDEN,
+        dimension="storage_vs_pruning", magnitude=0.5,
+    )
+
+    assert vote.reasoning_preview == "r" * 200
+    assert vote.reasoning_preview is vote.reasoning_preview
+    assert "reasoning_preview" not in vote.model_dump()
+    assert tension.label == "ledger vs garden"
+    assert "label" not in tension.model_dump()
+
+
+def test_result_votes_api_is_built_once():
+    """PentagramResult caches the API form of its votes."""
+    vote = VertexVote(vertex_name=VertexName.GARDEN, score=0.5, reasoning="ok", observations=["o"])
+    result = PentagramResult(experience={}, votes={"garden": vote})
+
+    assert result.votes_api == {"garden": {"score": 0.5, "reasoning": "ok", "observations": ["o"]}}
+    assert result.votes_api is result.votes_api
+    assert "votes_api" not in result.model_dump()
@@ -0,0 +1,36 @@
+"""Unit tests for omega_layer.development.metrics helpers."""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from prometheus_client import REGISTRY
+
+from omega_layer.development import metrics
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_record_pentagram_cycle_uses_status_children():
+    """Cycles are counted and timed under the derived status label."""
+    before = sample("omega_pentagram_cycles_total", status="partial")
+    count_before = sample("omega_pentagram_cycle_duration_seconds_count", status="partial")
+
+    metrics.record_pentagram_cycle(duration_seconds=1.2, vertex_count=2, has_synthesis=True)
+
+    assert sample("omega_pentagram_cycles_total", status="partial") == before + 1
+    assert sample("omega_pentagram_cycle_duration_seconds_count", status="partial") == count_before + 1
+
+
+def test_record_vertex_vote_known_and_unknown_vertices():
+    """Known vertices use cached children; unknown names still get recorded."""
+    before = sample("omega_vertex_votes_total", vertex="garden", status="error")
+    metrics.record_vertex_vote("garden", 0.0, success=False)
+    assert sample("omega_vertex_votes_total", vertex="garden", status="error") == before + 1
+
+    metrics.record_vertex_vote("scratch", 0.5)
+    assert sample("omega_vertex_votes_total", vertex="scratch", status="success") >= 1
+    assert sample("omega_vertex_score_count", vertex="scratch") >= 1
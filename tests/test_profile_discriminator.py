@@ -0,0 +1,115 @@
+"""Unit tests for ValueDiscriminator with mocked LLM."""
+
+import sys
+import os
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from memory_layer.profile_manager.discriminator import (
+    DiscriminatorConfig,
+    ValueDiscriminator,
+)
+
+
+def make_mock_llm(response) -> AsyncMock:
+    mock = AsyncMock()
+    mock.generate = AsyncMock(return_value=json.dumps(response))
+    return mock
+
+
+def make_memcell(episode: str):
+    return SimpleNamespace(episode=episode)
+
+
+@pytest.mark.asyncio
+async def test_is_high_value_applies_threshold():
+    """Judgments below min_confidence are rejected."""
+    llm = make_mock_llm({"is_high_value": True, "confidence": 0.4, "reasons": "weak"})
+    disc = ValueDiscriminator(llm, DiscriminatorConfig(min_confidence=0.6))
+    is_high, conf, reason = await disc.is_high_value(make_memcell("I lead the infra team"))
+    assert is_high is False
+    assert conf == 0.4
+    assert reason == "weak"
+
+
+@pytest.mark.asyncio
+async def test_is_high_value_batch_uses_rolling_context():
+    """Batch judging returns one result per memcell with a rolling context window."""
+    llm = make_mock_llm({"is_high_value": True, "confidence": 0.9, "reasons": "explicit"})
+    disc = ValueDiscriminator(llm, DiscriminatorConfig(context_window=2))
+    memcells = [make_memcell(f"episode {i}") for i in range(4)]
+
+    results = await disc.is_high_value_batch(memcells, max_concurrency=2)
+
+    assert results == [(True, 0.9, "explicit")] * 4
+    prompts = [call.args[0] for call in llm.generate.call_args_list]
+    assert len(prompts) == 4
+    last_prompt = next(p for p in prompts if "Evaluate:\nepisode 3" in p)
+    assert "episode 1" in last_prompt and "episode 2" in last_prompt
+    assert "episode 0" not in last_prompt
+
+
+def test_parse_response_fallbacks():
+    """Plain, fenced and embedded JSON responses all parse; garbage does not."""
+    disc = ValueDiscriminator(make_mock_llm({}))
+    plain = '{"is_high_value": true, "confidence": 0.8, "reasons": "r"}'
+    assert disc._parse_response(plain) == (True, 0.8, "r")
+    assert disc._parse_response(f"```json\n{plain}\n```") == (True, 0.8, "r")
+    assert disc._parse_response(f"Sure: {plain} done") == (True, 0.8, "r")
+    assert disc._parse_response("no json here")[2] == "Failed to parse response"
+
+
+@pytest.mark.asyncio
+async def test_json_mode_requests_json_object():
+    """JSON mode asks for a JSON object but still accepts fenced replies."""
+    llm = make_mock_llm({"is_high_value": True, "confidence": 0.9, "reasons": "ok"})
+    disc = ValueDiscriminator(llm, DiscriminatorConfig(json_mode=True))
+    await disc.is_high_value(make_memcell("I own the billing service"))
+    assert llm.generate.call_args.kwargs["response_format"] == {"type": "json_object"}
+
+    fenced = '```json\n{"is_high_value": true, "confidence": 0.9}\n```'
+    llm.generate = AsyncMock(return_value=fenced)
+    assert await disc.is_high_value(make_memcell("I run the on-call rota")) == (True, 0.9, "")
+
+
+def test_extract_text_from_dict_memcell():
+    """Dict memcells loaded from JSON are read directly."""
+    disc = ValueDiscriminator(make_mock_llm({}))
+    assert disc._extract_text({"episode": "  ep  "}) == "ep"
+    assert disc._extract_text({"summary": "sum"}) == "sum"
+    raw = {"original_data": [{"content": "hi"}, {"summary": "there"}, "skip"]}
+    assert disc._extract_text(raw) == "hi\nthere"
+    assert disc._extract_text({}) == "Empty memcell"
+
+
+@pytest.mark.asyncio
+async def test_repeated_prompts_hit_cache():
+    """Identical prompts are judged by the LLM only once."""
+    llm = make_mock_llm({"is_high_value": True, "confidence": 0.9, "reasons": "ok"})
+    disc = ValueDiscriminator(llm, DiscriminatorConfig(use_context=False))
+    memcells = [make_memcell("same text")] * 3
+
+    results = await disc.is_high_value_batch(memcells)
+    assert results == [(True, 0.9, "ok")] * 3
+    await disc.is_high_value(make_memcell("same text"))
+    assert llm.generate.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_parse_failures_are_not_cached():
+    """Unparseable replies are retried instead of being served from the cache."""
+    good = json.dumps({"is_high_value": True, "confidence": 0.9, "reasons": "ok"})
+    llm = AsyncMock()
+    llm.generate = AsyncMock(side_effect=["not json", "", good, "not json"])
+    disc = ValueDiscriminator(llm, DiscriminatorConfig(use_context=False))
+    memcell = make_memcell("same text")
+
+    assert (await disc.is_high_value(memcell))[2] == "Failed to parse response"
+    assert (await disc.is_high_value(memcell))[2] == "Empty response"
+    assert await disc.is_high_value(memcell) == (True, 0.9, "ok")
+    assert await disc.is_high_value(memcell) == (True, 0.9, "ok")
+    assert llm.generate.await_count == 3
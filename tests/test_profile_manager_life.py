@@ -0,0 +1,45 @@
+"""Unit tests for ProfileManager Life profile extraction with a fake extractor."""
+
+import sys
+import os
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from memory_layer.memory_extractor.profile_memory_life import ProfileMemoryLife
+from memory_layer.memory_extractor.profile_memory_life.types import ExplicitInfo
+from memory_layer.profile_manager.config import ProfileManagerConfig, ScenarioType
+from memory_layer.profile_manager.manager import ProfileManager
+
+
+@pytest.mark.asyncio
+async def test_extract_profiles_life_leaves_caller_profiles_untouched():
+    """The extractor merges into a copy, never the caller's ProfileMemoryLife."""
+    owned = ProfileMemoryLife.from_dict(
+        {
+            "explicit_info": [{"category": "diet", "description": "vegetarian", "sources": ["e1"]}],
+            "processed_episode_ids": ["e1"],
+        },
+        user_id="u1",
+    )
+
+    async def merge_in_place(request):
+        profile = request.old_profile
+        profile.explicit_info.append(ExplicitInfo(category="sport", description="runs"))
+        profile.explicit_info[0].sources.append("e2")
+        profile.processed_episode_ids.append("e2")
+        return profile
+
+    manager = ProfileManager(AsyncMock(), ProfileManagerConfig(scenario=ScenarioType.ASSISTANT))
+    manager._profile_extractor_life.extract_memory = merge_in_place
+
+    memcell = SimpleNamespace(event_id="e2", episode="went running", timestamp=None)
+    results = await manager.extract_profiles_life([memcell], [owned], ["u1"])
+
+    assert len(results) == 1 and results[0] is not owned
+    assert results[0].total_items() == 2
+    assert [info.description for info in owned.explicit_info] == ["vegetarian"]
+    assert owned.explicit_info[0].sources == ["e1"]
+    assert owned.processed_episode_ids == ["e1"]
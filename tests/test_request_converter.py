@@ -1,9 +1,16 @@
 """Tests for request conversion utilities."""
 
+from datetime import datetime, timezone
+
+import pytest
+
 from api_specs.memory_models import MemoryType
 from api_specs.request_converter import (
+    _parse_iso_utc,
     convert_dict_to_fetch_mem_request,
     convert_dict_to_retrieve_mem_request,
+    generate_single_user_group_id,
+    normalize_refer_list,
 )
 
 
@@ -29,3 +36,32 @@ def test_convert_retrieve_mem_request_strips_include_metadata_string():
     )
 
     assert request.include_metadata is True
+
+
+def test_generate_single_user_group_id_is_stable():
+    group_id = generate_single_user_group_id("user_1")
+
+    assert group_id == "3f49044c1469c699_group"
+    assert generate_single_user_group_id("user_1") is group_id
+
+
+def test_convert_retrieve_mem_request_rejects_unknown_retrieve_method():
+    with pytest.raises(ValueError, match="Invalid retrieve_method: fuzzy"):
+        convert_dict_to_retrieve_mem_request(
+            {"user_id": "user_1", "retrieve_method": " fuzzy "}
+        )
+
+
+def test_parse_iso_utc_memoizes_valid_strings_only():
+    first = _parse_iso_utc("2025-01-07T09:15:33Z")
+
+    assert first == datetime(2025, 1, 7, 9, 15, 33, tzinfo=timezone.utc)
+    assert _parse_iso_utc("2025-01-07T09:15:33Z") is first
+    assert _parse_iso_utc("not a time") is not _parse_iso_utc("not a time")
+
+
+def test_normalize_refer_list_accepts_ids_and_references():
+    refer_list = ["m1", {"message_id": 2}, {"message_id": ""}, {"other": "x"}, 3]
+
+    assert normalize_refer_list(refer_list) == ["m1", "2"]
+    assert normalize_refer_list([]) == []